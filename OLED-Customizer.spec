@@ -57,6 +57,7 @@ a = Analysis(
         'winrt',
         'winrt.windows.media.control',
         'winrt.windows.foundation',
+        'winrt.windows.storage.streams',
         'HardwareMonitor',
         'HardwareMonitor.Hardware',
         'clr',
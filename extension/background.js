@@ -0,0 +1,191 @@
+/**
+ * OLED Customizer - Background service worker
+ * Owns the single WebSocket to the app for every tab. Content scripts send
+ * their media state here on media events; the worker forwards small deltas
+ * per tab, keyed by the browser's own tab id (sender.tab.id), which is
+ * unique per tab even after "Duplicate tab" and stable across reloads and
+ * SPA navigation inside the tab. The app only accepts push connections from
+ * an extension origin, which is why the socket lives here and not in the
+ * pages.
+ *
+ * The socket is open only while some tab has media: it is opened by the
+ * first media report and closed (no reconnect) when the last tab is gone,
+ * so a browser without media tabs holds no connection and does not retry
+ * against an app that is not running.
+ *
+ * Every message is acknowledged by the app. If an ack does not arrive in
+ * ACK_TIMEOUT_MS the connection is treated as dead: it is closed, and after
+ * reconnecting the full state of every tab is sent again (resend).
+ * If the socket cannot be opened we fall back to POSTing the full state on
+ * each media event (no interval; the app expires POSTed data after 5 s).
+ */
+
+const APP_HOST = '127.0.0.1:8888';
+const RECONNECT_MAX_MS = 30000;
+const ACK_TIMEOUT_MS = 3000;
+// Keeps the service worker (and with it the socket) alive while a tab is
+// playing without media events; Chrome stops idle workers after 30 s.
+const KEEPALIVE_MS = 20000;
+
+let socket = null;
+let socketReady = false;
+let reconnectDelay = 1000;
+let reconnectTimer = null;
+let keepaliveTimer = null;
+let seq = 0;
+
+const tabStates = new Map();   // tab -> latest state from the content script
+const sentStates = new Map();  // tab -> state the app has (deltas are built against it)
+const pendingAcks = new Map(); // seq -> tab
+
+function diffState(data, previous) {
+    if (!previous) return data;
+    const delta = {};
+    for (const key of Object.keys(data)) {
+        if (data[key] !== previous[key]) delta[key] = data[key];
+    }
+    return delta;
+}
+
+function connect() {
+    reconnectTimer = null;
+    if (socket || tabStates.size === 0) return;
+    try {
+        socket = new WebSocket(`ws://${APP_HOST}/ws`);
+    } catch (e) {
+        socket = null;
+        scheduleReconnect();
+        return;
+    }
+    const ws = socket;
+
+    ws.onopen = () => {
+        socketReady = true;
+        reconnectDelay = 1000;
+        // New connection: the app knows nothing, send every tab's full state
+        sentStates.clear();
+        for (const tab of tabStates.keys()) sendTab(tab);
+        updateKeepalive();
+    };
+
+    ws.onmessage = (event) => {
+        try {
+            const msg = JSON.parse(event.data);
+            if (msg.type === 'ack') pendingAcks.delete(msg.seq);
+        } catch (e) {
+            // ignore
+        }
+    };
+
+    ws.onclose = () => {
+        if (socket !== ws) return;
+        socketReady = false;
+        socket = null;
+        pendingAcks.clear();
+        sentStates.clear();
+        updateKeepalive();
+        scheduleReconnect();
+    };
+
+    ws.onerror = () => {
+        // onclose follows
+    };
+}
+
+function scheduleReconnect() {
+    if (reconnectTimer || tabStates.size === 0) return;
+    reconnectTimer = setTimeout(connect, reconnectDelay);
+    reconnectDelay = Math.min(reconnectDelay * 2, RECONNECT_MAX_MS);
+}
+
+function send(message) {
+    seq += 1;
+    message.seq = seq;
+    socket.send(JSON.stringify(message));
+    pendingAcks.set(seq, message.tab);
+
+    // No ack in time: the app hung or the socket is half-open after sleep.
+    // Reconnecting resends the full state of every tab.
+    const ws = socket;
+    const sent = seq;
+    setTimeout(() => {
+        if (socket === ws && pendingAcks.has(sent)) ws.close();
+    }, ACK_TIMEOUT_MS);
+}
+
+function sendTab(tab) {
+    const data = tabStates.get(tab);
+    const previous = sentStates.get(tab);
+    const delta = diffState(data, previous);
+    if (Object.keys(delta).length === 0) return;
+    send({ type: previous ? 'delta' : 'state', tab, data: delta });
+    sentStates.set(tab, data);
+}
+
+function updateKeepalive() {
+    const playing = [...tabStates.values()].some((data) => data.playing);
+    if (socketReady && playing && !keepaliveTimer) {
+        keepaliveTimer = setInterval(() => send({ type: 'ping' }), KEEPALIVE_MS);
+    } else if ((!socketReady || !playing) && keepaliveTimer) {
+        clearInterval(keepaliveTimer);
+        keepaliveTimer = null;
+    }
+}
+
+async function postState(tab, data) {
+    try {
+        await fetch(`http://${APP_HOST}/extension_data`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ ...data, tab })
+        });
+    } catch (e) {
+        // Silently fail if app isn't running
+    }
+}
+
+function onMedia(tab, data) {
+    tabStates.set(tab, data);
+    if (socketReady) {
+        sendTab(tab);
+    } else {
+        postState(tab, data);
+        connect();
+    }
+    updateKeepalive();
+}
+
+function onGone(tab) {
+    if (!tabStates.delete(tab)) return;
+    if (socketReady && sentStates.has(tab)) send({ type: 'bye', tab });
+    sentStates.delete(tab);
+    updateKeepalive();
+    if (tabStates.size === 0) disconnect();
+}
+
+function disconnect() {
+    clearTimeout(reconnectTimer);
+    reconnectTimer = null;
+    reconnectDelay = 1000;
+    if (!socket) return;
+    const ws = socket;
+    socket = null;          // onclose sees a replaced socket and does not reconnect
+    socketReady = false;
+    pendingAcks.clear();
+    sentStates.clear();
+    updateKeepalive();
+    ws.close();
+}
+
+chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
+    if (!sender.tab) return;
+    const tab = String(sender.tab.id);
+    if (message.type === 'media') {
+        onMedia(tab, message.data);
+    } else if (message.type === 'gone') {
+        onGone(tab);
+    }
+    sendResponse({ connected: socketReady });
+});
+
+chrome.tabs.onRemoved.addListener((tabId) => onGone(String(tabId)));
@@ -1,75 +1,211 @@
 /**
  * OLED Customizer - Content Script
- * Scrapes media info from the page and sends it to the local app.
+ * Reads media info on any site (Media Session API + media element events,
+ * YouTube DOM as a fallback) and pushes it to the local app.
+ *
+ * Nothing is sent until the page actually has media (a <video>/<audio>
+ * element or Media Session metadata). From then on state goes to the
+ * background service worker only on media events (play, pause, seek,
+ * metadata change, end of playback), and "gone" is sent once the last
+ * media element is removed. The worker keeps the WebSocket to the app (see
+ * background.js).
  */
 
-let lastSentData = null;
+// Payload schema version understood by the app (see normalize_payload in
+// ExtensionReceiver.py). v2 adds album, artwork and site.
+const SCHEMA_VERSION = 2;
+
+let activeMedia = null;
+let reported = false;       // the worker has state for this page
+let watchedMedia = null;    // element carrying the detach listeners
+let removalObserver = null;
+let removalCheck = null;    // debounce timer of removalObserver
+
+function pickMediaElement() {
+    // The element that fired the last media event wins; otherwise the first
+    // playing one, otherwise any media element on the page.
+    if (activeMedia && activeMedia.isConnected) return activeMedia;
+    const elements = document.querySelectorAll('video, audio');
+    for (const el of elements) {
+        if (!el.paused) return el;
+    }
+    return elements[0] || null;
+}
+
+function pickArtwork(artwork) {
+    if (!artwork || artwork.length === 0) return "";
+    // Largest image; the app downsamples to a few dozen pixels anyway
+    let best = artwork[0];
+    let bestSize = 0;
+    for (const art of artwork) {
+        const size = parseInt((art.sizes || "").split('x')[0], 10) || 0;
+        if (size > bestSize) {
+            best = art;
+            bestSize = size;
+        }
+    }
+    return best.src || "";
+}
+
+function scrapeYouTube() {
+    // YouTube Title - More robust selectors
+    const titleEl = document.querySelector('h1.ytd-video-primary-info-renderer yc-video-title') ||
+        document.querySelector('ytd-watch-metadata h1') ||
+        document.querySelector('.ytp-title-link');
+    // YouTube Channel (Artist)
+    const channelEl = document.querySelector('ytd-video-owner-renderer #channel-name a') ||
+        document.querySelector('#upload-info #channel-name a') ||
+        document.querySelector('.ytp-ce-channel-title');
+    return {
+        title: titleEl ? titleEl.innerText : document.title.replace(" - YouTube", ""),
+        artist: channelEl ? channelEl.innerText : "YouTube Video"
+    };
+}
 
 function scrapeMediaInfo() {
-    const video = document.querySelector('video');
-    if (!video) return null;
+    const media = pickMediaElement();
+    const session = navigator.mediaSession;
+    const metadata = session ? session.metadata : null;
+    if (!media && !metadata) return null;
 
-    // Site-specific logic (currently YouTube)
     let title = "";
     let artist = "";
+    let album = "";
+    let artwork = "";
+
+    if (metadata) {
+        // Generic mode: every major player (YouTube Music, SoundCloud, Twitch,
+        // Bandcamp...) fills the Media Session API for the OS media overlay.
+        title = metadata.title || "";
+        artist = metadata.artist || "";
+        album = metadata.album || "";
+        artwork = pickArtwork(metadata.artwork);
+    } else if (window.location.host.includes('youtube.com')) {
+        ({ title, artist } = scrapeYouTube());
+    } else {
+        title = document.title;
+    }
 
-    if (window.location.host.includes('youtube.com')) {
-        // YouTube Title - More robust selectors
-        const titleEl = document.querySelector('h1.ytd-video-primary-info-renderer yc-video-title') ||
-            document.querySelector('ytd-watch-metadata h1') ||
-            document.querySelector('.ytp-title-link');
-        title = titleEl ? titleEl.innerText : document.title.replace(" - YouTube", "");
-
-        // YouTube Channel (Artist)
-        const channelEl = document.querySelector('ytd-video-owner-renderer #channel-name a') ||
-            document.querySelector('#upload-info #channel-name a') ||
-            document.querySelector('.ytp-ce-channel-title');
-        artist = channelEl ? channelEl.innerText : "YouTube Video";
+    let playing;
+    if (media) {
+        playing = !media.paused;
+    } else {
+        playing = session.playbackState === 'playing';
     }
 
     return {
+        v: SCHEMA_VERSION,
         title: title || "Unknown Title",
         artist: artist || "Unknown Artist",
-        duration: video.duration || 0,
-        progress: video.currentTime || 0,
-        playing: !video.paused,
-        source: "YouTube (Extension)"
+        album: album,
+        artwork: artwork,
+        site: window.location.hostname,
+        duration: media && isFinite(media.duration) ? media.duration : 0,
+        progress: media ? media.currentTime : null,
+        playing: playing,
+        source: window.location.hostname + " (Extension)"
     };
 }
 
-async function sendData() {
+function sendToBackground(message) {
+    try {
+        chrome.runtime.sendMessage(message, () => {
+            void chrome.runtime.lastError; // worker restarting; next event retries
+        });
+    } catch (e) {
+        // Extension reloaded: this content script is orphaned
+    }
+}
+
+function pushUpdate() {
+    watchMedia(pickMediaElement());
     const data = scrapeMediaInfo();
-    if (!data) return;
-
-    // Only send if significant change (e.g., metadata changed or playing state changed)
-    // Always send progress every few seconds
-    const dataString = JSON.stringify({ ...data, progress: 0 }); // Ignore progress for 'id' comparison
-    const lastDataString = lastSentData ? JSON.stringify({ ...lastSentData, progress: 0 }) : "";
-
-    // Send if metadata changed, OR if 2 seconds passed, OR if playing state changed
-    const playingChanged = lastSentData ? (data.playing !== lastSentData.playing) : true;
-
-    if (dataString !== lastDataString || !lastSentData || playingChanged || (Math.abs(data.progress - lastSentData.progress) >= 2)) {
-        try {
-            await fetch('http://127.0.0.1:8888/extension_data', {
-                method: 'POST',
-                mode: 'no-cors',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(data)
-            });
-            lastSentData = data;
-        } catch (e) {
-            // Silently fail if app isn't running
-        }
+    if (!data) {
+        reportGone();
+        return;
+    }
+    sendToBackground({ type: 'media', data });
+    if (!reported) {
+        reported = true;
+        watchRemoval();
+    }
+}
+
+function reportGone() {
+    if (!reported) return;
+    reported = false;
+    if (removalObserver) {
+        removalObserver.disconnect();
+        removalObserver = null;
     }
+    clearTimeout(removalCheck);
+    removalCheck = null;
+    watchMedia(null);
+    sendToBackground({ type: 'gone' });
+}
+
+// A playing element that is removed from the page pauses, but events of a
+// detached element never reach the document listeners below, so the shown
+// element gets its own listeners for that case.
+function onDetachedEvent(event) {
+    if (!event.target.isConnected) pushUpdate();
+}
+
+function watchMedia(el) {
+    if (el === watchedMedia) return;
+    for (const type of ['pause', 'emptied']) {
+        if (watchedMedia) watchedMedia.removeEventListener(type, onDetachedEvent);
+        if (el) el.addEventListener(type, onDetachedEvent);
+    }
+    watchedMedia = el;
+}
+
+// A paused element fires nothing when removed. While this page is reported,
+// re-check that one element at most twice a second after DOM changes; the
+// observer callback itself does no DOM work.
+function watchRemoval() {
+    removalObserver = new MutationObserver(() => {
+        if (removalCheck || !watchedMedia) return;
+        removalCheck = setTimeout(() => {
+            removalCheck = null;
+            if (watchedMedia && !watchedMedia.isConnected) pushUpdate();
+        }, 500);
+    });
+    removalObserver.observe(document.documentElement, { childList: true, subtree: true });
+}
+
+// Media events only - no interval polling. Media events do not fire on a
+// page without media, so they double as the detection of media added later.
+// (media events do not bubble, so listen in the capture phase on document)
+for (const type of ['play', 'pause', 'ended', 'seeked', 'ratechange', 'loadedmetadata', 'durationchange', 'emptied']) {
+    document.addEventListener(type, (event) => {
+        if (event.target instanceof HTMLMediaElement) activeMedia = event.target;
+        pushUpdate();
+    }, true);
+}
+
+// Track changes: players update mediaSession.metadata and document.title
+// together, and SPAs (YouTube) navigate without a reload. The Media Session
+// API has no change event, so the <title> observer is the metadata trigger.
+window.addEventListener('yt-navigate-finish', () => setTimeout(pushUpdate, 500));
+function observeTitle() {
+    const titleEl = document.querySelector('title');
+    if (!titleEl) return false;
+    new MutationObserver(() => pushUpdate()).observe(titleEl, { childList: true, characterData: true, subtree: true });
+    return true;
+}
+if (!observeTitle()) {
+    const headObserver = new MutationObserver(() => {
+        if (observeTitle()) headObserver.disconnect();
+    });
+    headObserver.observe(document.documentElement, { childList: true, subtree: true });
 }
 
-// Start polling
-setInterval(sendData, 500);
+window.addEventListener('pagehide', reportGone);
+window.addEventListener('pageshow', (event) => {
+    if (event.persisted) pushUpdate(); // restored from the back/forward cache
+});
 
-// Event Listeners for immediate updates
-document.addEventListener('play', sendData, true);
-document.addEventListener('pause', sendData, true);
-document.addEventListener('seeked', sendData, true);
+pushUpdate();
 
-console.log("OLED Customizer Extension Active (Low Latency Mode)");
+console.log("OLED Customizer Extension Active (Media Session, Push Mode)");
@@ -1,3 +1,11 @@
+import sys
+
+# Donanım sensörü collector süreci (exe içinden): log kurulumu ve ağır
+# importlar yapılmadan önce ayrılır
+if len(sys.argv) > 1 and sys.argv[1] == "--sensor-collector":
+    from src.sensor_collector import main as collector_main
+    sys.exit(collector_main(sys.argv[2:]))
+
 import logging
 from psutil import pid_exists
 from os import getpid, path, makedirs, remove
@@ -1,4 +1,4 @@
-from threading import Thread
+from threading import Thread, Event
 from time import sleep, time
 from tkinter import messagebox
 import tkinter as tk
@@ -6,16 +6,26 @@ import logging
 
 from src.SpotifyAPI import SpotifyAPI
 from src.SpotifyPlayer import SpotifyPlayer
+from src.spotify_scheduler import SpotifyPollScheduler
+from src.position_filter import PositionEstimator
 from src.SteelSeriesAPI import SteelSeriesAPI
 from src.Timer import Timer
 from src.volume import VolumeOverlay
+from src.app_volume import AppVolumeOverlay
+from src.hotkeys import HotkeyDispatcher
 from src.image_utils import convert_to_bitmap
 from src.UserPreferences import UserPreferences
 from src.Systray import run_systray_async
 from src.WindowsMedia import WindowsMedia
 from src.HardwareMonitor import HardwareMonitor
+from src.sensor_alerts import parse_rules
 from src.ExtensionReceiver import ExtensionReceiver
-from src.utils import is_process_running, find_steelseries_gg_path, launch_process
+from src.media_fallback import MediaFallback
+from src.media_sources import MediaArbiter, SpotifySource, SmtcSource, ExtensionSource, FileSource
+from src.album_art import AlbumArt
+from src.lyrics import LyricsLibrary
+from src.audio_spectrum import SpectrumAnalyzer, LoopbackSource
+from src.utils import is_process_running, find_steelseries_gg_path, launch_process, fetch_app_data_path
 import asyncio
 
 try:
@@ -31,6 +41,21 @@ class State:
     SHOW_PLAYER = 1
 
 
+# cycle_screen kısayolunun gezdiği ekranlar; "auto" = çalan medyaya göre saat / player
+SCREENS = ["auto", "clock", "player", "hardware", *HardwareMonitor.PAGES]
+
+# Eylem -> tercih anahtarı
+HOTKEY_PREFERENCES = {
+    "show_hw_monitor": "hotkey_monitor",
+    "mute_mic": "hotkey_mute",
+    "cycle_screen": "hotkey_cycle_screen",
+    "toggle_player_style": "hotkey_player_style",
+    "media_play_pause": "hotkey_play_pause",
+    "media_next": "hotkey_next_track",
+    "app_volume": "hotkey_app_volume",
+}
+
+
 class DisplayManager:
     def __init__(self, config, fps):
         self.config = config
@@ -41,6 +66,7 @@ class DisplayManager:
         self.display_clock = True
         self.display_player = True
         self.display_hw_monitor = False
+        self.screen = "auto"
 
         self.user_preferences = UserPreferences()
         self.user_preferences.load_preferences()  # Load saved preferences FIRST
@@ -55,6 +81,18 @@ class DisplayManager:
         run_systray_async(self)
 
         self.player = SpotifyPlayer(config, self.user_preferences, fps)
+        # Kapaklar worker thread'de hazırlanır; hazır olunca player yeniden çizilir
+        self.album_art = AlbumArt(on_ready=self._on_cover_ready)
+        self.player.album_art = self.album_art
+        self.lyrics_library = LyricsLibrary(self.user_preferences.get_preference("lyrics_folder"))
+        self.player.lyrics_library = self.lyrics_library
+        # Ticker spektrumu: hoparlör çıkışı (WASAPI loopback). Thread, Ticker
+        # ekrandayken cihazı açar, görünmezken bırakır.
+        self.spectrum = None
+        if LoopbackSource.available():
+            self.spectrum = SpectrumAnalyzer(LoopbackSource())
+            self.spectrum.start()
+            self.player.spectrum = self.spectrum
         
         # Only initialize Spotify API if enabled in preferences
         self.spotify_enabled = self.user_preferences.get_preference("spotify_enabled")
@@ -65,78 +103,72 @@ class DisplayManager:
         
         self.steelseries_api = SteelSeriesAPI()
 
-        self.volume_overlay = VolumeOverlay(config)
-        self.hardware_monitor = HardwareMonitor(config)
+        # Push kanalından gelen play/pause ve ses değişiklikleri bir sonraki kareyi beklemeden işlensin
+        self._wake = Event()
+
+        self.volume_overlay = VolumeOverlay(config, on_change=self._wake.set)
+        self.app_volume_overlay = AppVolumeOverlay(config, on_change=self._wake.set)
+        # İzole modda okuyucu (LHM/WMI) ana süreçte hiç kurulmasın: modu en baştan ver
+        self.hardware_monitor = HardwareMonitor(
+            config, isolated=bool(self.user_preferences.get_preference("hw_isolated_collector")))
         self.extension_receiver = ExtensionReceiver(port=8888)
         self.extension_receiver.start()
-
-        # Setup keyboard listener for INS key and Global Hotkeys
-        if keyboard:
-            self._listener = None
-            self._hotkey_listener = None
-
+        self.extension_receiver.add_listener(self._wake.set)
+
+        # Global hotkeys: listener sadece kuyruğa atar, eylemler dispatcher thread'inde çalışır
+        self._media_keys = None
+        self.hotkeys = HotkeyDispatcher({
+            "show_hw_monitor": self.hardware_monitor.trigger,
+            "mute_mic": self.volume_overlay.toggle_mic_mute,
+            "cycle_screen": self._cycle_screen,
+            "toggle_player_style": self._cycle_player_style,
+            "media_play_pause": lambda: self._send_media_key("media_play_pause"),
+            "media_next": lambda: self._send_media_key("media_next"),
+            "app_volume": self.app_volume_overlay.show_focus,
+        }, on_dispatch=self._wake.set)
+        self.hotkeys.start()
+
+        self._listener = None
         if keyboard:
-            self._listener = None
-            self.key_monitor_val = None
-            self.key_mute_val = None
-            
-            def on_press(key):
-                try:
-                    if key == self.key_monitor_val:
-                        self.hardware_monitor.trigger()
-                    elif key == self.key_mute_val:
-                         logger.info("Mute key pressed - Toggling Mute")
-                         self.volume_overlay.toggle_mic_mute()
-                except Exception as e:
-                    logger.error(f"Hotkey error: {e}")
-            
-            self._listener = keyboard.Listener(on_press=on_press)
+            self._listener = keyboard.Listener(on_press=self.hotkeys.key_down, on_release=self.hotkeys.key_up)
             self._listener.daemon = True
             self._listener.start()
             logger.info("Keyboard listener started")
         else:
             logger.warning("pynput not available, keyboard features disabled")
 
+        # Media providers -> arbiter; render loop sadece tek bir snapshot okur
+        self.spotify_source = SpotifySource()
+        self.smtc_source = SmtcSource()
+        self.media_arbiter = MediaArbiter([
+            self.spotify_source,
+            ExtensionSource(self.extension_receiver),
+            self.smtc_source,
+            FileSource(MediaFallback()),
+        ])
+        self._applied_media = (None, 0)
+
+        # Spotify: sabit aralık yerine tahmini şarkı sonuna göre planlanır
+        # (SMTC thread'i hint() çağırdığı için ondan önce kurulmalı)
+        self.spotify_scheduler = SpotifyPollScheduler()
+
         # Windows Media (SMTC) - runs in background thread
         self.windows_media = WindowsMedia()
-        self._smtc_data = None
-        self._smtc_lock = __import__('threading').Lock()
         Thread(target=self._poll_smtc_loop, daemon=True).start()
 
-        now_ms = int(time() * 1000)
-
-        # polling timers
-        self._last_spotify_poll_ms = now_ms
-        self._last_yt_poll_ms = now_ms
-
-        self._yt_poll_ms = 200
-
-        # SOURCE STATE
-        self._spotify_last_seen_ms = 0
-        self._spotify_last_playing_ms = 0
-        self._spotify_paused = True
-
-        self._yt_last_seen_ms = 0
-        self._yt_last_playing_ms = 0
-        self._yt_paused = True
-
-        # toleranslar (flicker kesmek için)
-        # SIFIRLANDI: Paused olduğu an saate dönmesi için bekleme süreleri kaldırıldı.
-        # Geri eklendi: Ancak polling gecikmesi yüzünden olan flicker'ı engellemek için.
-        # Bu değer PAUSE basıldığında devreye girmez (explicit check var), 
-        # sadece VERİ GELMEDİĞİNDE "hala çalıyor varsay" süresidir.
-        self._spotify_hold_playing_ms = 3000   
-        self._yt_hold_playing_ms = 3000        
+        # Kaynak başına pozisyon filtresi (jitter / seek ayrımı)
+        self._position_filters = {
+            "spotify": PositionEstimator(confirm_seeks=False),
+            "extension": PositionEstimator(),
+            "smtc": PositionEstimator(),
+            "file": PositionEstimator(),
+        }
 
         # gg flicker azalt
         self._last_sent_frame = None
         self._gg_was_running = True
         self._last_rgb_send_ms = 0
 
-        # STICKY SOURCE logic
-        self._extension_last_data_ms = 0
-        self._extension_lock_seconds = 5
-        
         self.auto_launch_gg = False
         self._last_launch_attempt = 0
         
@@ -158,6 +190,34 @@ class DisplayManager:
         self.display_clock = self.user_preferences.get_preference("display_timer")
         self.display_player = self.user_preferences.get_preference("display_player")
         self.display_hw_monitor = self.user_preferences.get_preference("display_hw_monitor")
+        try:
+            interval = float(self.user_preferences.get_preference("hw_sample_interval") or 1.0)
+        except (TypeError, ValueError):
+            interval = 1.0
+        self.hardware_monitor.use_collector(bool(self.user_preferences.get_preference("hw_isolated_collector")))
+        self.hardware_monitor.sampler.interval = max(0.25, interval)
+        nic = self.user_preferences.get_preference("hw_net_interface")
+        disk = self.user_preferences.get_preference("hw_disk")
+        self.hardware_monitor.select_devices(None if nic == "All" else nic, None if disk == "All" else disk)
+        try:
+            self.hardware_monitor.graph_seconds = max(10, int(self.user_preferences.get_preference("hw_graph_seconds") or 120))
+        except (TypeError, ValueError):
+            self.hardware_monitor.graph_seconds = 120
+        # Grafik sayfalarına sadece cycle_screen kısayolu ile gelinir; atanmışsa
+        # ekran kapalıyken de geçmiş dolsun (sadece ucuz psutil metrikleri)
+        self.hardware_monitor.set_keep_history(bool(self.user_preferences.get_preference("hotkey_cycle_screen")))
+        if self.user_preferences.get_preference("hw_alerts_enabled"):
+            self.hardware_monitor.set_alert_rules(parse_rules(self.user_preferences.get_preference("hw_alerts")))
+        else:
+            self.hardware_monitor.set_alert_rules(())
+        if self.user_preferences.get_preference("hw_log_enabled"):
+            try:
+                max_mb = max(1, int(self.user_preferences.get_preference("hw_log_max_mb") or 8))
+            except (TypeError, ValueError):
+                max_mb = 8
+            self.hardware_monitor.set_log(fetch_app_data_path("sensor_logs/sensors.bin"), max_mb * 1024 * 1024)
+        else:
+            self.hardware_monitor.set_log(None)
 
         # Sync Layout constants
         self.config.scrollbar_padding = int(self.user_preferences.get_preference("scrollbar_padding") or 2)
@@ -174,15 +234,25 @@ class DisplayManager:
             
         if hasattr(self.player, "set_style"):
             self.player.set_style(self.user_preferences.get_preference("player_style"))
+        self.lyrics_library.set_folder(self.user_preferences.get_preference("lyrics_folder"))
+        self.player.show_next_lyric = bool(self.user_preferences.get_preference("lyrics_show_next"))
+        self.app_volume_overlay.enabled = bool(self.user_preferences.get_preference("app_volume_overlay"))
+        self.app_volume_overlay.follow_focus = bool(self.user_preferences.get_preference("app_volume_follow_focus"))
 
         # Hotkeys
-        self.key_monitor_val = self._parse_key(self.user_preferences.get_preference("hotkey_monitor"))
-        self.key_mute_val = self._parse_key(self.user_preferences.get_preference("hotkey_mute"))
-        logger.info(f"Hotkeys bound: Monitor={self.key_monitor_val}, Mute={self.key_mute_val}")
+        bindings = self.hotkeys.bind({
+            action: self.user_preferences.get_preference(key) or ""
+            for action, key in HOTKEY_PREFERENCES.items()
+        })
+        bound = ", ".join(f"{action}={'+'.join(sorted(mods) + [key])}" for (mods, key), action in bindings.items())
+        logger.info(f"Hotkeys bound: {bound or 'none'}")
         
         self.auto_launch_gg = self.user_preferences.get_preference("auto_launch_gg")
 
-        self._spotify_poll_ms = max(250, int(self.fetch_delay * 1000))
+        self.spotify_scheduler.configure(
+            base_interval_ms=max(250, int(self.fetch_delay * 1000)),
+            midtrack_interval_ms=int(float(self.user_preferences.get_preference("spotify_midtrack_delay") or 15) * 1000),
+        )
         
         # Reload Spotify credentials if they changed (only if Spotify is enabled)
         if hasattr(self, "spotify_api") and self.spotify_api:
@@ -196,29 +266,28 @@ class DisplayManager:
             # The user must fix the config in the settings window to trigger the 'changed' path.
             # OR we could silently try to fetch if prompt_user=False? No, let's keep it clean.
 
-    def _parse_key(self, key_str):
-        if not key_str or not keyboard:
-            return None
-        
-        try:
-            # Handle "Key.insert", "Key.f1" etc.
-            if key_str.startswith("Key."):
-                attr = key_str.split("Key.")[1]
-                return getattr(keyboard.Key, attr, None)
-            
-            # Handle single chars "a", "1"
-            if len(key_str) == 1:
-                return keyboard.KeyCode.from_char(key_str)
-                
-            # Handle codes "<65>"
-            if key_str.startswith("<") and key_str.endswith(">"):
-                code = int(key_str[1:-1])
-                return keyboard.KeyCode.from_vk(code)
-                
-            # Default fallbacks or direct char
-            return keyboard.KeyCode.from_char(key_str)
-        except Exception:
-            return None
+    def _cycle_screen(self):
+        self.screen = SCREENS[(SCREENS.index(self.screen) + 1) % len(SCREENS)]
+        self.player.changed = True
+        logger.info(f"Screen: {self.screen}")
+
+    def _cycle_player_style(self):
+        styles = SpotifyPlayer.STYLES
+        current = self.user_preferences.get_preference("player_style")
+        style = styles[(styles.index(current) + 1) % len(styles)] if current in styles else styles[0]
+        self.user_preferences.preferences["player_style"] = style
+        self.user_preferences.save_preferences()
+        self.player.set_style(style)
+        logger.info(f"Player style: {style}")
+
+    def _send_media_key(self, name):
+        if not keyboard:
+            return
+        if self._media_keys is None:
+            self._media_keys = keyboard.Controller()
+        key = getattr(keyboard.Key, name)
+        self._media_keys.press(key)
+        self._media_keys.release(key)
 
     def init(self):
         # Startup: Only attempt Spotify auth if enabled
@@ -280,124 +349,66 @@ class DisplayManager:
                     if color and len(color) == 3:
                         self.steelseries_api.send_rgb(color[0], color[1], color[2])
 
-            # 1) YT poll (hızlı)
-            self.volume_overlay.update()
+            # Bu karede görünecek kısayol (hotkey -> piksel gecikmesi için)
+            hotkey_pressed = self.hotkeys.take_pending()
 
-            # Media poll - Extension (Priority) then SMTC
-            if now_ms - self._last_yt_poll_ms >= self._yt_poll_ms:
-                self._last_yt_poll_ms = now_ms
-                
-                # Try Extension First
-                ext_data = self.extension_receiver.get_latest_data()
-                
-                if ext_data:
-                    # Extension is providing data (even if paused)
-                    self._extension_last_data_ms = now_ms
-                    is_playing = bool(ext_data.get("playing"))
-                    
-                    self._yt_last_seen_ms = now_ms
-                    self._yt_paused = not is_playing
-                    if is_playing:
-                        self._yt_last_playing_ms = now_ms
-                    
-                    # Convert extension keys to expected player keys
-                    payload = {
-                        "title": ext_data.get("title"),
-                        "artist": ext_data.get("artist"),
-                        "progress": int(ext_data.get("progress") * 1000), # extension sends seconds
-                        "duration": int(ext_data.get("duration") * 1000),
-                        "paused": not is_playing,
-                        "source": "youtube"
-                    }
-                    
-                    spotify_active = (not self._spotify_paused) and \
-                                     ((now_ms - self._spotify_last_playing_ms) <= self._spotify_hold_playing_ms)
-                    
-                    if not spotify_active:
-                        self._apply_to_player(self.player, payload, now_ms, source="youtube")
-                
-                else:
-                    # Stickiness: If we saw extension data recently, ignore SMTC fallback
-                    in_extension_lock = (now_ms - self._extension_last_data_ms) < (self._extension_lock_seconds * 1000)
-                    
-                    if not in_extension_lock:
-                        # Fallback to SMTC
-                        with self._smtc_lock:
-                            fb = self._smtc_data
-                        
-                        if fb and (fb.get("title") or fb.get("artist")):
-                            self._yt_last_seen_ms = now_ms
-                            self._yt_paused = bool(fb.get("paused", False))
-                            if not self._yt_paused:
-                                self._yt_last_playing_ms = now_ms
-
-                            # Determine source from SMTC source app
-                            src_app = (fb.get("source") or "").lower()
-                            if "spotify" in src_app:
-                                source = "spotify"
-                            elif "chrome" in src_app or "edge" in src_app or "firefox" in src_app or "opera" in src_app:
-                                source = "youtube"
-                            else:
-                                source = "generic"
-
-                            # Spotify aktif çalıyorsa YT overwrite etmesin
-                            spotify_active = (not self._spotify_paused) and \
-                                             ((now_ms - self._spotify_last_playing_ms) <= self._spotify_hold_playing_ms)
-                            
-                            if not spotify_active:
-                                self._apply_to_player(self.player, fb, now_ms, source=source)
-                    else:
-                        # No media from extension or SMTC
-                        pass
+            # 1) Volume overlay (sadece kuyruktaki olaylar; COM çağrısı yok)
+            self.volume_overlay.update()
+            self.app_volume_overlay.update()
 
             # 2) Spotify poll (normal) - only if Spotify is enabled
-            if self.spotify_api and now_ms - self._last_spotify_poll_ms >= self._spotify_poll_ms:
-                self._last_spotify_poll_ms = now_ms
+            if self.spotify_api and self.spotify_scheduler.is_due(now_ms):
+                self.spotify_scheduler.mark_polled(now_ms)
                 Thread(
                     target=self._poll_spotify,
                     daemon=True,
                     args=(self.spotify_api,),
                 ).start()
 
-            # 3) Hangi kaynağı göstereceğiz?
-            # FIX: Pause olduğu an (not paused) False döner ve direkt saate düşer.
-            # Hold süresine sadece "playing" sinyali geliyorken bakılır.
-            
-            is_spotify_running = (not self._spotify_paused)
-            spotify_playing_active = is_spotify_running and \
-                                     ((now_ms - self._spotify_last_playing_ms) <= self._spotify_hold_playing_ms)
-
-            is_yt_running = (not self._yt_paused)
-            yt_playing_active = is_yt_running and \
-                                ((now_ms - self._yt_last_playing_ms) <= self._yt_hold_playing_ms)
-
-            if spotify_playing_active:
-                self.state = State.SHOW_PLAYER
-            elif yt_playing_active:
-                self.state = State.SHOW_PLAYER
-            else:
+            # 3) Hangi kaynağı göstereceğiz? (öncelik / hold / stickiness: MediaArbiter)
+            snapshot = self.media_arbiter.tick(now_ms)
+            if snapshot.media is not None and (snapshot.provider, snapshot.seq) != self._applied_media:
+                self._applied_media = (snapshot.provider, snapshot.seq)
+                self._apply_to_player(self.player, snapshot.media.as_payload(), now_ms,
+                                      source=snapshot.media.source,
+                                      estimator=self._position_filters.get(snapshot.provider),
+                                      sample_ms=snapshot.media.updated_ms)
+
+            self.state = State.SHOW_PLAYER if snapshot.playing else State.SHOW_CLOCK
+            if self.screen == "clock":
                 self.state = State.SHOW_CLOCK
+            elif self.screen == "player" and snapshot.media is not None:
+                self.state = State.SHOW_PLAYER
 
             frame_data = None
 
-            # Hardware monitor overlay > volume overlay > everything
-            if self.display_hw_monitor or self.hardware_monitor.should_display():
+            # Sensor alert > hardware monitor overlay > volume overlay > everything
+            if self.hardware_monitor.check_alerts():
+                img = self.hardware_monitor.get_alert_image()
+                frame_data = convert_to_bitmap(img.getdata())
+            elif self.screen in HardwareMonitor.PAGES:
+                img = self.hardware_monitor.get_page_image(self.screen)
+                frame_data = convert_to_bitmap(img.getdata())
+            elif self.display_hw_monitor or self.screen == "hardware" or self.hardware_monitor.should_display():
                 img = self.hardware_monitor.get_image()
                 frame_data = convert_to_bitmap(img.getdata())
             # volume overlay > everything else
             elif self.volume_overlay.should_display():
                 img = self.volume_overlay.get_image()
                 frame_data = convert_to_bitmap(img.getdata())
+            elif self.app_volume_overlay.should_display():
+                img = self.app_volume_overlay.get_image()
+                frame_data = convert_to_bitmap(img.getdata())
             else:
-                if self.state == State.SHOW_CLOCK and self.display_clock:
+                if self.state == State.SHOW_CLOCK and (self.display_clock or self.screen == "clock"):
                     img = self.timer.get_image()
                     frame_data = convert_to_bitmap(img.getdata())
-                elif self.state == State.SHOW_PLAYER and self.display_player:
+                elif self.state == State.SHOW_PLAYER and (self.display_player or self.screen == "player"):
                     img = self.player.next_step()
                     frame_data = convert_to_bitmap(img.getdata())
 
                     # paused threshold (Yedek kontrol, yukarıdaki mantık bunu zaten çözüyor ama kalsın)
-                    if self.player.pause_started and (int(time() * 1000) - self.player.pause_started) > self.timer_threshold:
+                    if self.screen != "player" and self.player.pause_started and (int(time() * 1000) - self.player.pause_started) > self.timer_threshold:
                         self.state = State.SHOW_CLOCK
 
             # tek kanaldan gönder + duplicate skip
@@ -405,62 +416,59 @@ class DisplayManager:
                 try:
                     self.steelseries_api.send_frame(frame_data)
                     self._last_sent_frame = frame_data
+                    if hotkey_pressed is not None:
+                        self.hotkeys.record_frame(hotkey_pressed)
                 except Exception:
                     pass
 
-            sleep(1 / self.fps)
+            # Kare bekleme; extension olayı gelirse erken uyan
+            self._wake.wait(1 / self.fps)
+            self._wake.clear()
 
     def _poll_spotify(self, spotify_api):
         try:
             song_data = spotify_api.fetch_song()
-            if not song_data:
-                return
-
             now_ms = int(time() * 1000)
 
-            self._spotify_last_seen_ms = now_ms
-            self._spotify_paused = bool(song_data.get("paused", False))
-            if not self._spotify_paused:
-                self._spotify_last_playing_ms = now_ms
-
-            # Spotify paused ise ve YT aktif çalıyorsa overwrite etme
-            yt_active = (not self._yt_paused) and \
-                        ((now_ms - self._yt_last_playing_ms) <= self._yt_hold_playing_ms)
-            
-            if yt_active and self._spotify_paused:
-                return
-
-            payload = {
-                "title": song_data.get("title", ""),
-                "artist": song_data.get("artist", ""),
-                "progress": int(song_data.get("progress") or 0),
-                "duration": max(int(song_data.get("duration") or 1), 1),
-                "paused": self._spotify_paused,
-            }
-            self._apply_to_player(self.player, payload, now_ms, source="spotify")
+            if self.spotify_scheduler.observe(song_data, now_ms):
+                self._wake.set()  # yeni şarkı: kare beklemeden göster
+            # Şarkı ortasında seyrek poll yapıldığı için "hala çalıyor" süresi
+            # bir sonraki planlı poll'u kapsamalı, yoksa araya saat girer.
+            self.spotify_source.ttl_ms = max(3000, self.spotify_scheduler.interval_ms + 1000)
+            self.spotify_source.push(song_data, now_ms)
         except Exception:
             pass
 
+    def _on_cover_ready(self):
+        self.player.changed = True
+        self._wake.set()
+
     @staticmethod
-    def _apply_to_player(player, data, now_ms: int, source="spotify"):
+    def _apply_to_player(player, data, now_ms: int, source="spotify", estimator=None, sample_ms=None):
         """
         Scroll resetlenmesin diye:
         - title/artist değiştiyse update_song
-        - aynıysa sadece seek_song (progress güncelle)
+        - aynıysa pozisyonu kaynağın PositionEstimator'ından geçirip seek_song
         """
         try:
             title = (data.get("title") or "").strip()
             artist = (data.get("artist") or "").strip()
-            progress = int(data.get("progress") or 0)
+            raw_progress = data.get("progress")
+            progress = int(raw_progress or 0)
             duration = int(data.get("duration") or 1)
             paused = bool(data.get("paused", False))
 
+            # SMTC bilinmeyen pozisyon için -1 gönderir
+            progress_known = raw_progress is not None and progress >= 0
+
             if duration <= 0:
                 duration = 1
                 progress = 0
             if progress < 0:
                 progress = 0
 
+            player.set_cover(data.get("artwork"))
+
             # ✅ sadece değişince update_song (yoksa scroll her seferinde sıfırlanır)
             changed = True
             try:
@@ -471,31 +479,22 @@ class DisplayManager:
                 changed = True
 
             if changed:
-                player.update_song(title, artist, progress, duration, paused, source)
-            else:
-                # aynı içerik: sadece ilerleme
+                # Veri ölçüldüğünden beri geçen süreyi ekle (push kanalında eski olabilir)
+                lag = max(0, now_ms - sample_ms) if (sample_ms and not paused and progress_known) else 0
+                player.update_song(title, artist, min(progress + lag, duration), duration, paused, source)
+                if estimator is not None and progress_known:
+                    estimator.reset(progress, sample_ms or now_ms, playing=not paused)
+            elif estimator is None:
+                player.seek_song(progress)
+            elif progress_known:
+                # Filtre jitter'ı yutar; oynatıcı ileri her zaman, geri ise
+                # sadece seek'te, pause'da veya tolerans aşılınca düzeltilir.
+                # Örnek, ölçüldüğü ana (sample_ms) göre filtreye verilir.
+                position, seeked = estimator.update(progress, sample_ms or now_ms, playing=not paused)
                 if not paused:
-                    # --- JITTER-FREE SYNC BAŞLANGIÇ ---
-                    current_pos = player.song_position
-                    diff = progress - current_pos  # Gecikme farkı
-                    
-                    # Eğer kullanıcı videoyu ileri/geri sarmışsa (2sn üstü fark) zorla güncelle
-                    if abs(diff) > 2000:
-                         player.seek_song(progress)
-                    
-                    # Eğer duraklatılmışsa (PAUSE), tam yerini göster (flicker burada önemli değil)
-                    elif paused and abs(diff) > 200:
-                         player.seek_song(progress)
-                    
-                    # Eğer çalıyorsa ve fark çok büyük değilse:
-                    # Geriye doğru gidişi engelle (Jitter'ın ana sebebi odur).
-                    # Sadece ciddi bir gerileme/fark varsa müdahale et.
-                    elif not paused:
-                        # Eğer gelen veri mevcut konumumuzdan ÖNDEYSE ve fark 500ms+ ise snap yap
-                        if diff > 500:
-                            player.seek_song(progress)
-                        # Eğer gelen veri ARKADAYSA ama fark küçükse güncelleme YAPMA (flicker önle)
-                    # --- JITTER-FREE SYNC BİTİŞ ---
+                    position = estimator.position(now_ms)
+                if estimator.should_snap(player.song_position, position, seeked):
+                    player.seek_song(position)
 
             # pause bookkeeping
             if not player.paused and paused:
@@ -534,11 +533,19 @@ class DisplayManager:
         logger.info("SMTC poll loop started")
 
         async def runner():
+            last_track = None
             while True:
                 try:
                     data = await self.windows_media.get_media_info()
-                    with self._smtc_lock:
-                        self._smtc_data = data
+                    now_ms = int(time() * 1000)
+                    self.smtc_source.push(data, now_ms)
+
+                    # SMTC şarkı değişimini genelde Web API'den önce görür; Spotify'ı hemen sor
+                    track = (data.get("title"), data.get("artist")) if data else None
+                    if track != last_track:
+                        if last_track is not None and track is not None:
+                            self.spotify_scheduler.hint(now_ms)
+                        last_track = track
                     
                     # Log occasionally if media found
                     # if data and data.get("title"):
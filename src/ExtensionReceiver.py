@@ -1,48 +1,320 @@
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import OrderedDict
 import json
 import threading
 import logging
+import math
 import time
 
+from src import ws_frames
+
 logger = logging.getLogger("OLED Customizer.ExtensionReceiver")
 
-class ExtensionData:
+# Request limits
+MAX_BODY_BYTES = 64 * 1024      # extension payload'ı ~300 byte; fazlası saçmalık
+READ_TIMEOUT_SECONDS = 5        # yarım kalan istek / boşta keep-alive bağlantı süresi
+DATA_TTL_SECONDS = 5            # POST ile gelen veri bu kadar süre geçerli
+MAX_TABS = 32                   # tablo sınırı; en eski sekme atılır
+WS_PING_SECONDS = 15            # sunucu ping aralığı (push kanalı)
+WS_READ_TIMEOUT = 2 * WS_PING_SECONDS + 5   # bu sürede pong / mesaj yoksa bağlantı ölü (uyku sonrası yarım açık)
+MAX_WS_CONNECTIONS = 4          # tarayıcı başına tek bağlantı (service worker); fazlası reddedilir
+WS_ALLOWED_ORIGINS = ("chrome-extension://",)   # WebSocket'e CORS uygulanmaz; sayfalar bağlanamasın
+DEFAULT_TAB = "default"         # tab id göndermeyen eski extension sürümleri
+
+# Payload schema. v1 (no "v" field): the original YouTube-only payload.
+# v2: generic Media Session mode adds album, artwork URL and site.
+SCHEMA_VERSION = 2
+_V1_FIELDS = ("title", "artist", "duration", "progress", "playing", "source")
+_V2_FIELDS = _V1_FIELDS + ("album", "artwork", "site")
+_STR_LIMITS = {"title": 512, "artist": 512, "album": 512, "source": 256, "site": 256, "artwork": 2048}
+
+
+def normalize_payload(data, version=None):
+    """
+    Validate an extension payload (full state or delta) against its schema
+    version and return a dict with only the known fields. Deltas carry no
+    "v", so the connection's version is passed in. Payloads from a newer
+    extension are read as the newest version we know. Raises ValueError.
+    """
+    version = data.get("v", version or 1)
+    if isinstance(version, bool) or not isinstance(version, int) or version < 1:
+        raise ValueError(f"bad schema version {version!r}")
+    version = min(version, SCHEMA_VERSION)
+
+    clean = {"v": version}
+    for key in (_V2_FIELDS if version >= 2 else _V1_FIELDS):
+        if key not in data:
+            continue
+        value = data[key]
+        if key in _STR_LIMITS:
+            if value is None:
+                value = ""
+            if not isinstance(value, str):
+                raise ValueError(f"{key} is not a string")
+            value = value[:_STR_LIMITS[key]]
+            if key == "artwork" and not value.startswith(("http://", "https://")):
+                value = ""  # blob:/data: URL'leri sayfa dışında işe yaramaz
+        elif key == "playing":
+            value = bool(value)
+        elif value is not None:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{key} is not a number")
+            if not math.isfinite(value) or value < 0:
+                value = None  # canlı yayın: duration = Infinity
+        clean[key] = value
+    return clean
+
+
+class _TabEntry:
+    __slots__ = ("data", "received", "ttl", "owner")
+
     def __init__(self):
         self.data = None
-        self.last_update = 0
+        self.received = 0.0
+        self.ttl = DATA_TTL_SECONDS
+        self.owner = None
 
-    def update(self, new_data):
-        self.data = new_data
-        self.last_update = time.time()
+    def alive(self, now):
+        return self.ttl is None or (now - self.received) < self.ttl
+
+
+class ExtensionData:
+    """
+    Latest payload of every browser tab, keyed by the tab id the content
+    script sends. A paused background tab no longer overwrites the playing
+    one: the selected tab is the playing tab that started playing last,
+    otherwise the tab whose play state changed last.
+
+    Two insertion-ordered indexes keep selection O(1) per update:
+    `_playing` (playing tabs, in the order they started) and `_recent`
+    (every tab, in the order its play state last changed). Expired tabs are
+    dropped lazily when they reach the end of an index.
+    """
+
+    def __init__(self, max_tabs=MAX_TABS):
+        self.max_tabs = max_tabs
+        self.tabs = {}
+        self.listeners = []
+        self._playing = OrderedDict()
+        self._recent = OrderedDict()
+        self._selected = None
+        self._lock = threading.Lock()
+
+    def update(self, new_data, ttl=DATA_TTL_SECONDS, owner=None, tab=None):
+        """
+        ttl=None: veri, sahibi (açık bir push bağlantısı) release edene kadar geçerli.
+        """
+        tab = tab or DEFAULT_TAB
+        playing = bool(new_data.get("playing"))
+        now = time.time()
+        with self._lock:
+            entry = self.tabs.get(tab)
+            if entry is None:
+                entry = self.tabs[tab] = _TabEntry()
+                self._recent[tab] = None
+                if len(self.tabs) > self.max_tabs:
+                    self._drop(next(iter(self._recent)))
+            elif playing != bool(entry.data.get("playing")):
+                self._recent.move_to_end(tab)
+
+            entry.data = new_data
+            entry.received = now
+            entry.ttl = ttl
+            entry.owner = owner
+
+            if playing:
+                if tab not in self._playing:
+                    self._playing[tab] = None
+            else:
+                self._playing.pop(tab, None)
+
+            # Sadece gösterilen sekme değiştiyse render döngüsünü uyandır
+            notify = self._reselect(now) or self._selected == tab
+        if notify:
+            self._notify()
+
+    def release(self, owner, tab=None):
+        """Push connection closed (or one of its tabs said bye): drop the tabs it was feeding."""
+        with self._lock:
+            for t in [t for t, e in self.tabs.items() if e.owner is owner and tab in (None, t)]:
+                self._drop(t)
+            notify = self._reselect(time.time())
+        if notify:
+            self._notify()
+
+    def get_entry(self):
+        """Returns (data, received_ms) of the selected tab or None when there is no valid data."""
+        with self._lock:
+            self._reselect(time.time())
+            if self._selected is None:
+                return None
+            entry = self.tabs[self._selected]
+            return entry.data, int(entry.received * 1000)
 
     def get_data(self):
-        # Data is valid for 5 seconds
-        if self.data and (time.time() - self.last_update < 5):
-            return self.data
+        entry = self.get_entry()
+        return entry[0] if entry else None
+
+    def tab_count(self):
+        with self._lock:
+            return len(self.tabs)
+
+    def _reselect(self, now):
+        """Recompute the selected tab; returns True when it changed. Caller holds the lock."""
+        selected = self._newest_alive(self._playing, now)
+        if selected is None:
+            selected = self._newest_alive(self._recent, now)
+        changed = selected != self._selected
+        self._selected = selected
+        return changed
+
+    def _newest_alive(self, index, now):
+        while index:
+            tab = next(reversed(index))
+            if self.tabs[tab].alive(now):
+                return tab
+            self._drop(tab)
         return None
 
+    def _drop(self, tab):
+        self.tabs.pop(tab, None)
+        self._playing.pop(tab, None)
+        self._recent.pop(tab, None)
+
+    def _notify(self):
+        for listener in self.listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.debug(f"Extension listener failed: {e}")
+
+
+class ReceiverStats:
+    """Request-rate and parse-latency counters, safe to update from handler threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.bytes_received = 0
+        self.parse_ns_total = 0
+        self.parse_ns_max = 0
+        self._window_start = time.monotonic()
+        self._window_requests = 0
+        self.request_rate = 0.0
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def record(self, body_bytes, parse_ns, ok=True):
+        with self._lock:
+            self.requests += 1
+            self._window_requests += 1
+            if not ok:
+                self.errors += 1
+            self.bytes_received += body_bytes
+            self.parse_ns_total += parse_ns
+            if parse_ns > self.parse_ns_max:
+                self.parse_ns_max = parse_ns
+
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if elapsed >= 1.0:
+                self.request_rate = self._window_requests / elapsed
+                self._window_requests = 0
+                self._window_start = now
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            avg_us = (self.parse_ns_total / self.requests / 1000) if self.requests else 0.0
+            rate = self.request_rate
+            elapsed = time.monotonic() - self._window_start
+            if elapsed >= 2.0:
+                # İstek gelmiyorsa son pencere bayat kalmasın
+                rate = self._window_requests / elapsed
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "connections": self.connections,
+                "bytes_received": self.bytes_received,
+                "request_rate": round(rate, 1),
+                "parse_avg_us": round(avg_us, 1),
+                "parse_max_us": round(self.parse_ns_max / 1000, 1),
+            }
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
 # Global storage instance
 extension_storage = ExtensionData()
+receiver_stats = ReceiverStats()
+
 
 class ExtensionHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1: tarayıcı bağlantıyı açık tutar (keep-alive), her POST'ta yeni TCP yok
+    protocol_version = "HTTP/1.1"
+    # StreamRequestHandler bunu socket timeout'u olarak kurar (okuma + boşta bekleme)
+    timeout = READ_TIMEOUT_SECONDS
+
+    def setup(self):
+        super().setup()
+        self._send_lock = threading.Lock()
+        receiver_stats.connection_opened()
+
     def do_POST(self):
-        if self.path == '/extension_data':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            
-            try:
-                data = json.loads(post_data.decode('utf-8'))
-                extension_storage.update(data)
-                self.send_response(200)
-            except Exception as e:
-                logger.error(f"Failed to parse extension data: {e}")
-                self.send_response(400)
-            
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+        if self.path != '/extension_data':
+            self._discard_body()
+            self._respond(404)
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            post_data = self._read_body()
+            data = json.loads(post_data.decode('utf-8'))
+            if not isinstance(data, dict):
+                raise RequestError(400, "payload is not an object")
+            tab = data.get("tab")
+            data = normalize_payload(data)
+        except RequestError as e:
+            receiver_stats.record_error()
+            logger.warning(f"Rejected extension request: {e}")
+            self._respond(e.status)
+            return
+        except (ValueError, UnicodeDecodeError) as e:
+            receiver_stats.record(0, time.perf_counter_ns() - start, ok=False)
+            logger.error(f"Failed to parse extension data: {e}")
+            self._respond(400)
+            return
+        except (TimeoutError, ConnectionError):
+            # Gövde READ_TIMEOUT_SECONDS içinde gelmedi: cevap vermeden kapat
+            receiver_stats.record_error()
+            self.close_connection = True
+            return
+
+        extension_storage.update(data, tab=str(tab) if tab else None)
+        receiver_stats.record(len(post_data), time.perf_counter_ns() - start)
+        self._respond(200)
+
+    def do_GET(self):
+        if self.path == '/ws' and 'websocket' in (self.headers.get('Upgrade') or '').lower():
+            self._serve_websocket()
+        elif self.path == '/stats':
+            stats = receiver_stats.snapshot()
+            stats["tabs"] = extension_storage.tab_count()
+            body = json.dumps(stats).encode('utf-8')
+            self._respond(200, body, "application/json")
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._respond(404)
 
     def do_OPTIONS(self):
         # Handle CORS preflight
@@ -50,12 +322,232 @@ class ExtensionHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    # ---------- Push channel (WebSocket) ----------
+    # Extension'ın service worker'ı tek bağlantı açar ve tüm sekmeleri taşır;
+    # sadece medya olaylarında küçük delta'lar yollar:
+    #   {"type": "state"|"delta"|"bye"|"ping", "seq": n, "tab": id, "data": {...}}
+    # Her mesaj {"type": "ack", "seq": n} ile onaylanır; ack gelmezse extension
+    # bağlantıyı yeniler ve tüm sekmelerin tam durumunu yeniden yollar.
+    # Sunucu WS_PING_SECONDS'ta bir ping atar; WS_READ_TIMEOUT boyunca hiçbir
+    # frame (pong dahil) gelmezse bağlantı kapatılır.
+
+    def _serve_websocket(self):
+        key = self.headers.get('Sec-WebSocket-Key')
+        origin = self.headers.get('Origin') or ''
+        self.close_connection = True
+        if not key:
+            self._respond(400)
+            return
+        if not origin.startswith(WS_ALLOWED_ORIGINS):
+            logger.warning(f"Rejected WebSocket from origin {origin or '(none)'}")
+            self._respond(403)
+            return
+        if not self.server.register_websocket(self):
+            logger.warning("Rejected WebSocket: too many push connections")
+            self._respond(503)
+            return
+
+        try:
+            self.send_response(101, "Switching Protocols")
+            self.send_header('Upgrade', 'websocket')
+            self.send_header('Connection', 'Upgrade')
+            self.send_header('Sec-WebSocket-Accept', ws_frames.accept_key(key))
+            self.end_headers()
+            self.connection.settimeout(WS_READ_TIMEOUT)
+            self._websocket_loop()
+        finally:
+            self.server.unregister_websocket(self)
+
+    def _websocket_loop(self):
+        owner = object()
+        default_tab = f"ws-{id(owner):x}"
+        states = {}     # sekme -> birleştirilmiş son durum
+
+        def on_control(opcode, payload):
+            if opcode == ws_frames.OP_PING:
+                self.send_frame(ws_frames.OP_PONG, payload)
+
+        try:
+            while True:
+                opcode, payload = ws_frames.read_message(self.rfile, MAX_BODY_BYTES, on_control)
+                if opcode == ws_frames.OP_CLOSE:
+                    self.send_frame(ws_frames.OP_CLOSE, payload[:2])
+                    break
+                if opcode != ws_frames.OP_TEXT:
+                    continue
+
+                start = time.perf_counter_ns()
+                try:
+                    message = json.loads(payload.decode('utf-8'))
+                    kind = message.get("type")
+                    tab = str(message.get("tab") or default_tab)
+                    data = message.get("data") or {}
+                    if not isinstance(data, dict):
+                        raise ValueError("data is not an object")
+                    state = states.get(tab, {})
+                    data = normalize_payload(data, None if kind == "state" else state.get("v"))
+                except (ValueError, UnicodeDecodeError, AttributeError) as e:
+                    receiver_stats.record(0, time.perf_counter_ns() - start, ok=False)
+                    logger.error(f"Failed to parse extension message: {e}")
+                    continue
+
+                if kind in ("state", "delta", "bye"):
+                    if kind == "state":
+                        state = dict(data)
+                    elif kind == "delta":
+                        state = {**state, **data}
+                    else:
+                        state = {}
+
+                    if state:
+                        states[tab] = state
+                        # Çalarken bağlantı açık kaldığı sürece geçerli; pause'da ise
+                        # POST'taki gibi yaşlansın ki SMTC'yi sonsuza kadar maskelemesin.
+                        ttl = None if state.get("playing") else DATA_TTL_SECONDS
+                        extension_storage.update(dict(state), ttl=ttl, owner=owner, tab=tab)
+                    else:
+                        states.pop(tab, None)
+                        extension_storage.release(owner, tab)
+                receiver_stats.record(len(payload), time.perf_counter_ns() - start)
+
+                ack = json.dumps({"type": "ack", "seq": message.get("seq")}).encode('utf-8')
+                self.send_frame(ws_frames.OP_TEXT, ack)
+        except TimeoutError:
+            logger.info("Extension push channel timed out (no pong)")
+        except (ws_frames.FrameError, ConnectionError, OSError) as e:
+            logger.debug(f"Extension push channel closed: {e}")
+        finally:
+            extension_storage.release(owner)
+
+    def send_frame(self, opcode, payload=b""):
+        """Write one frame; called from the handler thread and the server's ping thread."""
+        with self._send_lock:
+            self.wfile.write(ws_frames.encode_frame(opcode, payload))
+
+    def _respond(self, status, body=b"", content_type=None):
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
         self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _read_body(self):
+        """
+        Read the request body with a hard size limit. Supports Content-Length
+        and chunked transfer encoding; anything else is rejected.
+        """
+        if 'chunked' in (self.headers.get('Transfer-Encoding') or '').lower():
+            return self._read_chunked()
+
+        length_header = self.headers.get('Content-Length')
+        if length_header is None:
+            self.close_connection = True
+            raise RequestError(411, "missing Content-Length")
+        try:
+            length = int(length_header)
+        except ValueError:
+            self.close_connection = True
+            raise RequestError(400, f"bad Content-Length {length_header!r}")
+        if length < 0 or length > MAX_BODY_BYTES:
+            # Gövdeyi okumadan reddediyoruz, bağlantı artık senkron değil
+            self.close_connection = True
+            raise RequestError(413, f"body too large ({length} bytes)")
+
+        body = self.rfile.read(length)
+        if len(body) != length:
+            self.close_connection = True
+            raise RequestError(400, "truncated body")
+        return body
+
+    def _read_chunked(self):
+        chunks = []
+        total = 0
+        while True:
+            line = self.rfile.readline(64)
+            try:
+                size = int(line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                self.close_connection = True
+                raise RequestError(400, "bad chunk size")
+            if size == 0:
+                # trailer header'larını boş satıra kadar at
+                while self.rfile.readline(1024) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            total += size
+            if total > MAX_BODY_BYTES:
+                self.close_connection = True
+                raise RequestError(413, "chunked body too large")
+            chunk = self.rfile.read(size)
+            if len(chunk) != size:
+                self.close_connection = True
+                raise RequestError(400, "truncated chunk")
+            chunks.append(chunk)
+            self.rfile.readline(8)  # CRLF after chunk data
+
+    def _discard_body(self):
+        try:
+            self._read_body()
+        except (RequestError, TimeoutError, ConnectionError):
+            self.close_connection = True
 
     def log_message(self, format, *args):
         # Suppress server logs
         return
 
+
+class ExtensionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._websockets = set()
+        self._ws_lock = threading.Lock()
+        self._closing = threading.Event()
+        threading.Thread(target=self._ping_loop, daemon=True).start()
+
+    def register_websocket(self, handler):
+        """False when MAX_WS_CONNECTIONS push connections are already open."""
+        with self._ws_lock:
+            if len(self._websockets) >= MAX_WS_CONNECTIONS:
+                return False
+            self._websockets.add(handler)
+            return True
+
+    def unregister_websocket(self, handler):
+        with self._ws_lock:
+            self._websockets.discard(handler)
+
+    def websocket_count(self):
+        with self._ws_lock:
+            return len(self._websockets)
+
+    def _ping_loop(self):
+        # Tek thread tüm push bağlantılarına ping atar; cevapsız kalan bağlantı
+        # kendi thread'inde WS_READ_TIMEOUT ile düşer
+        while not self._closing.wait(WS_PING_SECONDS):
+            with self._ws_lock:
+                handlers = list(self._websockets)
+            for handler in handlers:
+                try:
+                    handler.send_frame(ws_frames.OP_PING)
+                except OSError:
+                    pass
+
+    def server_close(self):
+        self._closing.set()
+        super().server_close()
+
+
 class ExtensionReceiver:
     def __init__(self, port=2408):
         self.port = port
@@ -64,12 +556,33 @@ class ExtensionReceiver:
 
     def start(self):
         def run_server():
-            self.server = HTTPServer(('127.0.0.1', self.port), ExtensionHandler)
+            try:
+                self.server = ExtensionServer(('127.0.0.1', self.port), ExtensionHandler)
+            except OSError as e:
+                logger.error(f"Extension Receiver cannot bind port {self.port}: {e}")
+                return
             logger.info(f"Extension Receiver listening on port {self.port}")
             self.server.serve_forever()
 
         self.thread = threading.Thread(target=run_server, daemon=True)
         self.thread.start()
 
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def add_listener(self, callback):
+        """`callback()` runs on the receiver thread whenever extension data changes."""
+        extension_storage.listeners.append(callback)
+
     def get_latest_data(self):
         return extension_storage.get_data()
+
+    def get_latest_entry(self):
+        return extension_storage.get_entry()
+
+    def get_stats(self):
+        stats = receiver_stats.snapshot()
+        stats["tabs"] = extension_storage.tab_count()
+        return stats
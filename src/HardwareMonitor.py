@@ -1,72 +1,70 @@
 """
 Hardware Monitor for OLED display.
-Uses LibreHardwareMonitor via pythonnet to get CPU/GPU temps.
-Includes WMI fallback.
+Sensors come from the backends in src.sensor_backends (LibreHardwareMonitor
+via pythonnet, WMI, hwmon/psutil on Linux), picked per metric at startup.
 """
 import logging
 from time import time
-from threading import Thread, Lock
+from threading import Thread
 import os
 
-import psutil
 from PIL import Image, ImageDraw, ImageFont
 
 from src.image_utils import fetch_content_path
+from src.sensor_alerts import AlertEvaluator, format_value
+from src.sensor_backends import BackendSelector
+from src.sensor_graphs import CORES_PAGE, GRAPH_PAGES, SensorGraphs
+from src.sensor_history import SensorHistory
+from src.sensor_log import SensorLog
+from src.sensor_sampler import SensorSampler
+from src.throughput import format_rate, format_rate_short
+from src.top_processes import ProcessSampler
+from src.sensor_collector import SensorCollector
 
 logger = logging.getLogger("OLED Customizer.HardwareMonitor")
 
-# Try to load LibreHardwareMonitor
-_lhm_available = False
-_computer = None
-_update_lock = Lock()
-
-# WMI Fallback
-try:
-    import wmi
-    _wmi_available = True
-except ImportError:
-    _wmi = None
-    _wmi_available = False
-
-try:
-    # First check if admin
-    import ctypes
-    if ctypes.windll.shell32.IsUserAnAdmin() == 0:
-        logger.warning("Not running as Admin - LHM sensors might fail")
-
-    import HardwareMonitor.Hardware as HW
-    _lhm_available = True
-    logger.info("LibreHardwareMonitor loaded successfully")
-except Exception as e:
-    logger.warning(f"LibreHardwareMonitor not available: {e}")
-
-
-def _init_hardware():
-    """Initialize hardware monitoring (call once at startup)."""
-    global _computer
-    if not _lhm_available or _computer is not None:
-        return
-    
-    try:
-        _computer = HW.Computer()
-        _computer.IsCpuEnabled = True
-        _computer.IsGpuEnabled = True
-        _computer.IsMemoryEnabled = True
-        _computer.Open()
-        logger.info("Hardware monitoring initialized")
-    except Exception as e:
-        logger.error(f"Failed to init hardware monitoring: {e}")
+# Collector sürecinin okuyucuyu kurduğu yer (module:callable)
+HARDWARE_READER_SPEC = "src.HardwareMonitor:HardwareReader"
+
+THROUGHPUT_PAGE = "throughput"
+PROCESSES_PAGE = "processes"
+
+
+class HardwareReader:
+    """
+    Reads the hardware metrics through the fastest working backend per
+    metric. Called on the sampler thread, or inside the collector
+    subprocess (spec "src.HardwareMonitor:HardwareReader").
+    """
+
+    def __init__(self, background_init=True, backends=None):
+        self.selector = BackendSelector(backends)
+        # LHM açılışı birkaç saniye sürebilir; probe bitene kadar okuma boş döner
+        if background_init:
+            Thread(target=self.selector.probe, daemon=True).start()
+        else:
+            self.selector.probe()
+
+    def __call__(self):
+        return self.selector.read()
 
 
 class HardwareMonitor:
     """
     Hardware monitor overlay for OLED display.
     """
+
+    # get_page_image() ile çizilen ek ekranlar
+    PAGES = (*GRAPH_PAGES, CORES_PAGE, THROUGHPUT_PAGE, PROCESSES_PAGE)
     
-    def __init__(self, config, timeout=3.0):
+    def __init__(self, config, timeout=3.0, interval=1.0, isolated=False):
         self.config = config
         self.timeout = timeout
         self._last_trigger = 0.0
+
+        # Son çizilen değerler; değişmedikçe aynı görüntü döner
+        self._last_values = None
+        self._last_image = None
         
         # Larger font
         self.FONT = ImageFont.truetype(
@@ -78,16 +76,88 @@ class HardwareMonitor:
         self.cpu_icon = self._load_icon("cpu_icon.png")
         self.gpu_icon = self._load_icon("gpu_icon.png")
         self.ram_icon = self._load_icon("ram_icon.png")
+        self.net_down_icon = self._load_icon("net_down_icon.png")
+        self.net_up_icon = self._load_icon("net_up_icon.png")
+        self.disk_icon = self._load_icon("disk_icon.png")
+        self._last_throughput = None
+        self._throughput_image = None
+
+        # En çok CPU kullanan süreçler; thread sayfa ilk açıldığında başlar
+        self.processes = ProcessSampler(k=3)
+        self._last_processes = None
+        self._processes_image = None
+        self._fitted = {}       # (ad, genişlik) -> sığdırılmış ad
+
+        # Eşik alarmları: yeni her örnekte bir kez değerlendirilir
+        self.alerts = AlertEvaluator()
+        self.alert_seconds = 5.0
+        self._alert_seq = None
+        self._alert_rule = None
+        self._alert_until = 0.0
+        self._last_alert = None
+        self._alert_image = None
         
-        # Initialize hardware monitoring in background
-        Thread(target=_init_hardware, daemon=True).start()
-        
-        self._wmi = None
-        if _wmi_available:
-            try:
-                self._wmi = wmi.WMI(namespace="root/WMI")
-            except:
-                pass
+        # Grafik sayfaları: son 10 dk'lık halka tampon, pencere saniye cinsinden
+        self.history = SensorHistory()
+        self.graphs = SensorGraphs(config, self.history, self.FONT)
+        self.graph_seconds = 120
+        self.keep_history = False   # grafik sayfası açılabiliyorsa boştayken de ucuz örnek
+
+        # Sensörler render thread'inde değil, sampler thread'inde ya da
+        # ayrı bir collector sürecinde okunur
+        self.sampler = None
+        self.devices = (None, None)
+        self.isolated = None            # çalışan sampler collector mı
+        self.wants_isolated = None      # ayarın istediği (collector çökünce farklı olabilir)
+        self._reader = None
+        self.use_collector(isolated, interval)
+
+    def select_devices(self, nic=None, disk=None):
+        """NIC / disk shown on the throughput page (None or "": all)."""
+        self.devices = (nic or None, disk or None)
+        self.sampler.select_devices(*self.devices)
+
+    def use_collector(self, isolated, interval=None):
+        """Switch between the in-process sampler thread and the collector subprocess."""
+        isolated = bool(isolated)
+        if self.sampler is not None and isolated == self.wants_isolated:
+            return
+        self.wants_isolated = isolated
+        self._start_sampler(isolated, interval)
+
+    def _start_sampler(self, isolated, interval=None):
+        if interval is None:
+            interval = self.sampler.interval if self.sampler is not None else 1.0
+        if self.sampler is not None:
+            self.sampler.stop()
+
+        if isolated:
+            self.sampler = SensorCollector(HARDWARE_READER_SPEC, interval=interval, history=self.history)
+        else:
+            # Backend'ler bir kez açılır; collector'dan geri dönünce yeniden probe yok
+            if self._reader is None:
+                self._reader = HardwareReader()
+            self.sampler = SensorSampler(self._reader, interval=interval, history=self.history)
+        self.sampler.select_devices(*self.devices)
+        self.sampler.keep_history = self.keep_history
+        self.isolated = isolated
+        self._last_values = None
+        self.sampler.start()
+
+    def set_keep_history(self, enabled):
+        """Keep cheap samples flowing into the graph history while no screen shows sensors."""
+        self.keep_history = bool(enabled)
+        self.sampler.keep_history = self.keep_history
+
+    def _touch(self):
+        """
+        Keep the sampler awake. A collector that gave up (crash loop) is
+        replaced by the in-process sampler until the setting changes.
+        """
+        if self.isolated and self.sampler.failed:
+            logger.warning("Sensor collector gave up, falling back to the in-process sampler")
+            self._start_sampler(False)
+        self.sampler.touch()
 
     def _load_icon(self, filename):
         try:
@@ -104,91 +174,225 @@ class HardwareMonitor:
     def should_display(self) -> bool:
         return (time() - self._last_trigger) < self.timeout
 
-    def _get_lhm_sensor(self, hw_type, sensor_type, name_contains=None):
-        """Get value from LHM."""
-        if not _lhm_available or _computer is None:
-            return None
-        
-        try:
-            with _update_lock:
-                # Iterate all hardware
-                for hw in _computer.Hardware:
-                    # Filter HW type
-                    if hw_type.lower() not in str(hw.HardwareType).lower():
-                        continue
-                        
-                    hw.Update()
-                    for sensor in hw.Sensors:
-                        if sensor_type.lower() not in str(sensor.SensorType).lower():
-                            continue
-                        if name_contains and name_contains.lower() not in str(sensor.Name).lower():
-                            continue
-                        if sensor.Value is not None and sensor.Value > 0:
-                            return float(sensor.Value)
-                            
-                    # SubHardware (some GPUs)
-                    for sub in hw.SubHardware:
-                        sub.Update()
-                        for sensor in sub.Sensors:
-                            if sensor_type.lower() not in str(sensor.SensorType).lower():
-                                continue
-                            if name_contains and name_contains.lower() not in str(sensor.Name).lower():
-                                continue
-                            if sensor.Value is not None and sensor.Value > 0:
-                                return float(sensor.Value)
-        except:
-            pass
-        return None
+    def set_alert_rules(self, rules):
+        """Replace the alert rules (list of AlertRule); state starts fresh if they changed."""
+        if tuple(rules) == self.alerts.rules:
+            return
+        self.alerts = AlertEvaluator(rules)
+        self._alert_seq = None
+        self._alert_rule = None
 
-    def _get_wmi_cpu_temp(self):
-        """Fallback CPU temp from WMI."""
-        if not self._wmi:
-            return None
-        try:
-            temps = self._wmi.MSAcpi_ThermalZoneTemperature()
-            for t in temps:
-                c = (t.CurrentTemperature / 10.0) - 273.15
-                if c > 0:
-                    return c
-        except:
-            pass
-        return None
+    def set_log(self, path, max_bytes=8 * 1024 * 1024):
+        """Write every sample to a binary SensorLog at `path` (None: logging off)."""
+        current = self.history.log
+        if current is not None and current.path == path and current.max_bytes == max_bytes:
+            return
+        self.history.log = SensorLog(path, max_bytes=max_bytes) if path else None
+        if current is not None:
+            current.close()
+
+    def check_alerts(self) -> bool:
+        """
+        Evaluate the rules on a new sampler snapshot (once per seq) and
+        report whether an alert frame should be shown. While rules or the
+        sensor log are active the sampler is kept awake so they see every
+        sample.
+        """
+        if not self.alerts.rules and self.history.log is None:
+            return False
+        self._touch()
+        if not self.alerts.rules:
+            return False
+        snap = self.sampler.snapshot
+        if snap.seq != self._alert_seq:
+            self._alert_seq = snap.seq
+            rule = self.alerts.evaluate(snap)
+            if rule is not None:
+                logger.info(f"Alert: {rule.metric} {format_value(rule.metric, getattr(snap, rule.metric))}")
+                self._alert_rule = rule
+                self._alert_until = time() + self.alert_seconds
+        return self._alert_rule is not None and time() < self._alert_until
+
+    def get_alert_image(self):
+        """The last fired rule: icon + label, live value, threshold."""
+        rule = self._alert_rule
+        value = getattr(self.sampler.snapshot, rule.metric)
+        values = (rule, format_value(rule.metric, value), self.config.primary, self.config.secondary)
+        if values == self._last_alert and self._alert_image is not None:
+            return self._alert_image
+
+        w, h = self.config.width, self.config.height
+        image = Image.new("1", (w, h), color=self.config.secondary)
+        draw = ImageDraw.Draw(image)
+
+        def draw_centered(text, y):
+            bbox = draw.textbbox((0, 0), text, font=self.FONT)
+            draw.text(((w - (bbox[2] - bbox[0])) / 2, y), text, font=self.FONT, fill=self.config.primary)
+
+        # Üst satır: ters renkli şerit içinde ikon + etiket
+        draw.rectangle((0, 0, w - 1, 11), fill=self.config.primary)
+        title = f"! {rule.label}"
+        icon = self._alert_icon(rule.metric)
+        title_w = draw.textlength(title, font=self.FONT) + (14 if icon else 0)
+        x = int((w - title_w) / 2)
+        if icon:
+            image.paste(self.config.secondary, (x, 0, x + icon.width, icon.height), icon)
+            x += 14
+        draw.text((x, -1), title, font=self.FONT, fill=self.config.secondary)
+
+        draw_centered(values[1], 13)
+        relation = ">" if rule.above else "<"
+        draw_centered(f"{relation} {format_value(rule.metric, rule.threshold)}", 26)
+
+        self._last_alert = values
+        self._alert_image = image
+        return image
+
+    def _alert_icon(self, metric):
+        if metric in ("net_down", "net_up"):
+            return self.net_down_icon if metric == "net_down" else self.net_up_icon
+        return {"cpu": self.cpu_icon, "gpu": self.gpu_icon, "ram": self.ram_icon,
+                "disk": self.disk_icon}.get(metric.split("_")[0])
+
+    def get_page_image(self, page):
+        """One of PAGES (graph_cpu, graph_gpu, graph_ram, cpu_cores, throughput, processes)."""
+        if page == THROUGHPUT_PAGE:
+            return self.get_throughput_image()
+        if page == PROCESSES_PAGE:
+            return self.get_processes_image()
+        self._touch()
+        snap = self.sampler.snapshot  # collector: yeni örneği geçmişe al
+        if page == CORES_PAGE:
+            return self.graphs.get_cores_image(snap)
+        interval = max(0.25, float(self.sampler.interval))
+        self.graphs.interval = interval
+        samples = min(self.history.capacity, max(2, int(round(self.graph_seconds / interval))))
+        return self.graphs.get_image(page, samples)
 
     def get_image(self):
+        # --- Data (sampler snapshot; bu thread sensöre dokunmaz) ---
+        self._touch()
+        snap = self.sampler.snapshot
+        cpu_temp = snap.cpu_temp
+        cpu_usage = int(round(snap.cpu_usage or 0))
+        gpu_temp = snap.gpu_temp
+        gpu_load = snap.gpu_load
+        ram_used = (snap.ram_used or 0) / (1024**3)
+        ram_total = (snap.ram_total or 0) / (1024**3)
+
+        # Ekrandaki metinler değişmediyse yeniden çizme
+        values = (
+            f"{int(cpu_temp)}°" if cpu_temp else "--",
+            f"{cpu_usage}%",
+            f"{int(gpu_temp)}°" if gpu_temp else "--",
+            f"{int(gpu_load) if gpu_load else 0}%",
+            f"{ram_used:.1f}G",
+            f"{int(ram_total)}GB",
+            self.config.primary, self.config.secondary,
+        )
+        if values == self._last_values and self._last_image is not None:
+            return self._last_image
+
+        cpu_temp_text, cpu_usage_text, gpu_temp_text, gpu_load_text, ram_used_text, ram_total_text = values[:6]
+        image = self._draw_columns((
+            (self.cpu_icon, cpu_temp_text, cpu_usage_text),
+            (self.gpu_icon, gpu_temp_text, gpu_load_text),
+            (self.ram_icon, ram_used_text, ram_total_text),
+        ))
+
+        self._last_values = values
+        self._last_image = image
+        return image
+
+    def get_throughput_image(self):
+        """Network down / up and disk read / write rates, same three-column layout."""
+        self._touch()
+        snap = self.sampler.snapshot
+        down, down_unit = format_rate(snap.net_down)
+        up, up_unit = format_rate(snap.net_up)
+        values = (
+            down, down_unit, up, up_unit,
+            format_rate_short(snap.disk_read, "R"), format_rate_short(snap.disk_write, "W"),
+            self.config.primary, self.config.secondary,
+        )
+        # Metinler önbellekten geldiği için değişmeyen değer aynı nesne
+        if values == self._last_throughput and self._throughput_image is not None:
+            return self._throughput_image
+
+        image = self._draw_columns((
+            (self.net_down_icon, down, down_unit),
+            (self.net_up_icon, up, up_unit),
+            (self.disk_icon, values[4], values[5]),
+        ))
+        self._last_throughput = values
+        self._throughput_image = image
+        return image
+
+    def get_processes_image(self):
+        """Top three processes by CPU: name, CPU %, resident memory."""
+        self.processes.start()
+        self.processes.touch()
+        rows = self.processes.snapshot
+        values = (rows, self.config.primary, self.config.secondary)
+        if values == self._last_processes and self._processes_image is not None:
+            return self._processes_image
+
         w, h = self.config.width, self.config.height
         image = Image.new("1", (w, h), color=self.config.secondary)
         draw = ImageDraw.Draw(image)
 
-        # --- Data Gathering ---
-        # 1. CPU
-        cpu_temp = self._get_lhm_sensor("Cpu", "Temperature", "Tctl")
-        if not cpu_temp:
-            cpu_temp = self._get_lhm_sensor("Cpu", "Temperature", "Package")
-        if not cpu_temp:
-            cpu_temp = self._get_lhm_sensor("Cpu", "Temperature", "Core")
-        if not cpu_temp:
-            cpu_temp = self._get_wmi_cpu_temp()
-        cpu_usage = int(round(psutil.cpu_percent(interval=None)))
-        
-        # 2. GPU
-        gpu_temp = self._get_lhm_sensor("Gpu", "Temperature", "Core")
-        if not gpu_temp:
-             gpu_temp = self._get_lhm_sensor("Gpu", "Temperature", "GPU")
-        gpu_load = self._get_lhm_sensor("Gpu", "Load", "Core")
-        if not gpu_load:
-            gpu_load = self._get_lhm_sensor("Gpu", "Load", "GPU")
-            
-        # 3. RAM
-        mem = psutil.virtual_memory()
-        ram_used = mem.used / (1024**3)
-        ram_percent = mem.percent
+        # Sağdan: RAM sütunu w-1'de, CPU sütunu 40 px solunda biter
+        ram_right = w - 1
+        cpu_right = w - 40
+        name_width = cpu_right - 34
+
+        def draw_right(text, right, y):
+            bbox = draw.textbbox((0, 0), text, font=self.FONT)
+            draw.text((right - (bbox[2] - bbox[0]), y), text, font=self.FONT, fill=self.config.primary)
+
+        if not rows:
+            draw_right("...", w // 2 + 8, 13)
+        for i, proc in enumerate(rows[:3]):
+            y = i * 13
+            draw.text((0, y), self._fit_name(draw, proc.name, name_width), font=self.FONT, fill=self.config.primary)
+            draw_right(f"{proc.cpu:.0f}%", cpu_right, y)
+            draw_right(self._format_memory(proc.rss), ram_right, y)
+
+        self._last_processes = values
+        self._processes_image = image
+        return image
+
+    def _fit_name(self, draw, name, width):
+        """Cut the process name to `width` pixels (cached per name)."""
+        key = (name, width)
+        fitted = self._fitted.get(key)
+        if fitted is None:
+            fitted = name
+            while fitted and draw.textlength(fitted, font=self.FONT) > width:
+                fitted = fitted[:-1]
+            if len(self._fitted) > 256:
+                self._fitted.clear()
+            self._fitted[key] = fitted
+        return fitted
+
+    @staticmethod
+    def _format_memory(rss):
+        gb = rss / (1024**3)
+        if gb >= 10:
+            return f"{gb:.0f}G"
+        if gb >= 1:
+            return f"{gb:.1f}G"
+        return f"{rss / (1024**2):.0f}M"
+
+    def _draw_columns(self, columns):
+        """Three columns of (icon, line 1, line 2)."""
+        w, h = self.config.width, self.config.height
+        image = Image.new("1", (w, h), color=self.config.secondary)
+        draw = ImageDraw.Draw(image)
 
         # --- Layout Constants ---
         # 3 Columns: 0-42, 43-85, 86-128
         col_width = w // 3
-        c1_x = 0
-        c2_x = col_width
-        c3_x = col_width * 2
         
         # Rows (Y positions)
         y_icon = 0
@@ -206,22 +410,9 @@ class HardwareMonitor:
                 ix = cx + (col_width - 12) // 2
                 image.paste(icon, (int(ix), cy))
 
-        # --- Column 1: CPU ---
-        paste_centered(self.cpu_icon, c1_x, y_icon)
-        t_val = f"{int(cpu_temp)}°" if cpu_temp else "--"
-        draw_centered(t_val, c1_x, y_text1)
-        draw_centered(f"{cpu_usage}%", c1_x, y_text2)
-
-        # --- Column 2: GPU ---
-        paste_centered(self.gpu_icon, c2_x, y_icon)
-        t_val = f"{int(gpu_temp)}°" if gpu_temp else "--"
-        draw_centered(t_val, c2_x, y_text1)
-        draw_centered(f"{int(gpu_load) if gpu_load else 0}%", c2_x, y_text2)
-
-        # --- Column 3: RAM ---
-        paste_centered(self.ram_icon, c3_x, y_icon)
-        draw_centered(f"{ram_used:.1f}G", c3_x, y_text1)
-        ram_total = mem.total / (1024**3)
-        draw_centered(f"{int(ram_total)}GB", c3_x, y_text2)
-
+        for i, (icon, text1, text2) in enumerate(columns):
+            cx = col_width * i
+            paste_centered(icon, cx, y_icon)
+            draw_centered(text1, cx, y_text1)
+            draw_centered(text2, cx, y_text2)
         return image
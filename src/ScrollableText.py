@@ -1,5 +1,7 @@
 
 
+from PIL import Image, ImageDraw
+
 from src.utils import normalize_text
 
 class ScrollableText:
@@ -24,6 +26,9 @@ class ScrollableText:
         self.custom_width = None  # Available width for text
         self.left_align = False  # If True, draw left-aligned starting at custom_x
 
+        # Pre-rendered text strip for blit_next_step (rasterized once per text)
+        self._strip = None
+
     def increase_step(self):
         self.intern_step += 1
         if self.max_step != 0 and self.intern_step > self.max_step:
@@ -47,6 +52,7 @@ class ScrollableText:
 
         self.content = normalize_text(content)
         self.steps_calculated = False
+        self._strip = None
 
     def draw_next_step(self, draw):
         self.increase_step()
@@ -146,3 +152,38 @@ class ScrollableText:
                     fill=self.config.primary
                 )
 
+    def _get_strip(self):
+        """Whole text rendered once into a 1-bit strip; used as a paste mask."""
+        if self._strip is None:
+            ascent, descent = self.font.getmetrics()
+            height = ascent + descent
+            width = max(1, int(self.font.getlength(self.content)) + 1)
+            strip = Image.new("1", (width, height), 0)
+            ImageDraw.Draw(strip).text((0, height / 2), self.content, font=self.font, anchor="lm", fill=1)
+            self._strip = strip
+        return self._strip
+
+    def blit_next_step(self, draw):
+        self.increase_step()
+        self.blit_step(draw, self.intern_step)
+
+    def blit_step(self, draw, step=-1):
+        """
+        Same output as draw_step in left-aligned mode, but pastes a window of
+        the pre-rendered strip instead of rasterizing the text every frame.
+        """
+        self.pre_calculate_scroll_metrics(draw)
+
+        if step < 0:
+            step = self.intern_step
+
+        scroll = 0
+        if self.need_scrolling:
+            if (step - self.config.pause_steps) > self.text_offset:
+                scroll = self.text_offset
+            elif step > self.config.pause_steps:
+                scroll = step - self.config.pause_steps
+
+        strip = self._get_strip()
+        window = strip.crop((scroll, 0, scroll + self._get_available_width(), strip.height))
+        draw.bitmap((self._get_left_edge(), self.pos_y - strip.height // 2), window, fill=self.config.primary)
@@ -3,6 +3,7 @@ OLED Customizer - Ultra Premium Settings GUI
 Frameless window, sidebar navigation, custom widgets, high-end aesthetics.
 """
 
+import sys
 import tkinter as tk
 from tkinter import ttk, colorchooser
 import logging
@@ -258,25 +259,39 @@ class SettingsGUI:
         self.vars["use_turkish_days"] = tk.BooleanVar(value=bool(self.prefs.get_preference("use_turkish_days")))
         self.vars["date_format"] = tk.BooleanVar(value=(str(self.prefs.get_preference("date_format")) == "24"))
         self.vars["player_style"] = tk.StringVar(value=self.prefs.get_preference("player_style") or "Standard")
+        self.vars["lyrics_folder"] = tk.StringVar(value=self.prefs.get_preference("lyrics_folder") or "")
+        self.vars["lyrics_show_next"] = tk.BooleanVar(value=bool(self.prefs.get_preference("lyrics_show_next")))
         # Display
         self.vars["display_timer"] = tk.BooleanVar(value=bool(self.prefs.get_preference("display_timer")))
         self.vars["display_player"] = tk.BooleanVar(value=bool(self.prefs.get_preference("display_player")))
         self.vars["display_hw_monitor"] = tk.BooleanVar(value=bool(self.prefs.get_preference("display_hw_monitor")))
+        self.vars["app_volume_overlay"] = tk.BooleanVar(value=bool(self.prefs.get_preference("app_volume_overlay")))
+        self.vars["app_volume_follow_focus"] = tk.BooleanVar(value=bool(self.prefs.get_preference("app_volume_follow_focus")))
         # Spotify
         self.vars["spotify_enabled"] = tk.BooleanVar(value=bool(self.prefs.get_preference("spotify_enabled")))
         self.vars["spotify_client_id"] = tk.StringVar(value=self.prefs.get_preference("spotify_client_id") or "")
         self.vars["spotify_client_secret"] = tk.StringVar(value=self.prefs.get_preference("spotify_client_secret") or "")
         self.vars["spotify_redirect_uri"] = tk.StringVar(value=self.prefs.get_preference("spotify_redirect_uri") or "")
+        self.vars["spotify_midtrack_delay"] = tk.StringVar(value=str(self.prefs.get_preference("spotify_midtrack_delay") or "15"))
         self.vars["local_port"] = tk.StringVar(value=str(self.prefs.get_preference("local_port") or "2408"))
         # Hotkeys
         self.vars["hotkey_monitor"] = tk.StringVar(value=self.prefs.get_preference("hotkey_monitor") or "")
         self.vars["hotkey_mute"] = tk.StringVar(value=self.prefs.get_preference("hotkey_mute") or "")
+        for key in ("hotkey_cycle_screen", "hotkey_player_style", "hotkey_play_pause", "hotkey_next_track", "hotkey_app_volume"):
+            self.vars[key] = tk.StringVar(value=self.prefs.get_preference(key) or "")
         # RGB
         self.vars["rgb_enabled"] = tk.BooleanVar(value=bool(self.prefs.get_preference("rgb_enabled")))
         # Advanced
         self.vars["scrollbar_padding"] = tk.StringVar(value=str(self.prefs.get_preference("scrollbar_padding") or "2"))
         self.vars["text_padding_left"] = tk.StringVar(value=str(self.prefs.get_preference("text_padding_left") or "30"))
         self.vars["auto_launch_gg"] = tk.BooleanVar(value=bool(self.prefs.get_preference("auto_launch_gg")))
+        self.vars["hw_sample_interval"] = tk.StringVar(value=str(self.prefs.get_preference("hw_sample_interval") or "1.0"))
+        self.vars["hw_graph_seconds"] = tk.StringVar(value=str(self.prefs.get_preference("hw_graph_seconds") or "120"))
+        self.vars["hw_net_interface"] = tk.StringVar(value=self.prefs.get_preference("hw_net_interface") or "All")
+        self.vars["hw_disk"] = tk.StringVar(value=self.prefs.get_preference("hw_disk") or "All")
+        self.vars["hw_isolated_collector"] = tk.BooleanVar(value=bool(self.prefs.get_preference("hw_isolated_collector")))
+        self.vars["hw_alerts_enabled"] = tk.BooleanVar(value=bool(self.prefs.get_preference("hw_alerts_enabled")))
+        self.vars["hw_log_enabled"] = tk.BooleanVar(value=bool(self.prefs.get_preference("hw_log_enabled")))
 
     def _create_pages(self):
         # -- GENERAL PAGE --
@@ -294,9 +309,13 @@ class SettingsGUI:
         self._toggle_row(p_disp, "Enable Clock", self.vars["display_timer"], 
                           command=lambda: self._exclusive_toggle("display_timer", "display_hw_monitor"))
         self._toggle_row(p_disp, "Enable Music Info", self.vars["display_player"])
-        self._dropdown_row(p_disp, "Player Style", self.vars["player_style"], ["Standard", "Compact", "Centered", "Ticker", "Minimal"], command=self._quick_save)
+        self._dropdown_row(p_disp, "Player Style", self.vars["player_style"], ["Standard", "Compact", "Centered", "Ticker", "Minimal", "Cover", "Lyrics"], command=self._quick_save)
+        self._entry_row(p_disp, "Lyrics Folder (.lrc)", self.vars["lyrics_folder"], width=25)
+        self._toggle_row(p_disp, "Show Next Lyrics Line", self.vars["lyrics_show_next"])
         self._toggle_row(p_disp, "Always Show System Stats", self.vars["display_hw_monitor"],
                           command=lambda: self._exclusive_toggle("display_hw_monitor", "display_timer"))
+        self._toggle_row(p_disp, "Show App Volume Changes", self.vars["app_volume_overlay"])
+        self._toggle_row(p_disp, "Show Foreground App Volume", self.vars["app_volume_follow_focus"])
         self.pages["Display"] = p_disp
         
         # -- SPOTIFY PAGE --
@@ -307,6 +326,7 @@ class SettingsGUI:
         self._entry_row(p_spotify, "Spotify Client Secret", self.vars["spotify_client_secret"], width=25, show="*")
         self._entry_row(p_spotify, "Redirect URI", self.vars["spotify_redirect_uri"], width=25)
         self._entry_row(p_spotify, "Connection Port", self.vars["local_port"])
+        self._entry_row(p_spotify, "Mid-track Poll (s)", self.vars["spotify_midtrack_delay"])
         
         # Add a help label
         help_frame = tk.Frame(p_spotify, bg=Colors.CONTENT)
@@ -321,6 +341,11 @@ class SettingsGUI:
         self._header(p_hot, "⌨️ Keyboard Shortcuts")
         self._hotkey_row(p_hot, "Show System Stats Key", self.vars["hotkey_monitor"])
         self._hotkey_row(p_hot, "Mute Microphone Key", self.vars["hotkey_mute"])
+        self._hotkey_row(p_hot, "Cycle Screen Key", self.vars["hotkey_cycle_screen"])
+        self._hotkey_row(p_hot, "Next Player Style Key", self.vars["hotkey_player_style"])
+        self._hotkey_row(p_hot, "Play / Pause Key", self.vars["hotkey_play_pause"])
+        self._hotkey_row(p_hot, "Next Track Key", self.vars["hotkey_next_track"])
+        self._hotkey_row(p_hot, "Show App Volume Key", self.vars["hotkey_app_volume"])
         self.pages["Hotkeys"] = p_hot
         
         # -- LIGHTING PAGE --
@@ -344,6 +369,32 @@ class SettingsGUI:
         self._toggle_row(p_adv, "Auto-Launch SteelSeries GG", self.vars["auto_launch_gg"])
         tk.Label(p_adv, text="   Automatically starts SteelSeries GG if not running.", 
                  font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        self._entry_row(p_adv, "Sensor Interval (s)", self.vars["hw_sample_interval"])
+        tk.Label(p_adv, text="   How often hardware sensors are read while stats are shown.", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        self._entry_row(p_adv, "Graph Window (s)", self.vars["hw_graph_seconds"])
+        tk.Label(p_adv, text="   Time span shown on the CPU / GPU / RAM graph screens (max 600).", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        nics, disks = self._io_devices()
+        self._dropdown_row(p_adv, "Network Interface", self.vars["hw_net_interface"], ["All", *nics])
+        self._dropdown_row(p_adv, "Disk", self.vars["hw_disk"], ["All", *disks])
+        tk.Label(p_adv, text="   Device shown on the throughput screen.", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        self._toggle_row(p_adv, "Isolated Sensor Process", self.vars["hw_isolated_collector"])
+        tk.Label(p_adv, text="   Reads sensors in a separate process that restarts if a driver hangs.", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        self._toggle_row(p_adv, "Hardware Alerts", self.vars["hw_alerts_enabled"])
+        tk.Label(p_adv, text="   Shows an alert when a sensor crosses a limit (rules: \"hw_alerts\" in config.json).", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
+
+        self._toggle_row(p_adv, "Sensor Log", self.vars["hw_log_enabled"])
+        tk.Label(p_adv, text="   Records every sample to sensor_logs/sensors.bin (read with tools/sensor_log.py).", 
+                 font=FONT_SMALL, fg=Colors.TEXT_DIM, bg=Colors.CONTENT).pack(anchor="w", pady=(0, 10))
         self.pages["Advanced"] = p_adv
 
     def _switch_page(self, page_name):
@@ -376,9 +427,15 @@ class SettingsGUI:
         try:
             for k, v in self.vars.items():
                 val = v.get()
-                if k in ["scrollbar_padding", "text_padding_left", "local_port"]:
+                if k in ["scrollbar_padding", "text_padding_left", "local_port", "hw_graph_seconds"]:
                     try: val = int(val)
                     except: val = 0
+                elif k == "hw_sample_interval":
+                    try: val = float(val)
+                    except: val = 1.0
+                elif k == "spotify_midtrack_delay":
+                    try: val = float(val)
+                    except: val = 15.0
                 elif k == "date_format":
                     val = 24 if val else 12
                 self.prefs.preferences[k] = val
@@ -409,6 +466,15 @@ class SettingsGUI:
         switch = ToggleSwitch(f, var, command=command)
         switch.pack(side="right", padx=15)
 
+    @staticmethod
+    def _io_devices():
+        """Network interface and disk names for the throughput screen dropdowns."""
+        try:
+            import psutil
+            return sorted(psutil.net_io_counters(pernic=True)), sorted(psutil.disk_io_counters(perdisk=True) or {})
+        except Exception:
+            return [], []
+
     def _dropdown_row(self, parent, label, var, options, command=None):
         f = self._row_frame(parent)
         tk.Label(f, text=label, font=FONT_BODY, fg=Colors.TEXT_MAIN, bg=Colors.CARD_BG).pack(side="left", padx=15)
@@ -455,8 +521,13 @@ class SettingsGUI:
                 if e.keysym == "Escape":
                     popup.destroy()
                     return
-                key_str = f"Key.{e.keysym.lower()}"
-                var.set(key_str)
+                if e.keysym.split("_")[0] in ("Control", "Shift", "Alt", "Meta", "Super", "Win"):
+                    return  # kombinasyonun asıl tuşunu bekle
+                # Ctrl+M gibi kombinasyonlar "ctrl+m" olarak kaydedilir
+                alt_mask = 0x20000 if sys.platform == "win32" else 0x8
+                mods = [name for name, mask in (("ctrl", 0x4), ("alt", alt_mask), ("shift", 0x1)) if e.state & mask]
+                key = e.keysym.lower() if len(e.keysym) == 1 else f"Key.{e.keysym.lower()}"
+                var.set("+".join(mods + [key]))
                 popup.destroy()
                 
             popup.bind("<Key>", on_key)
@@ -490,10 +561,18 @@ class SettingsGUI:
                 val = v.get()
                 logger.info(f"Saving {k}: {val}")
                 
-                if k in ["scrollbar_padding", "text_padding_left", "local_port"]:
+                if k in ["scrollbar_padding", "text_padding_left", "local_port", "hw_graph_seconds"]:
                     try: val = int(val)
                     except: val = 0
                     self.prefs.preferences[k] = val
+                elif k == "hw_sample_interval":
+                    try: val = float(val)
+                    except: val = 1.0
+                    self.prefs.preferences[k] = val
+                elif k == "spotify_midtrack_delay":
+                    try: val = float(val)
+                    except: val = 15.0
+                    self.prefs.preferences[k] = val
                 elif k == "date_format":
                     self.prefs.preferences[k] = 24 if val else 12
                 else:
@@ -259,13 +259,18 @@ class SpotifyAPI:
             
             item = data["item"]
             artists = ", ".join([a["name"] for a in item.get("artists", [])])
+
+            # Kapaklar büyükten küçüğe (640/300/64): OLED için en küçüğü yeter
+            images = (item.get("album") or {}).get("images") or []
+            artwork = images[-1].get("url", "") if images else ""
             
             return {
                 "title": item.get("name", "Unknown"),
                 "artist": artists,
                 "duration": item.get("duration_ms", 0),
                 "progress": data.get("progress_ms", 0),
-                "paused": not data.get("is_playing", False)
+                "paused": not data.get("is_playing", False),
+                "artwork": artwork
             }
         except Exception as e:
             logger.error(f"Failed to fetch song: {e}")
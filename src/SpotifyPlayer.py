@@ -4,6 +4,8 @@ from src.ScrollableText import ScrollableText
 
 
 class SpotifyPlayer:
+    STYLES = ["Standard", "Compact", "Centered", "Ticker", "Minimal", "Cover", "Lyrics"]
+
     def __init__(self, config, preferences, fps=None):
         # ORİJİNAL FONTLAR
         self.ARTIST_FONT = ImageFont.truetype(
@@ -44,6 +46,24 @@ class SpotifyPlayer:
         self.previous_image = None
         self.source = "spotify"
 
+        # Kapak: DisplayManager AlbumArt'ı bağlar; ref = URL ya da byte'lar
+        self.album_art = None
+        self.cover_ref = None
+        self.cover_key = None
+
+        # Ticker: DisplayManager bir SpectrumAnalyzer bağlarsa gerçek spektrum çizilir
+        self.spectrum = None
+        self._spectrum_seq = -1
+
+        # Lyrics style: DisplayManager LyricsLibrary'yi bağlar
+        self.lyrics_library = None
+        self.lyrics = None
+        self.lyric_index = -2
+        self._lyrics_track = None
+        self.show_next_lyric = bool(preferences.get_preference('lyrics_show_next'))
+        self.lyric_line = ScrollableText(self.config, self.TITLE_FONT, "", 12)
+        self.lyric_next = ScrollableText(self.config, self.ARTIST_FONT, "", 28)
+
     def set_paused(self, paused=True):
         self.paused = paused
 
@@ -60,6 +80,14 @@ class SpotifyPlayer:
         self.title.set_step(0)
         self.artist.set_step(0)
 
+    def set_cover(self, ref):
+        """Cover reference (URL or image bytes) of the current track."""
+        if ref is self.cover_ref or ref == self.cover_ref:
+            return
+        self.cover_ref = ref or None
+        self.cover_key = None
+        self.changed = True
+
     def is_playing(self):
         return self.song_position != self.song_duration
 
@@ -116,11 +144,25 @@ class SpotifyPlayer:
         ):
             return True
 
+        if getattr(self, "style", "Standard") == "Lyrics":
+            return self._lyrics_will_change()
+        if getattr(self, "style", "Standard") == "Ticker" and self.spectrum is not None:
+            self.spectrum.touch()
+            if self.spectrum.seq != self._spectrum_seq:
+                return True
+
         return self.title.will_it_change() or self.artist.will_it_change()
 
+    def _lyrics_will_change(self):
+        lyrics = self.lyrics
+        if lyrics is not None and not self.paused:
+            upcoming = self.lyric_index + 1
+            if upcoming < len(lyrics.times) and lyrics.times[upcoming] <= self.song_position + 1000 / self.fps:
+                return True
+        return self.lyric_line.will_it_change() or self.lyric_next.will_it_change()
+
     def set_style(self, style="Standard"):
-        valid_styles = ["Standard", "Compact", "Centered", "Ticker", "Minimal"]
-        if style not in valid_styles:
+        if style not in self.STYLES:
             style = "Standard"
         self.style = style
         self.changed = True
@@ -136,6 +178,9 @@ class SpotifyPlayer:
             self.step += 1
             self.artist.increase_step()
             self.title.increase_step()
+            if getattr(self, "style", "Standard") == "Lyrics":
+                self.lyric_line.increase_step()
+                self.lyric_next.increase_step()
 
             if not self.paused:
                 self.increase_timer()
@@ -180,6 +225,10 @@ class SpotifyPlayer:
                 self._draw_ticker(draw, image)
             elif style == "Minimal":
                 self._draw_minimal(draw, image)
+            elif style == "Cover":
+                self._draw_cover(draw, image)
+            elif style == "Lyrics":
+                self._draw_lyrics(draw, image)
             else:
                 self._draw_standard(draw, image)
         except Exception as e:
@@ -344,14 +393,20 @@ class SpotifyPlayer:
         
         draw.text((self.config.width - ticker_offset, 22), ticker_text, font=self.ARTIST_FONT, fill=self.config.primary)
         
-        # Fake VU meter bars on right (decorative, use song position as seed)
+        # Spectrum bars on right: real levels from the SpectrumAnalyzer thread
+        # (only the published array is read here), decorative without one
         meter_x = self.config.width - 28
-        bar_heights = [
-            8 + (self.step % 5),
-            12 + ((self.step + 2) % 7),
-            6 + ((self.step + 1) % 4),
-            10 + (self.step % 6),
-        ]
+        if self.spectrum is not None:
+            self.spectrum.touch()
+            self._spectrum_seq = self.spectrum.seq
+            bar_heights = [1 + int(level * 17) for level in self.spectrum.levels[:4]]
+        else:
+            bar_heights = [
+                8 + (self.step % 5),
+                12 + ((self.step + 2) % 7),
+                6 + ((self.step + 1) % 4),
+                10 + (self.step % 6),
+            ]
         for i, h in enumerate(bar_heights):
             x = meter_x + i * 6
             draw.rectangle((x, 18 - h, x + 4, 18), fill=self.config.primary)
@@ -404,4 +459,91 @@ class SpotifyPlayer:
             pct = self.song_position / self.song_duration
             draw.line((0, 38, int(pct * self.config.width), 38), fill=self.config.primary, width=2)
 
+    # ========== STYLE: COVER ==========
+    # Dithered album art on the left (40x40, 24x24 on short screens),
+    # Title/Artist scrolling on the right, progress bar + time below them.
+    def _draw_cover(self, draw, image):
+        size = 40 if self.config.height >= 40 else 24
+        text_x = size + 4
+
+        self.title.pos_y = 7
+        self.title.custom_x = text_x
+        self.title.custom_width = self.config.width - text_x
+        self.title.steps_calculated = False
+        self.title.draw_next_step(draw)
 
+        self.artist.pos_y = 18
+        self.artist.custom_x = text_x
+        self.artist.custom_width = self.config.width - text_x
+        self.artist.steps_calculated = False
+        self.artist.draw_next_step(draw)
+
+        # MASK: Clear cover area (left) to clip overflowing text
+        draw.rectangle((0, 0, text_x - 1, self.config.height), fill=self.config.secondary)
+
+        # Kapak hazır değilse (worker thread'de iniyor/dither'lanıyor) kaynak ikonu
+        if self.cover_key is None and self.cover_ref and self.album_art:
+            self.cover_key = self.album_art.request(self.cover_ref, size)
+        cover = self.album_art.get(self.cover_key) if self.album_art else None
+        top = max(0, (self.config.height - size) // 2)
+        if cover is not None:
+            draw.bitmap((0, top), cover, fill=self.config.primary)
+        else:
+            draw.rectangle((0, top, size - 1, top + size - 1), outline=self.config.primary)
+            self._draw_icon(image, (size // 2 - 9, top + size // 2 - 9))
+
+        # Progress bar + position under the text
+        bar_y = 26
+        draw.rectangle((text_x, bar_y, self.config.width - 1, bar_y + 3), outline=self.config.primary)
+        if self.song_duration > 0:
+            pct = self.song_position / self.song_duration
+            fill_w = int(pct * (self.config.width - 1 - text_x))
+            draw.rectangle((text_x, bar_y, text_x + fill_w, bar_y + 3), fill=self.config.primary)
+
+        pos_sec = int(round(self.song_position / 1000))
+        dur_sec = int(round(self.song_duration / 1000))
+        draw.text((text_x, 34), f"{pos_sec // 60}:{pos_sec % 60:02d}", font=self.DURATION_FONT, fill=self.config.primary, anchor="lm")
+        draw.text((self.config.width - 1, 34), f"{dur_sec // 60}:{dur_sec % 60:02d}", font=self.DURATION_FONT, fill=self.config.primary, anchor="rm")
+
+    # ========== STYLE: LYRICS ==========
+    # Current .lrc line (scrolling if long), optionally the next line below,
+    # thin progress line at the bottom. Without lyrics: title + artist.
+    def _draw_lyrics(self, draw, image):
+        track = (self.artist.content, self.title.content)
+        if track != self._lyrics_track:
+            self._lyrics_track = track
+            self.lyrics = self.lyrics_library.find(*track) if self.lyrics_library else None
+            self.lyric_index = -2
+
+        # Satır bisect ile bulunur; metin sadece satır değişince yeniden hazırlanır
+        index = self.lyrics.index_at(self.song_position) if self.lyrics else -1
+        if index != self.lyric_index:
+            self.lyric_index = index
+            if self.lyrics is None:
+                current, upcoming = self.title.content, self.artist.content
+            else:
+                lines = self.lyrics.lines
+                current = (lines[index] if index >= 0 else "") or "..."
+                upcoming = lines[index + 1] if index + 1 < len(lines) else ""
+            self._set_lyric_text(self.lyric_line, current, 12 if self.show_next_lyric else 18)
+            self._set_lyric_text(self.lyric_next, upcoming, 28)
+
+        self.lyric_line.blit_next_step(draw)
+        if self.show_next_lyric:
+            self.lyric_next.blit_next_step(draw)
+
+        if self.song_duration > 0:
+            pct = self.song_position / self.song_duration
+            draw.line((0, self.config.height - 1, int(pct * self.config.width), self.config.height - 1), fill=self.config.primary)
+
+    def _set_lyric_text(self, text, content, pos_y):
+        text.set_text(content)
+        text.intern_step = 0
+        text.pos_y = pos_y
+        # Kısa satırlar ortalanır, uzunlar soldan kayar
+        width = int(text.font.getlength(text.content))
+        available = self.config.width - 4
+        text.custom_width = available
+        text.custom_x = 2 + max(0, (available - width) // 2)
+        if width < available:
+            text.custom_width = available - (text.custom_x - 2)
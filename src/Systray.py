@@ -203,6 +203,18 @@ def run_systray_async(display_manager):
                     radio=True,
                     checked=lambda item: display_manager.user_preferences.get_preference("player_style") == "Minimal"
                 ),
+                Item(
+                    "Cover",
+                    lambda icon, item: set_player_style(icon, "Cover"),
+                    radio=True,
+                    checked=lambda item: display_manager.user_preferences.get_preference("player_style") == "Cover"
+                ),
+                Item(
+                    "Lyrics",
+                    lambda icon, item: set_player_style(icon, "Lyrics"),
+                    radio=True,
+                    checked=lambda item: display_manager.user_preferences.get_preference("player_style") == "Lyrics"
+                ),
             ),
             enabled=lambda item: display_manager.enabled,
         ),
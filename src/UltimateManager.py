@@ -6,6 +6,11 @@ import psutil
 import requests
 import math
 
+# Tek başına çalıştırıldığında (python src/UltimateManager.py) src paketini bul
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.media_fallback import NowPlayingFile
+
 # --- AYARLAR ---
 CORE_PROPS_PATH = "C:\\ProgramData\\SteelSeries\\SteelSeries Engine 3\\coreProps.json"
 NOW_PLAYING_FILE = "nowplaying.json"  # Senin YT/Spotify verisinin yazıldığı dosya
@@ -88,17 +93,12 @@ def main():
     register_app()
     
     last_state = "init"
+    now_playing = NowPlayingFile(NOW_PLAYING_FILE)  # sadece dosya değişince parse eder
     
     while True:
         try:
             # 1. Müzik Verisini Oku
-            data = None
-            if os.path.exists(NOW_PLAYING_FILE):
-                try:
-                    with open(NOW_PLAYING_FILE, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                except:
-                    pass
+            data = now_playing.read()
 
             # Veri var mı ve güncel mi? (Pause değilse)
             is_playing = False
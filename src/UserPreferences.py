@@ -19,15 +19,33 @@ class UserPreferences:
         "display_seconds": True,
         "timer_threshold": 2,
         "spotify_fetch_delay": 2,
+        "spotify_midtrack_delay": 15,
         "extended_font": True,
         "display_timer": True,
         "display_player": True,
         "display_player": True,
         "display_hw_monitor": False,
+        "hw_sample_interval": 1.0,
+        "hw_isolated_collector": False,
+        "hw_graph_seconds": 120,
+        "hw_net_interface": "All",
+        "hw_disk": "All",
+        "hw_alerts_enabled": False,
+        "hw_log_enabled": False,
+        "hw_log_max_mb": 8,
+        "hw_alerts": [
+            {"metric": "cpu_temp", "above": 90, "for": 5, "clear": 85, "cooldown": 120},
+            {"metric": "gpu_load", "above": 99, "for": 30, "clear": 90, "cooldown": 300}
+        ],
         "use_turkish_days": False,
         "clock_style": "Standard",
         "hotkey_monitor": "Key.insert",
         "hotkey_mute": "Key.pause",
+        "hotkey_cycle_screen": "",
+        "hotkey_player_style": "",
+        "hotkey_play_pause": "",
+        "hotkey_next_track": "",
+        "hotkey_app_volume": "",
         "rgb_enabled": False,
         "rgb_color": [0, 212, 170],
         "primary": 1,
@@ -38,7 +56,11 @@ class UserPreferences:
         "height": 40,
         "height": 40,
         "auto_launch_gg": False,
-        "player_style": "Standard"
+        "player_style": "Standard",
+        "lyrics_folder": "",
+        "lyrics_show_next": True,
+        "app_volume_overlay": False,
+        "app_volume_follow_focus": False
     }
 
     def __init__(self):
@@ -5,9 +5,47 @@ import logging
 
 logger = logging.getLogger("OLED Customizer.WindowsMedia")
 
+MAX_THUMBNAIL_BYTES = 4 * 1024 * 1024
+
+
 class WindowsMedia:
     def __init__(self):
         self.manager = None
+        # Thumbnail stream'i sadece parça değişince okunur
+        self._thumbnail_key = None
+        self._thumbnail = None
+        self._art_available = True  # winrt storage streams paketi yoksa kapak okunmaz
+
+    async def _read_thumbnail(self, info, key):
+        if not self._art_available:
+            return None
+        if key == self._thumbnail_key:
+            return self._thumbnail
+        try:
+            from winrt.windows.storage.streams import Buffer, DataReader, InputStreamOptions
+        except ImportError as e:
+            logger.warning(f"Album art disabled, winrt storage streams not available: {e}")
+            self._art_available = False
+            return None
+        if not info.thumbnail:
+            # Tarayıcılar kapağı başlıktan sonra set eder: sonraki poll'da tekrar bak
+            return None
+        self._thumbnail_key = key
+        self._thumbnail = None
+        try:
+            stream = await info.thumbnail.open_read_async()
+            size = min(int(stream.size), MAX_THUMBNAIL_BYTES)
+            if size <= 0:
+                return None
+            buffer = Buffer(size)
+            await stream.read_async(buffer, size, InputStreamOptions.READ_AHEAD)
+            reader = DataReader.from_buffer(buffer)
+            data = bytearray(buffer.length)
+            reader.read_bytes(data)
+            self._thumbnail = bytes(data)
+        except Exception as e:
+            logger.debug(f"Failed to read SMTC thumbnail: {e}")
+        return self._thumbnail
 
     async def _ensure_manager(self):
         if self.manager:
@@ -88,6 +126,7 @@ class WindowsMedia:
                     paused = False
                     
             source = current_session.source_app_user_model_id
+            thumbnail = await self._read_thumbnail(info, (source, title, artist, info.album_title))
             
             # Timeline might be None or zeros
             # We use -1 to indicate "unknown" so we don't force-reset the player to 0.
@@ -157,7 +196,9 @@ class WindowsMedia:
                 "paused": paused,
                 "progress": int(position * 1000) if position != -1 else -1,
                 "duration": int(duration * 1000) if duration > 0 else -1,
-                "source": (source or "").lower()
+                "source": (source or "").lower(),
+                "album": info.album_title,
+                "thumbnail": thumbnail
             }
 
         except Exception:
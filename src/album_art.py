@@ -0,0 +1,220 @@
+"""
+Album art for the 1-bit OLED.
+
+Covers arrive as a URL (Spotify `item.album.images`, the extension's
+Media Session artwork) or as raw image bytes (SMTC thumbnail). The render
+thread only ever calls `AlbumArt.request` (hash + enqueue, once per track)
+and `AlbumArt.get` (dict lookup). Downloading, downsampling and dithering
+happen on a worker thread; finished covers go into a bounded memory LRU and
+an on-disk cache, and `on_ready` is called so the render loop redraws.
+"""
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from queue import SimpleQueue
+
+import requests
+from PIL import Image, ImageOps
+
+try:
+    import numpy as np
+except ImportError:  # NumPy yoksa PIL'in Floyd-Steinberg'i kullanılır
+    np = None
+
+logger = logging.getLogger("OLED Customizer.AlbumArt")
+
+MAX_IMAGE_BYTES = 4 * 1024 * 1024
+DISK_CACHE_FILES = 512
+RETRY_FAILED_SECONDS = 60
+
+# Hata yayılım çekirdekleri: (dy, dx, ağırlık)
+FLOYD_STEINBERG = ((0, 1, 7 / 16), (1, -1, 3 / 16), (1, 0, 5 / 16), (1, 1, 1 / 16))
+# Atkinson hatanın sadece 6/8'ini dağıtır: küçük resimde daha temiz, kontrastlı
+ATKINSON = ((0, 1, 1 / 8), (0, 2, 1 / 8), (1, -1, 1 / 8), (1, 0, 1 / 8), (1, 1, 1 / 8), (2, 0, 1 / 8))
+KERNELS = {"atkinson": ATKINSON, "floyd": FLOYD_STEINBERG}
+
+
+def _default_cache_dir():
+    appdata = os.environ.get("APPDATA") or os.path.expanduser("~")
+    return os.path.join(appdata, "OLED Customizer", "album_art")
+
+
+@lru_cache(maxsize=8)
+def _wavefront_plan(height, width, kernel):
+    """
+    Pixel groups that can be quantized together. With both kernels a pixel
+    only receives error from pixels with a smaller x + 2y, so every line
+    x + 2y = t is independent: height*width pixels in width + 2*height
+    vectorized steps. Returns flat (source, output, targets) index arrays
+    per step into a buffer padded by 2 px left/right/bottom, so the kernel
+    never needs bounds checks.
+    """
+    stride = width + 4
+    ys, xs = np.divmod(np.arange(height * width), width)
+    t = xs + 2 * ys
+    order = np.argsort(t, kind="stable")
+    bounds = np.cumsum(np.bincount(t))[:-1]
+    offsets = np.array([dy * stride + dx for dy, dx, _ in kernel])
+    steps = []
+    for sy, sx in zip(np.split(ys[order], bounds), np.split(xs[order], bounds)):
+        src = sy * stride + sx + 2
+        steps.append((src, sy * width + sx, (offsets[:, None] + src[None, :]).ravel()))
+    weights = np.array([weight for _, _, weight in kernel], dtype=np.float32)[:, None]
+    return tuple(steps), weights
+
+
+def dither(gray, kernel=ATKINSON):
+    """Error-diffusion dither of a 2-D uint8 array -> bool array (True = lit)."""
+    height, width = gray.shape
+    steps, weights = _wavefront_plan(height, width, kernel)
+    buf = np.zeros((height + 2) * (width + 4), dtype=np.float32)
+    buf.reshape(height + 2, width + 4)[:height, 2:width + 2] = gray / np.float32(255.0)
+    out = np.empty(height * width, dtype=bool)
+    for src, dst, targets in steps:
+        old = buf[src]
+        new = old >= 0.5
+        out[dst] = new
+        # Aynı adımda iki piksel aynı hedefe hata yazabilir: add.at biriktirir
+        np.add.at(buf, targets, (weights * (old - new)).ravel())
+    return out.reshape(height, width)
+
+
+def render_cover(data, size, kernel="atkinson"):
+    """Encoded image bytes -> size x size mode "1" image."""
+    image = Image.open(io.BytesIO(data))
+    image.draft("L", (size * 2, size * 2))  # JPEG: küçük ölçekte decode et
+    image = ImageOps.fit(image.convert("L"), (size, size), Image.LANCZOS)
+    image = ImageOps.autocontrast(image, cutoff=1)
+    if np is None or kernel == "floyd":
+        # PIL'in C Floyd-Steinberg'i aynı sonucu verir ve çok daha hızlı
+        return image.convert("1")
+    return Image.fromarray(dither(np.asarray(image), KERNELS.get(kernel, ATKINSON)))
+
+
+class AlbumArt:
+    def __init__(self, kernel="atkinson", memory_items=32, cache_dir=None, on_ready=None, fetch_timeout=5):
+        self.kernel = kernel
+        self.memory_items = memory_items
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.on_ready = on_ready
+        self.fetch_timeout = fetch_timeout
+
+        self._memory = OrderedDict()    # key -> Image ("1")
+        self._pending = set()
+        self._failed = {}               # key -> time.monotonic() of the failure
+        self._lock = threading.Lock()
+        self._queue = SimpleQueue()
+        self._session = requests.Session()
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def request(self, ref, size):
+        """
+        Returns the cache key for `ref` (URL or bytes) and queues the cover
+        if it is not in memory yet. Cheap; safe to call from the render loop.
+        """
+        if not ref:
+            return None
+        digest = hashlib.sha1(ref if isinstance(ref, bytes) else ref.encode("utf-8")).hexdigest()
+        key = f"{digest}_{size}_{self.kernel}"
+        with self._lock:
+            if key in self._memory or key in self._pending:
+                return key
+            failed_at = self._failed.get(key)
+            if failed_at is not None and time.monotonic() - failed_at < RETRY_FAILED_SECONDS:
+                return key
+            self._pending.add(key)
+        self._queue.put((key, ref, size))
+        return key
+
+    def get(self, key):
+        """Finished cover for `key`, or None while it is still being prepared."""
+        if key is None:
+            return None
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+            return image
+
+    def _store(self, key, image):
+        with self._lock:
+            self._pending.discard(key)
+            if image is None:
+                self._failed[key] = time.monotonic()
+                return
+            self._failed.pop(key, None)
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _worker(self):
+        self._prune_disk()
+        while True:
+            key, ref, size = self._queue.get()
+            image = None
+            try:
+                image = self._load(key, ref, size)
+            except Exception as e:
+                logger.debug(f"Album art failed: {e}")
+            self._store(key, image)
+            if image is not None and self.on_ready:
+                try:
+                    self.on_ready()
+                except Exception:
+                    pass
+
+    def _load(self, key, ref, size):
+        path = os.path.join(self.cache_dir, key + ".png")
+        try:
+            with Image.open(path) as cached:
+                image = cached.convert("1")
+            os.utime(path)  # disk cache'i de LRU gibi buda
+            return image
+        except (OSError, ValueError):
+            pass
+
+        data = ref if isinstance(ref, bytes) else self._download(ref)
+        if not data:
+            return None
+        image = render_cover(data, size, self.kernel)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = path + ".tmp"
+            image.save(tmp, "PNG")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Album art cache write failed: {e}")
+        return image
+
+    def _download(self, url):
+        if not url.startswith(("http://", "https://")):
+            return None
+        response = self._session.get(url, timeout=self.fetch_timeout, stream=True)
+        if response.status_code != 200:
+            return None
+        data = response.raw.read(MAX_IMAGE_BYTES + 1, decode_content=True)
+        response.close()
+        return data if len(data) <= MAX_IMAGE_BYTES else None
+
+    def _prune_disk(self):
+        """Keep the disk cache bounded: drop the oldest files beyond DISK_CACHE_FILES."""
+        try:
+            entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".png")]
+        except OSError:
+            return
+        if len(entries) <= DISK_CACHE_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - DISK_CACHE_FILES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
@@ -0,0 +1,215 @@
+import logging
+import os
+from collections import OrderedDict
+from queue import Empty, SimpleQueue
+from time import monotonic, time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.audio_sessions import create_session_provider
+from src.image_utils import fetch_content_path
+
+logger = logging.getLogger("OLED Customizer.AppVolumeOverlay")
+
+BROWSERS = ("chrome", "msedge", "firefox", "opera", "brave", "vivaldi")
+
+# follow_focus: ön plan penceresinin pid'i bu aralıkla okunur (iki user32 çağrısı)
+FOCUS_CHECK_SECONDS = 0.5
+
+
+def _icon_file(process):
+    if "spotify" in process:
+        return "spotify-18.png"
+    if any(b in process for b in BROWSERS):
+        return "youtube-18.png"
+    return "media-18.png"
+
+
+class AppVolumeOverlay:
+    """
+    Shows one application's session volume (Spotify, browser, Discord, a
+    game...). Two modes, both off by default:
+      - enabled: appears when an app's session volume / mute changes (the
+        app itself never changes session volumes)
+      - follow_focus: appears when the foreground window switches to an app
+        that has an audio session
+    `show_focus()` shows the foreground app on demand (falling back to the
+    app that most recently started playing). Session events arrive through
+    a queue, like VolumeOverlay; the icon + name header of each app is
+    rendered once.
+    """
+
+    def __init__(self, config, timeout=1.5, provider=None, on_change=None, header_cache=16):
+        self.config = config
+        self.timeout = timeout
+        self.on_change = on_change
+        self.enabled = False
+        self.follow_focus = False
+        self._focus_pid = None
+        self._focus_checked = 0.0
+
+        self.font = ImageFont.truetype(font=fetch_content_path('fonts/MunroSmall.ttf'), size=10)
+        self._icons = {}
+        self._headers = OrderedDict()   # (process, name) -> 1-bit header image
+        self.header_cache = header_cache
+        self.headers_rendered = 0
+
+        self._events = SimpleQueue()
+        self._shown_key = None
+        self._last_change = 0.0
+
+        self.provider = provider if provider is not None else create_session_provider()
+        if self.provider is not None:
+            self.provider.start(self._emit)
+
+    def _emit(self, event):
+        self._events.put(event)
+        if self.on_change:
+            self.on_change()
+
+    def close(self):
+        if self.provider is not None:
+            self.provider.close()
+
+    def _foreground_session(self, sessions):
+        pid, process = self.provider.foreground()
+        if pid is None:
+            return None
+        for info in sessions.values():
+            if info.pid == pid:
+                return info
+        # Tarayıcılar sesi ayrı bir alt süreçten çalar: exe adına göre eşle
+        for info in sessions.values():
+            if process and info.process == process:
+                return info
+        return None
+
+    def focus_session(self):
+        """Session of the foreground app, else the one that most recently became audible."""
+        if self.provider is None:
+            return None
+        sessions = self.provider.sessions
+        if not sessions:
+            return None
+        info = self._foreground_session(sessions)
+        if info is not None:
+            return info
+        audible = [info for info in sessions.values() if info.active]
+        if audible:
+            return max(audible, key=lambda info: info.active_since)
+        return None
+
+    def show_focus(self):
+        info = self.focus_session()
+        if info is not None:
+            self._shown_key = info.key
+            self._last_change = time()
+        return info is not None
+
+    def _check_focus(self):
+        """follow_focus: show the new foreground app's session when the foreground pid changes."""
+        now = monotonic()
+        if now - self._focus_checked < FOCUS_CHECK_SECONDS:
+            return False
+        self._focus_checked = now
+        pid = self.provider.foreground_pid()
+        if pid == self._focus_pid:
+            return False
+        self._focus_pid = pid
+        sessions = self.provider.sessions
+        info = self._foreground_session(sessions) if sessions and pid is not None else None
+        if info is None:
+            return False
+        self._shown_key = info.key
+        self._last_change = time()
+        return True
+
+    def update(self):
+        """Apply queued session events. Returns True when the overlay should redraw."""
+        changed = self.follow_focus and self.provider is not None and self._check_focus()
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except Empty:
+                break
+            if event.kind == "volume" and self.enabled:
+                self._shown_key = event.key
+                self._last_change = time()
+                changed = True
+            elif event.key is None or event.key == self._shown_key:
+                changed = changed or self.should_display()
+        return changed
+
+    def should_display(self) -> bool:
+        if self._shown_key is None or self.provider is None:
+            return False
+        if self._shown_key not in self.provider.sessions:
+            return False
+        return (time() - self._last_change) < self.timeout
+
+    def _icon(self, process):
+        filename = _icon_file(process)
+        if filename not in self._icons:
+            icon = None
+            try:
+                path = fetch_content_path(f"assets/icons/{filename}")
+                if os.path.exists(path):
+                    icon = Image.open(path).convert("1")
+            except Exception:
+                pass
+            self._icons[filename] = icon
+        return self._icons[filename]
+
+    def _header(self, info):
+        """Icon + name strip, rendered once per app."""
+        key = (info.process, info.name)
+        header = self._headers.get(key)
+        if header is not None:
+            self._headers.move_to_end(key)
+            return header
+
+        w = self.config.width
+        header = Image.new("1", (w, 20), color=self.config.secondary)
+        icon = self._icon(info.process)
+        if icon is not None:
+            header.paste(icon, (2, 1))
+
+        draw = ImageDraw.Draw(header)
+        text = info.name
+        max_width = w - 26
+        if draw.textlength(text, font=self.font) > max_width:
+            while text and draw.textlength(text + "..", font=self.font) > max_width:
+                text = text[:-1]
+            text += ".."
+        draw.text((24, 5), text, font=self.font, fill=self.config.primary)
+
+        self._headers[key] = header
+        self.headers_rendered += 1
+        while len(self._headers) > self.header_cache:
+            self._headers.popitem(last=False)
+        return header
+
+    def get_image(self):
+        w, h = self.config.width, self.config.height
+        image = Image.new("1", (w, h), color=self.config.secondary)
+        info = self.provider.sessions.get(self._shown_key) if self.provider else None
+        if info is None:
+            return image
+
+        image.paste(self._header(info), (0, 0))
+        draw = ImageDraw.Draw(image)
+
+        bar_x1, bar_x2 = 2, w - 28
+        bar_y1, bar_y2 = 24, h - 6
+        draw.rectangle((bar_x1, bar_y1, bar_x2, bar_y2), outline=self.config.primary)
+        if not info.muted and info.volume > 0:
+            fill_width = int((bar_x2 - bar_x1 - 4) * (info.volume / 100))
+            if fill_width > 0:
+                draw.rectangle(
+                    (bar_x1 + 2, bar_y1 + 2, bar_x1 + 2 + fill_width, bar_y2 - 2),
+                    fill=self.config.primary
+                )
+
+        label = "MUTE" if info.muted else f"{info.volume}%"
+        draw.text((w - 25, bar_y1 - 1), label, font=self.font, fill=self.config.primary)
+        return image
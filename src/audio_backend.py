@@ -0,0 +1,250 @@
+"""
+Audio endpoint backends for the volume overlay.
+
+The overlay never polls COM. A backend reports speaker / microphone
+changes as `AudioEvent`s through `emit` (the overlay queues them and wakes
+the render loop). `PycawAudioBackend` registers IAudioEndpointVolumeCallback
+on the default speaker and microphone; with an older pycaw that has no
+`pycaw.callbacks` (or when registration fails) it falls back to polling
+the endpoints on its own thread every POLL_FALLBACK_SECONDS.
+`FakeAudioBackend` drives the same path from code on Linux and in
+benchmarks.
+"""
+import logging
+import threading
+from typing import NamedTuple, Optional
+
+try:
+    import comtypes
+    from comtypes import CLSCTX_ALL
+    from ctypes import POINTER, cast
+    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+except ImportError:  # Windows dışı ya da pycaw yok: overlay sessizce kapalı kalır
+    AudioUtilities = None
+
+try:
+    from pycaw.callbacks import AudioEndpointVolumeCallback
+except ImportError:  # eski pycaw: callbacks modülü yok, poll'a düşülür
+    AudioEndpointVolumeCallback = None
+
+logger = logging.getLogger("OLED Customizer.AudioBackend")
+
+# Bildirim yoksa endpoint'ler bu aralıkla okunur; sadece değişiklik emit edilir
+POLL_FALLBACK_SECONDS = 0.2
+
+
+class AudioEvent(NamedTuple):
+    kind: str                   # "speaker" | "mic" | "discord"
+    volume: Optional[int]       # 0..100; mic / discord için None
+    muted: bool                 # discord için: çalışıyor mu
+
+
+class AudioBackend:
+    """Interface. `start(emit)` emits the current state once, then every change."""
+    has_speaker = False
+    has_mic = False
+
+    def start(self, emit):
+        raise NotImplementedError
+
+    def set_mic_mute(self, muted) -> bool:
+        """Returns False when there is no system microphone to control."""
+        return False
+
+    def get_mic_mute(self) -> Optional[bool]:
+        return None
+
+    def close(self):
+        pass
+
+
+if AudioEndpointVolumeCallback is not None:
+    class _EndpointCallback(AudioEndpointVolumeCallback):
+        """Runs on a COM worker thread; only builds an event and hands it over."""
+
+        def __init__(self, kind, emit):
+            super().__init__()
+            self.kind = kind
+            self.emit = emit
+
+        def on_notify(self, new_volume, new_mute, event_context, channels, channel_volumes):
+            volume = int(round(new_volume * 100)) if self.kind == "speaker" else None
+            self.emit(AudioEvent(self.kind, volume, bool(new_mute)))
+
+
+def _open_endpoints(log=True):
+    """(speaker, mic) IAudioEndpointVolume pointers; None for a missing device."""
+    speaker = mic = None
+
+    # Init Speakers
+    try:
+        device = AudioUtilities.GetSpeakers()
+        speaker = device.EndpointVolume.QueryInterface(IAudioEndpointVolume)
+    except Exception as e:
+        if log:
+            logger.warning("Speaker init failed: %s", e)
+
+    # Init Mic (Communication Default)
+    try:
+        device = AudioUtilities.GetMicrophone()
+        if device:
+            interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            mic = cast(interface, POINTER(IAudioEndpointVolume))
+        elif log:
+            logger.warning("No microphone found")
+    except Exception as e:
+        if log:
+            logger.warning(f"Microphone init failed: {e}")
+    return speaker, mic
+
+
+def _read_endpoint(kind, endpoint):
+    volume = int(round(endpoint.GetMasterVolumeLevelScalar() * 100)) if kind == "speaker" else None
+    return AudioEvent(kind, volume, bool(endpoint.GetMute()))
+
+
+class PycawAudioBackend(AudioBackend):
+    def __init__(self):
+        self._callbacks = []
+        self._poll_stop = threading.Event()
+        self._poll_thread = None
+        self._volume, self._mic_volume = _open_endpoints()
+
+        self.has_speaker = self._volume is not None
+        self.has_mic = self._mic_volume is not None
+
+    @staticmethod
+    def available():
+        return AudioUtilities is not None
+
+    def start(self, emit):
+        polled = []
+        for kind, endpoint in (("speaker", self._volume), ("mic", self._mic_volume)):
+            if endpoint is None:
+                continue
+            try:
+                # Başlangıç durumu tek seferlik okunur, sonrası callback'ten gelir
+                emit(_read_endpoint(kind, endpoint))
+            except Exception as e:
+                logger.warning(f"Reading {kind} volume failed: {e}")
+            if AudioEndpointVolumeCallback is None:
+                polled.append(kind)
+                continue
+            try:
+                callback = _EndpointCallback(kind, emit)
+                endpoint.RegisterControlChangeNotify(callback)
+                self._callbacks.append((endpoint, callback))
+            except Exception as e:
+                logger.warning(f"Volume notifications unavailable for {kind}: {e}")
+                polled.append(kind)
+
+        if polled:
+            logger.info(f"Polling {', '.join(polled)} volume every {POLL_FALLBACK_SECONDS}s (no endpoint callbacks)")
+            self._poll_thread = threading.Thread(target=self._poll, args=(polled, emit), daemon=True)
+            self._poll_thread.start()
+
+    def _poll(self, kinds, emit):
+        """Fallback without callbacks: own COM apartment and pointers, emit only changes."""
+        try:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        except Exception as e:
+            logger.warning(f"CoInitializeEx failed: {e}")
+        speaker, mic = _open_endpoints(log=False)
+        endpoints = [(kind, endpoint) for kind, endpoint in (("speaker", speaker), ("mic", mic))
+                     if kind in kinds and endpoint is not None]
+        last = {}
+        while not self._poll_stop.wait(POLL_FALLBACK_SECONDS):
+            for kind, endpoint in endpoints:
+                try:
+                    event = _read_endpoint(kind, endpoint)
+                except Exception:
+                    continue
+                if last.get(kind, event) != event:
+                    emit(event)
+                last[kind] = event
+
+    def set_mic_mute(self, muted):
+        if self._mic_volume is None:
+            return False
+        try:
+            self._mic_volume.SetMute(bool(muted), None)
+            return True
+        except Exception as e:
+            logger.warning(f"System mic control failed: {e}")
+            return False
+
+    def get_mic_mute(self):
+        if self._mic_volume is None:
+            return None
+        try:
+            return bool(self._mic_volume.GetMute())
+        except Exception:
+            return None
+
+    def close(self):
+        self._poll_stop.set()
+        for endpoint, callback in self._callbacks:
+            try:
+                endpoint.UnregisterControlChangeNotify(callback)
+            except Exception:
+                pass
+        self._callbacks = []
+
+
+class FakeAudioBackend(AudioBackend):
+    """
+    In-process backend for Linux/tests. `set_volume` / `set_mute` /
+    `set_mic_mute` emit exactly like the COM callbacks would, optionally
+    from a separate thread (`threaded=True`) to mimic the COM worker.
+    """
+
+    def __init__(self, volume=50, muted=False, mic_muted=False, has_mic=True, threaded=False):
+        self.has_speaker = True
+        self.has_mic = has_mic
+        self.volume = volume
+        self.muted = muted
+        self.mic_muted = mic_muted
+        self.threaded = threaded
+        self._emit = None
+
+    def start(self, emit):
+        self._emit = emit
+        emit(AudioEvent("speaker", self.volume, self.muted))
+        if self.has_mic:
+            emit(AudioEvent("mic", None, self.mic_muted))
+
+    def _send(self, event):
+        if self._emit is None:
+            return
+        if self.threaded:
+            threading.Thread(target=self._emit, args=(event,), daemon=True).start()
+        else:
+            self._emit(event)
+
+    def set_volume(self, volume):
+        self.volume = int(volume)
+        self._send(AudioEvent("speaker", self.volume, self.muted))
+
+    def set_mute(self, muted):
+        self.muted = bool(muted)
+        self._send(AudioEvent("speaker", self.volume, self.muted))
+
+    def set_mic_mute(self, muted):
+        if not self.has_mic:
+            return False
+        self.mic_muted = bool(muted)
+        self._send(AudioEvent("mic", None, self.mic_muted))
+        return True
+
+    def get_mic_mute(self):
+        return self.mic_muted if self.has_mic else None
+
+
+def create_audio_backend():
+    """The Windows backend when pycaw is importable, otherwise None."""
+    if PycawAudioBackend.available():
+        try:
+            return PycawAudioBackend()
+        except Exception as e:
+            logger.warning(f"Audio backend init failed: {e}")
+    return None
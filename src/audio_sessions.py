@@ -0,0 +1,323 @@
+"""
+Per-application audio sessions for the app volume overlay.
+
+A `SessionProvider` keeps an immutable `{key: SessionInfo}` dict that is
+replaced (never mutated) when something changes, and reports changes as
+`SessionEvent`s through `emit`. Nobody enumerates sessions per frame:
+  - PycawSessionProvider: enumerates on its own MTA thread at start and
+    again only after a session-created / disconnected / expired
+    notification. Volume and state changes come from per-session
+    IAudioSessionEvents callbacks.
+  - FakeSessionProvider: the same events driven from code (Linux/tests).
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional
+
+try:
+    import comtypes
+    from pycaw.pycaw import AudioUtilities
+except ImportError:  # Windows dışı ya da pycaw yok
+    AudioUtilities = None
+
+try:
+    from pycaw.callbacks import AudioSessionEvents, AudioSessionNotification
+except ImportError:  # eski pycaw: bildirim yok, seyrek yeniden taramaya düşülür
+    AudioSessionEvents = None
+
+logger = logging.getLogger("OLED Customizer.AudioSessions")
+
+# Bildirim kaydı başarısız olursa (STA/MTA sorunu) yedek yol: seyrek yeniden tarama
+FALLBACK_REFRESH_SECONDS = 5.0
+
+
+class SessionInfo(NamedTuple):
+    key: str
+    pid: int
+    process: str            # küçük harf exe adı, "spotify.exe"
+    name: str               # ekranda gösterilecek ad
+    volume: int             # 0..100
+    muted: bool
+    active: bool            # şu an ses çalıyor (AudioSessionStateActive)
+    active_since: float     # monotonic; en son çalmaya başlayan öne geçer
+
+
+class SessionEvent(NamedTuple):
+    kind: str               # "sessions" | "volume" | "state"
+    key: Optional[str]
+
+
+def display_name(process, session_name="", pid=None):
+    """DisplayName when the app set a real one, otherwise the exe name."""
+    if session_name and not session_name.startswith("@"):
+        return session_name
+    if pid == 0 or not process:
+        return "System Sounds"
+    stem = os.path.splitext(process)[0]
+    return stem[:1].upper() + stem[1:]
+
+
+def foreground_pid():
+    """Pid of the foreground window (two user32 calls), None off Windows."""
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+        hwnd = ctypes.windll.user32.GetForegroundWindow()
+        pid = wintypes.DWORD()
+        ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        return pid.value or None
+    except Exception:
+        return None
+
+
+def foreground_process():
+    """(pid, lowercase exe name) of the foreground window, (None, "") off Windows."""
+    pid = foreground_pid()
+    if pid is None:
+        return None, ""
+    try:
+        import psutil
+        return pid, psutil.Process(pid).name().lower()
+    except Exception:
+        return None, ""
+
+
+class SessionProvider:
+    """Interface. `sessions` is replaced as a whole; read it without locking."""
+
+    def __init__(self):
+        self.sessions = {}
+        self._emit = None
+        self._lock = threading.Lock()   # COM callback thread'leri ile tarama thread'i arasında
+
+    def start(self, emit):
+        self._emit = emit
+
+    def foreground(self):
+        return foreground_process()
+
+    def foreground_pid(self):
+        return foreground_pid()
+
+    def close(self):
+        pass
+
+    def _publish(self, sessions, event):
+        self.sessions = sessions
+        if self._emit:
+            self._emit(event)
+
+    def _update(self, key, **changes):
+        info = self.sessions.get(key)
+        if info is None:
+            return None
+        sessions = dict(self.sessions)
+        sessions[key] = info._replace(**changes)
+        return sessions
+
+    def _set_volume(self, key, volume, muted):
+        with self._lock:
+            info = self.sessions.get(key)
+            if info is None or (info.volume, info.muted) == (volume, muted):
+                return
+            self._publish(self._update(key, volume=volume, muted=muted), SessionEvent("volume", key))
+
+    def _set_active(self, key, active):
+        with self._lock:
+            info = self.sessions.get(key)
+            if info is None or info.active == active:
+                return
+            since = time.monotonic() if active else info.active_since
+            self._publish(self._update(key, active=active, active_since=since), SessionEvent("state", key))
+
+
+if AudioSessionEvents is not None:
+    class _SessionCreated(AudioSessionNotification):
+        def __init__(self, provider):
+            super().__init__()
+            self.provider = provider
+
+        def on_session_created(self, new_session):
+            self.provider._dirty.set()
+
+    class _SessionEvents(AudioSessionEvents):
+        def __init__(self, provider, key):
+            super().__init__()
+            self.provider = provider
+            self.key = key
+
+        def on_simple_volume_changed(self, new_volume, new_mute, event_context):
+            self.provider._set_volume(self.key, int(round(new_volume * 100)), bool(new_mute))
+
+        def on_state_changed(self, new_state, new_state_id):
+            if new_state == "Expired":
+                self.provider._dirty.set()
+            else:
+                self.provider._set_active(self.key, new_state == "Active")
+
+        def on_session_disconnected(self, disconnect_reason, disconnect_reason_id):
+            self.provider._dirty.set()
+
+
+class PycawSessionProvider(SessionProvider):
+    def __init__(self):
+        super().__init__()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._registered = {}       # key -> AudioSession (callback referansı burada yaşar)
+        self._thread = None
+        self.enumerations = 0
+
+    @staticmethod
+    def available():
+        return AudioUtilities is not None
+
+    def start(self, emit):
+        super().start(emit)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        self._dirty.set()
+
+    def _run(self):
+        try:
+            comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+        except Exception as e:
+            logger.warning(f"CoInitializeEx failed: {e}")
+
+        manager = None
+        notification = None
+        try:
+            manager = AudioUtilities.GetAudioSessionManager()
+            if AudioSessionEvents is None:
+                raise RuntimeError("pycaw.callbacks not available")
+            notification = _SessionCreated(self)
+            manager.RegisterSessionNotification(notification)
+            manager.GetSessionEnumerator()  # bildirimleri etkinleştirir
+        except Exception as e:
+            logger.warning(f"Session notifications unavailable, rescanning every {FALLBACK_REFRESH_SECONDS}s: {e}")
+            notification = None
+
+        self._dirty.set()
+        while not self._stop.is_set():
+            timeout = None if notification is not None else FALLBACK_REFRESH_SECONDS
+            if self._dirty.wait(timeout) or notification is None:
+                self._dirty.clear()
+                if self._stop.is_set():
+                    break
+                try:
+                    self._enumerate()
+                except Exception as e:
+                    logger.debug(f"Session enumeration failed: {e}")
+
+        for session in self._registered.values():
+            try:
+                session.unregister_notification()
+            except Exception:
+                pass
+        if manager is not None and notification is not None:
+            try:
+                manager.UnregisterSessionNotification(notification)
+            except Exception:
+                pass
+
+    def _enumerate(self):
+        self.enumerations += 1
+        sessions = {}
+        seen = {}
+        for session in AudioUtilities.GetAllSessions():
+            key = session.InstanceIdentifier
+            old = self.sessions.get(key)
+            if old is not None:
+                sessions[key] = old
+                seen[key] = self._registered.get(key, session)
+                continue
+
+            state = session.State
+            if state == 2:  # Expired
+                continue
+            process = session.Process
+            exe = process.name() if process is not None else ""
+            process_name = exe.lower()
+            volume = session.SimpleAudioVolume
+            sessions[key] = SessionInfo(
+                key=key,
+                pid=session.ProcessId,
+                process=process_name,
+                name=display_name(exe, session.DisplayName, session.ProcessId),
+                volume=int(round(volume.GetMasterVolume() * 100)),
+                muted=bool(volume.GetMute()),
+                active=state == 1,
+                active_since=time.monotonic() if state == 1 else 0.0,
+            )
+            try:
+                if AudioSessionEvents is not None:
+                    session.register_notification(_SessionEvents(self, key))
+            except Exception as e:
+                logger.debug(f"Session events unavailable for {process_name}: {e}")
+            seen[key] = session
+
+        for key, session in self._registered.items():
+            if key not in seen:
+                try:
+                    session.unregister_notification()
+                except Exception:
+                    pass
+        self._registered = seen
+
+        with self._lock:
+            # Tarama sırasında gelen volume/state callback'leri kaybolmasın
+            merged = {key: self.sessions.get(key, info) for key, info in sessions.items()}
+            if merged.keys() != self.sessions.keys():
+                self._publish(merged, SessionEvent("sessions", None))
+
+
+class FakeSessionProvider(SessionProvider):
+    """Sessions added and changed from code; emits exactly like the COM callbacks."""
+
+    def __init__(self):
+        super().__init__()
+        self._foreground = (None, "")
+
+    def add(self, key, process, pid=1, volume=100, muted=False, active=False, name=""):
+        with self._lock:
+            sessions = dict(self.sessions)
+            sessions[key] = SessionInfo(key, pid, process.lower(), display_name(process, name, pid),
+                                        volume, muted, active, time.monotonic() if active else 0.0)
+            self._publish(sessions, SessionEvent("sessions", None))
+
+    def remove(self, key):
+        with self._lock:
+            if key in self.sessions:
+                sessions = dict(self.sessions)
+                del sessions[key]
+                self._publish(sessions, SessionEvent("sessions", None))
+
+    def set_volume(self, key, volume, muted=False):
+        self._set_volume(key, int(volume), bool(muted))
+
+    def set_active(self, key, active):
+        self._set_active(key, bool(active))
+
+    def set_foreground(self, pid, process=""):
+        self._foreground = (pid, process.lower())
+
+    def foreground(self):
+        return self._foreground
+
+    def foreground_pid(self):
+        return self._foreground[0]
+
+
+def create_session_provider():
+    """The Windows provider when pycaw is importable, otherwise None."""
+    if PycawSessionProvider.available():
+        return PycawSessionProvider()
+    return None
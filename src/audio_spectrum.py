@@ -0,0 +1,268 @@
+"""
+Audio spectrum for the Ticker player style.
+
+An `AudioSource` delivers mono float32 blocks in real time:
+  - LoopbackSource: what the speakers play (WASAPI loopback through the
+    optional `soundcard` package, Windows)
+  - WavFileSource / SignalSource: a WAV file or a generated signal, for
+    Linux and benchmarks
+
+`SpectrumAnalyzer` runs capture + analysis on its own thread: blocks go
+into a ring buffer, every hop a Hann-windowed rfft is log-binned into a
+few bars with peak decay, and a new small array is published. The render
+loop only reads `levels` (a reference swap) and blits bars.
+"""
+import logging
+import math
+import threading
+import time
+import wave
+
+import numpy as np
+
+logger = logging.getLogger("OLED Customizer.AudioSpectrum")
+
+
+class AudioSource:
+    """Real-time mono source. `read` blocks until `frames` samples are available."""
+    samplerate = 48000
+
+    def open(self):
+        pass
+
+    def read(self, frames):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LoopbackSource(AudioSource):
+    """Default output device captured through WASAPI loopback (needs `soundcard`)."""
+
+    def __init__(self, samplerate=48000):
+        self.samplerate = samplerate
+        self._recorder = None
+
+    @staticmethod
+    def available():
+        try:
+            import soundcard  # noqa: F401
+            return True
+        except Exception:
+            return False
+
+    def open(self):
+        import soundcard
+        speaker = soundcard.default_speaker()
+        mic = soundcard.get_microphone(id=str(speaker.name), include_loopback=True)
+        self._recorder = mic.recorder(samplerate=self.samplerate, channels=1)
+        self._recorder.__enter__()
+
+    def read(self, frames):
+        data = self._recorder.record(numframes=frames)
+        return np.asarray(data, dtype=np.float32).reshape(-1)
+
+    def close(self):
+        if self._recorder is not None:
+            try:
+                self._recorder.__exit__(None, None, None)
+            except Exception:
+                pass
+            self._recorder = None
+
+
+class _PacedSource(AudioSource):
+    """Base for file/generated sources: sleeps so blocks arrive in real time."""
+
+    def open(self):
+        self._next = time.perf_counter()
+
+    def _pace(self, frames):
+        self._next += frames / self.samplerate
+        delay = self._next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -0.5:
+            self._next = time.perf_counter()  # çok geride kaldık, yetişmeye çalışma
+
+
+class WavFileSource(_PacedSource):
+    """16-bit PCM WAV file, looped, mixed down to mono."""
+
+    def __init__(self, path, loop=True):
+        with wave.open(path, "rb") as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("only 16-bit PCM WAV is supported")
+            self.samplerate = wav.getframerate()
+            channels = wav.getnchannels()
+            raw = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        self.samples = (raw.reshape(-1, channels).mean(axis=1) / 32768.0).astype(np.float32)
+        self.loop = loop
+        self._pos = 0
+
+    def read(self, frames):
+        self._pace(frames)
+        end = self._pos + frames
+        if end <= len(self.samples):
+            block = self.samples[self._pos:end]
+        elif self.loop and len(self.samples):
+            block = np.take(self.samples, np.arange(self._pos, end), mode="wrap")
+        else:
+            block = np.zeros(frames, dtype=np.float32)
+        self._pos = end % max(len(self.samples), 1)
+        return block
+
+
+class SignalSource(_PacedSource):
+    """Generated test signal: a slow log sweep plus a 2 Hz pulsing bass tone and noise."""
+
+    def __init__(self, samplerate=48000, sweep_seconds=8.0, seed=0):
+        self.samplerate = samplerate
+        self.sweep_seconds = sweep_seconds
+        self._rng = np.random.default_rng(seed)
+        self._t = 0
+
+    def read(self, frames):
+        self._pace(frames)
+        t = (self._t + np.arange(frames)) / self.samplerate
+        self._t += frames
+        phase_t = t % self.sweep_seconds
+        # 60 Hz -> 12 kHz üstel sweep
+        k = math.log(12000 / 60) / self.sweep_seconds
+        sweep = np.sin(2 * np.pi * 60 * (np.exp(k * phase_t) - 1) / k)
+        bass = np.sin(2 * np.pi * 80 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 2 * t))
+        noise = self._rng.standard_normal(frames) * 0.02
+        return (0.4 * sweep + 0.4 * bass + noise).astype(np.float32)
+
+
+def log_bin_edges(bars, fft_size, samplerate, fmin=40.0, fmax=16000.0):
+    """rfft bin indices splitting fmin..fmax into `bars` log-spaced bands (each >= 1 bin)."""
+    fmax = min(fmax, samplerate / 2)
+    freqs = np.geomspace(fmin, fmax, bars + 1)
+    edges = np.round(freqs * fft_size / samplerate).astype(int)
+    edges = np.clip(edges, 1, fft_size // 2)
+    for i in range(1, len(edges)):
+        edges[i] = max(edges[i], edges[i - 1] + 1)
+    return edges
+
+
+class SpectrumAnalyzer:
+    """
+    Capture + FFT thread. `levels` is a float32 array in 0..1 (one per bar),
+    replaced (never mutated) on every hop; `seq` increments with it.
+    The thread releases the audio device when nobody calls `touch()` for
+    `idle_seconds` and resumes on the next touch.
+    """
+
+    def __init__(self, source, bars=4, fft_size=1024, hop=512, fmin=40.0, fmax=16000.0,
+                 floor_db=-60.0, decay_per_second=1.5, idle_seconds=2.0):
+        self.source = source
+        self.bars = bars
+        self.fft_size = fft_size
+        self.hop = hop
+        self.floor_db = floor_db
+        self.decay_per_second = decay_per_second
+        self.idle_seconds = idle_seconds
+
+        self.levels = np.zeros(bars, dtype=np.float32)
+        self.seq = 0
+
+        self._window = np.hanning(fft_size).astype(np.float32)
+        # Hann penceresinin kazancı: tam ölçekli sinüs ~0 dB olsun
+        self._scale = 2.0 / self._window.sum()
+        self._edges = log_bin_edges(bars, fft_size, source.samplerate, fmin, fmax)
+        self._ring = np.zeros(fft_size * 2, dtype=np.float32)
+        self._write = 0
+        self._peaks = np.zeros(bars, dtype=np.float32)
+        self._last_hop = None
+
+        self._last_touch = 0.0
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+    def touch(self):
+        """Called by the renderer while the visualizer is on screen."""
+        self._last_touch = time.monotonic()
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def push(self, block):
+        """Append samples to the ring buffer (two copies, so a window is always contiguous)."""
+        n = len(block)
+        if n >= self.fft_size:
+            block = block[-self.fft_size:]
+            n = self.fft_size
+        size = self.fft_size
+        start = self._write
+        end = start + n
+        if end <= size:
+            self._ring[start:end] = block
+            self._ring[start + size:end + size] = block
+        else:
+            first = size - start
+            self._ring[start:size] = block[:first]
+            self._ring[start + size:] = block[:first]
+            self._ring[:n - first] = block[first:]
+            self._ring[size:size + n - first] = block[first:]
+        self._write = end % size
+
+    def analyze(self, now=None):
+        """FFT of the latest `fft_size` samples -> new published levels."""
+        if now is None:
+            now = time.perf_counter()
+        frame = self._ring[self._write:self._write + self.fft_size]
+        spectrum = np.abs(np.fft.rfft(frame * self._window)) * self._scale
+        band = np.maximum.reduceat(spectrum[:self._edges[-1]], self._edges[:-1])
+        db = 20.0 * np.log10(np.maximum(band, 1e-9))
+        level = np.clip(1.0 - db / self.floor_db, 0.0, 1.0).astype(np.float32)
+
+        dt = 0.0 if self._last_hop is None else now - self._last_hop
+        self._last_hop = now
+        # Tepe hızlı yükselir, yavaş düşer
+        self._peaks = np.maximum(level, self._peaks - self.decay_per_second * dt)
+        self.levels = self._peaks.copy()
+        self.seq += 1
+        return self.levels
+
+    def _run(self):
+        opened = False
+        while self._running:
+            if time.monotonic() - self._last_touch > self.idle_seconds:
+                if opened:
+                    self.source.close()
+                    opened = False
+                    self._peaks[:] = 0
+                    self.levels = np.zeros(self.bars, dtype=np.float32)
+                    self.seq += 1
+                self._wake.clear()
+                self._wake.wait()
+                continue
+
+            try:
+                if not opened:
+                    self.source.open()
+                    opened = True
+                    self._last_hop = None
+                self.push(self.source.read(self.hop))
+                self.analyze()
+            except Exception as e:
+                logger.warning(f"Audio capture failed: {e}")
+                if opened:
+                    self.source.close()
+                    opened = False
+                time.sleep(2.0)
+        if opened:
+            self.source.close()
@@ -4,12 +4,8 @@ from time import time
 import psutil
 from PIL import Image, ImageDraw, ImageFont
 
-try:
-    import wmi
-except ImportError:
-    wmi = None
-
 from src.image_utils import fetch_content_path
+from src.sensor_backends import BackendUnavailable, OhmWmiBackend
 
 logger = logging.getLogger("OLED Customizer.HardwareOverlay")
 
@@ -28,6 +24,13 @@ class HardwareOverlay:
         self.timeout = timeout
         self._last_trigger = 0.0
 
+        self._ohm = OhmWmiBackend()
+        try:
+            self._ohm.open()
+        except BackendUnavailable as e:
+            logger.debug("OpenHardwareMonitor WMI unavailable: %s", e)
+            self._ohm = None
+
     def trigger(self):
         """INS'e basıldığında çağrılacak."""
         self._last_trigger = time()
@@ -38,35 +41,22 @@ class HardwareOverlay:
 
     def _read_cpu(self):
         usage = int(round(psutil.cpu_percent(interval=None)))
-        temp = None
-
-        # CPU sıcaklığı: OpenHardwareMonitor WMI dene
-        if wmi is not None:
-            try:
-                c = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                for sensor in c.Sensor():
-                    if sensor.SensorType == "Temperature" and "CPU Package" in sensor.Name:
-                        temp = int(round(sensor.Value))
-                        break
-            except Exception as e:
-                logger.debug("CPU temp via OpenHardwareMonitor failed: %s", e)
-
+        temp = self._read_ohm("cpu_temp")
         return usage, temp
 
     def _read_gpu(self):
-        temp = None
-
-        if wmi is not None:
-            try:
-                c = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                for sensor in c.Sensor():
-                    if sensor.SensorType == "Temperature" and "GPU Core" in sensor.Name:
-                        temp = int(round(sensor.Value))
-                        break
-            except Exception as e:
-                logger.debug("GPU temp via OpenHardwareMonitor failed: %s", e)
-
-        return temp
+        return self._read_ohm("gpu_temp")
+
+    def _read_ohm(self, metric):
+        """OpenHardwareMonitor WMI; bağlantı bir kez açılır, her okumada değil."""
+        if self._ohm is None:
+            return None
+        try:
+            value = self._ohm.read((metric,))[metric]
+            return int(round(value)) if value is not None else None
+        except Exception as e:
+            logger.debug("%s via OpenHardwareMonitor failed: %s", metric, e)
+            return None
 
     def _read_ram(self):
         mem = psutil.virtual_memory()
@@ -0,0 +1,260 @@
+"""
+Global hotkeys: chords -> named actions.
+
+The pynput listener callbacks only put `(kind, key, timestamp)` on a
+SimpleQueue; a dispatcher thread tracks held modifiers, matches chords
+and runs the action. A slow action (COM, disk) never delays keystrokes
+for the rest of the system.
+
+Chord strings: "Key.insert", "m", "<77>", "ctrl+alt+m", "Key.ctrl_l+Key.f9".
+Modifiers (ctrl / alt / shift / cmd) match either side. Held modifiers are
+tracked per physical key (ctrl_l and ctrl_r separately), so releasing one
+side keeps "ctrl" held while the other is down. Key-up events can be lost
+(Win+L, Ctrl+Alt+Del, a focus change to an elevated window): on Windows
+every held modifier is checked with GetAsyncKeyState when a non-modifier
+key goes down, elsewhere a modifier without a key-down for
+MODIFIER_EXPIRY_SECONDS is dropped.
+
+The key event time of the last dispatched action is kept as `pending`;
+the render loop takes it when it starts the next frame and records the
+hotkey-to-pixel latency in `latencies` once that frame is sent.
+"""
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from queue import SimpleQueue
+
+logger = logging.getLogger("OLED Customizer.Hotkeys")
+
+ACTIONS = (
+    "cycle_screen",
+    "toggle_player_style",
+    "show_hw_monitor",
+    "mute_mic",
+    "media_play_pause",
+    "media_next",
+    "app_volume",
+)
+
+_MODIFIERS = {
+    "ctrl": "ctrl", "ctrl_l": "ctrl", "ctrl_r": "ctrl",
+    "alt": "alt", "alt_l": "alt", "alt_r": "alt", "alt_gr": "alt",
+    "shift": "shift", "shift_l": "shift", "shift_r": "shift",
+    "cmd": "cmd", "cmd_l": "cmd", "cmd_r": "cmd",
+}
+
+# Fiziksel tuş -> GetAsyncKeyState sanal tuş kodları
+_MODIFIER_VKS = {
+    "ctrl": (0x11,), "ctrl_l": (0xA2,), "ctrl_r": (0xA3,),
+    "alt": (0x12,), "alt_l": (0xA4,), "alt_r": (0xA5,), "alt_gr": (0xA5,),
+    "shift": (0x10,), "shift_l": (0xA0,), "shift_r": (0xA1,),
+    "cmd": (0x5B, 0x5C), "cmd_l": (0x5B,), "cmd_r": (0x5C,),
+}
+
+# Windows dışında kaybolan key-up için: bu süre key-down gelmeyen modifier bırakılmış sayılır
+MODIFIER_EXPIRY_SECONDS = 10.0
+# Basılı tuşun otomatik tekrarları en fazla ~1 s arayla gelir; daha uzun boşluk yeni basış
+REPEAT_GAP_SECONDS = 1.5
+
+
+def windows_key_state():
+    """Callable side -> physically down (GetAsyncKeyState), None off Windows."""
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        get_async_key_state = ctypes.windll.user32.GetAsyncKeyState
+    except Exception:
+        return None
+
+    def is_down(side):
+        return any(get_async_key_state(vk) & 0x8000 for vk in _MODIFIER_VKS[side])
+    return is_down
+
+
+def key_name(key):
+    """Canonical name of a pynput key (or an already canonical string)."""
+    if isinstance(key, str):
+        return _token_name(key)
+    name = getattr(key, "name", None)      # keyboard.Key enum
+    if name:
+        return _MODIFIERS.get(name, f"Key.{name}")
+    char = getattr(key, "char", None)
+    vk = getattr(key, "vk", None)
+    # Ctrl basılıyken char kontrol karakterine döner ("\x0d"); harf/rakamda vk'ye güven
+    if vk is not None and (65 <= vk <= 90 or 48 <= vk <= 57):
+        return chr(vk).lower()
+    if char and char.isprintable():
+        return char.lower()
+    if vk is not None:
+        return f"<{vk}>"
+    return None
+
+
+def modifier_side(key):
+    """Physical modifier name ("ctrl_l", "alt_gr", "ctrl"...) of a key, None for other keys."""
+    if isinstance(key, str):
+        token = key.strip()
+        token = token[4:] if token.startswith("Key.") else token.lower()
+    else:
+        token = getattr(key, "name", None)
+    return token if token in _MODIFIERS else None
+
+
+def _token_name(token):
+    token = token.strip()
+    if token.startswith("Key."):
+        attr = token[4:]
+        return _MODIFIERS.get(attr, f"Key.{attr}")
+    if token.lower() in _MODIFIERS:
+        return _MODIFIERS[token.lower()]
+    if token.startswith("<") and token.endswith(">"):
+        try:
+            vk = int(token[1:-1])
+        except ValueError:
+            return None
+        if 65 <= vk <= 90 or 48 <= vk <= 57:
+            return chr(vk).lower()
+        return token
+    if len(token) == 1:
+        return token.lower()
+    return None
+
+
+def parse_chord(text):
+    """'ctrl+alt+m' -> (frozenset({'ctrl', 'alt'}), 'm'); None when invalid."""
+    if not text:
+        return None
+    names = [_token_name(part) for part in text.split("+")]
+    if not names or any(name is None for name in names):
+        return None
+    modifiers = frozenset(name for name in names if name in _MODIFIERS.values())
+    keys = [name for name in names if name not in _MODIFIERS.values()]
+    if len(keys) != 1:
+        return None
+    return modifiers, keys[0]
+
+
+class HotkeyDispatcher:
+    def __init__(self, actions, on_dispatch=None, latency_samples=64, key_state=None):
+        """
+        key_state: side -> physically down; default GetAsyncKeyState on
+        Windows, otherwise held modifiers expire after MODIFIER_EXPIRY_SECONDS
+        """
+        self.actions = actions              # ad -> callable
+        self.on_dispatch = on_dispatch
+        self.key_state = key_state if key_state is not None else windows_key_state()
+        self._bindings = {}                 # (modifiers, key) -> action adı
+        self._queue = SimpleQueue()
+        self._held_modifiers = {}           # fiziksel tuş ("ctrl_l") -> son key-down zamanı
+        self._pressed = {}                  # tuş -> son key-down zamanı (otomatik tekrar)
+        self.pending = None
+        self.latencies = deque(maxlen=latency_samples)
+        self.dispatched = 0
+        self._thread = None
+
+    # -- listener thread: sadece kuyruğa at --
+    # injected: pynput 1.8; kendi gönderdiğimiz medya tuşları eylemi yeniden tetiklemesin
+    def key_down(self, key, injected=False):
+        if not injected:
+            self._queue.put(("down", key, time.perf_counter()))
+
+    def key_up(self, key, injected=False):
+        if not injected:
+            self._queue.put(("up", key, time.perf_counter()))
+
+    def bind(self, bindings):
+        """bindings: action -> chord string. Replaces all previous bindings."""
+        table = {}
+        for action, chord in bindings.items():
+            parsed = parse_chord(chord)
+            if parsed is None:
+                if chord:
+                    logger.warning(f"Invalid hotkey for {action}: {chord!r}")
+                continue
+            if parsed in table:
+                logger.warning(f"Hotkey {chord!r} already bound to {table[parsed]}, ignoring {action}")
+                continue
+            table[parsed] = action
+        self._bindings = table
+        return table
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._queue.put(None)
+
+    def take_pending(self):
+        """Key time of the last dispatched action not yet on screen (render loop)."""
+        pending, self.pending = self.pending, None
+        return pending
+
+    def record_frame(self, pending, now=None):
+        latency = (now or time.perf_counter()) - pending
+        self.latencies.append(latency)
+        logger.debug(f"Hotkey to pixel: {latency * 1000:.1f} ms")
+        return latency
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self.handle(*item)
+
+    def held_modifiers(self, stamp):
+        """Modifier groups held at `stamp`, after dropping the ones whose key-up was lost."""
+        for side, since in list(self._held_modifiers.items()):
+            if self.key_state is not None:
+                try:
+                    down = self.key_state(side)
+                except Exception:
+                    down = True
+            else:
+                down = stamp - since < MODIFIER_EXPIRY_SECONDS
+            if not down:
+                del self._held_modifiers[side]
+        return frozenset(_MODIFIERS[side] for side in self._held_modifiers)
+
+    def handle(self, kind, key, stamp):
+        side = modifier_side(key)
+        if side is not None:
+            if kind == "up":
+                self._held_modifiers.pop(side, None)
+            else:
+                self._held_modifiers[side] = stamp
+            return None
+
+        name = key_name(key)
+        if name is None:
+            return None
+        if kind == "up":
+            self._pressed.pop(name, None)
+            return None
+
+        last = self._pressed.get(name)
+        self._pressed[name] = stamp
+        if last is not None and stamp - last < REPEAT_GAP_SECONDS:
+            return None  # basılı tutulan tuşun tekrarları
+
+        action = self._bindings.get((self.held_modifiers(stamp), name))
+        if action is None:
+            return None
+        callback = self.actions.get(action)
+        if callback is None:
+            return None
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Hotkey action {action} failed: {e}")
+            return None
+        self.dispatched += 1
+        self.pending = stamp
+        if self.on_dispatch:
+            self.on_dispatch()
+        return action
@@ -0,0 +1,172 @@
+"""
+Synced lyrics (.lrc) for the Lyrics player style.
+
+Files live in a local folder (default: %APPDATA%/OLED Customizer/lyrics)
+and are matched by "Artist - Title.lrc" or "Title.lrc", case and accent
+insensitive. Each file is parsed once into sorted timestamp / line tuples;
+the current line is a `bisect` on every frame. Parsed files are kept in a
+small LRU keyed by (path, mtime), so an edited file is picked up again.
+"""
+import bisect
+import logging
+import os
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import NamedTuple
+
+logger = logging.getLogger("OLED Customizer.Lyrics")
+
+MAX_LRC_BYTES = 512 * 1024
+
+_TIME_TAG = re.compile(r"\[(\d{1,3}):(\d{1,2})(?:[.:](\d{1,3}))?\]")
+_OFFSET_TAG = re.compile(r"^\[offset:\s*([+-]?\d+)\s*\]$", re.IGNORECASE)
+_WORD_TAG = re.compile(r"<\d{1,3}:\d{1,2}(?:[.:]\d{1,3})?>")     # enhanced LRC kelime zamanları
+_TITLE_SUFFIX = re.compile(r"\s*(\(.*?\)|\[.*?\]|\s-\s.*)$")     # "(feat. X)", "- Remastered 2011"
+
+
+def _default_folder():
+    appdata = os.environ.get("APPDATA") or os.path.expanduser("~")
+    return os.path.join(appdata, "OLED Customizer", "lyrics")
+
+
+class Lyrics(NamedTuple):
+    times: tuple        # ms, artan sırada
+    lines: tuple
+
+    def index_at(self, position_ms):
+        """Index of the line shown at `position_ms`, -1 before the first line."""
+        return bisect.bisect_right(self.times, position_ms) - 1
+
+
+def parse_lrc(text):
+    """Parse LRC text. Lines with several time tags are repeated at each time."""
+    offset = 0
+    entries = []
+    for raw in text.splitlines():
+        raw = raw.strip()
+        match = _OFFSET_TAG.match(raw)
+        if match:
+            # Pozitif offset = sözler daha erken gösterilir
+            offset = int(match.group(1))
+            continue
+
+        stamps = []
+        pos = 0
+        while True:
+            match = _TIME_TAG.match(raw, pos)
+            if not match:
+                break
+            minutes, seconds, fraction = match.groups()
+            ms = int((fraction or "0").ljust(3, "0")[:3]) if fraction else 0
+            stamps.append((int(minutes) * 60 + int(seconds)) * 1000 + ms)
+            pos = match.end()
+        if not stamps:
+            continue  # [ar:], [ti:] gibi meta etiketleri
+
+        line = _WORD_TAG.sub("", raw[pos:]).strip()
+        for stamp in stamps:
+            entries.append((stamp, line))
+
+    entries.sort(key=lambda e: e[0])
+    return Lyrics(
+        times=tuple(max(0, stamp - offset) for stamp, _ in entries),
+        lines=tuple(line for _, line in entries),
+    )
+
+
+def _normalize(name):
+    name = unicodedata.normalize("NFKD", name.replace("ı", "i"))
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    return re.sub(r"[^a-z0-9]+", " ", name.lower()).strip()
+
+
+class LyricsLibrary:
+    def __init__(self, folder=None, cache_size=32):
+        self.folder = folder or _default_folder()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()     # (path, mtime_ns) -> Lyrics
+        self._index = {}                # normalize edilmiş dosya adı -> path
+        self._index_mtime = None
+
+    def set_folder(self, folder):
+        folder = folder or _default_folder()
+        if folder != self.folder:
+            self.folder = folder
+            self._index_mtime = None
+
+    def find(self, artist, title):
+        """Lyrics for the track or None. Called once per track change."""
+        path = self._lookup(artist or "", title or "")
+        if not path:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (path, mtime)
+        lyrics = self._cache.get(key)
+        if lyrics is not None:
+            self._cache.move_to_end(key)
+            return lyrics
+
+        try:
+            with open(path, "rb") as f:
+                raw = f.read(MAX_LRC_BYTES)
+            lyrics = parse_lrc(raw.decode("utf-8-sig", errors="replace"))
+        except OSError as e:
+            logger.debug(f"Failed to read lyrics {path}: {e}")
+            return None
+        if not lyrics.times:
+            lyrics = None  # zaman etiketi olmayan düz metin: senkron gösterilemez
+
+        self._cache[key] = lyrics
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return lyrics
+
+    def _lookup(self, artist, title):
+        self._refresh_index()
+        if not self._index:
+            return None
+
+        titles = [title]
+        short_title = _TITLE_SUFFIX.sub("", title)
+        if short_title and short_title != title:
+            titles.append(short_title)
+        artists = [artist]
+        first_artist = artist.split(",")[0].strip()
+        if first_artist != artist:
+            artists.append(first_artist)
+
+        for t in titles:
+            for a in artists:
+                path = self._index.get(_normalize(f"{a} - {t}"))
+                if path:
+                    return path
+        for t in titles:
+            path = self._index.get(_normalize(t))
+            if path:
+                return path
+        return None
+
+    def _refresh_index(self):
+        """Rebuild the file name index when the folder changed (one stat per call)."""
+        try:
+            mtime = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            self._index = {}
+            self._index_mtime = None
+            return
+        if mtime == self._index_mtime:
+            return
+
+        index = {}
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() == ".lrc":
+                    index.setdefault(_normalize(stem), os.path.join(root, name))
+        self._index = index
+        self._index_mtime = mtime
@@ -10,34 +10,111 @@ def _nowplaying_path():
 
 logger = logging.getLogger("OLED Customizer.MediaFallback")
 
+MAX_FILE_BYTES = 64 * 1024      # now-playing JSON'u birkaç yüz byte
+STALE_MS = 3000                 # "ts" bundan eskiyse yazan script kapanmış sayılır
 
-class MediaFallback:
-    def __init__(self):
-        self.path = _nowplaying_path()
+
+class NowPlayingFile:
+    """
+    Change-detected reader for a JSON file written by another process.
+
+    Every `read()` costs one os.stat(); the file is opened and parsed only
+    when (mtime, size, inode) changed. Writers that replace the file
+    atomically (temp file + os.replace) always give a complete file. Writers
+    that rewrite in place can be caught mid-write: the half file fails to
+    parse, the previous content is kept and the file is read again on the
+    next call instead of sleeping and retrying.
+    """
+
+    # mtime bu kadar yeniyse dosya aynı zaman damgasıyla tekrar yazılmış
+    # olabilir; stat aynı görünse de içerik okunur. NTFS/ext4 mtime'ı birkaç
+    # ms'lik saat tick'i ile yazar, FAT/SMB gibi saniye çözünürlüklüler 2 s.
+    RACY_NS = 20_000_000
+    COARSE_RACY_NS = 2_000_000_000
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.version = 0            # içerik her değiştiğinde artar
+        self.stat_calls = 0
+        self.reads = 0
+        self.parses = 0
+        self.errors = 0
+        self._key = None
+        self._raw = None
+        self._racy = False
 
     def read(self):
+        """Returns the last successfully parsed object (dict) or None."""
+        self.stat_calls += 1
         try:
-            if not os.path.exists(self.path):
-                return None
+            st = os.stat(self.path)
+        except OSError:
+            # Dosya yok (ya da unlink + rename arasındayız)
+            if self._key is not None or self.data is not None:
+                self._key = None
+                self._raw = None
+                self._set(None)
+            return None
+
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if key == self._key and not self._racy:
+            return self.data
+
+        self.reads += 1
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read(MAX_FILE_BYTES + 1)
+        except OSError:
+            return self.data
+        if len(raw) > MAX_FILE_BYTES:
+            self.errors += 1
+            self._key = key
+            self._set(None)
+            return None
+
+        coarse = st.st_mtime_ns % 1_000_000_000 == 0
+        window = self.COARSE_RACY_NS if coarse else self.RACY_NS
+        self._racy = (time.time_ns() - st.st_mtime_ns) < window
+        if raw == self._raw:
+            self._key = key
+            return self.data
+
+        try:
+            parsed = json.loads(raw.decode("utf-8-sig"))
+        except (ValueError, UnicodeDecodeError):
+            # Yarım yazılmış dosya: key'i kaydetme, sonraki çağrıda tekrar dene
+            self.errors += 1
+            return self.data
+
+        self.parses += 1
+        self._key = key
+        self._raw = raw
+        self._set(parsed if isinstance(parsed, dict) else None)
+        return self.data
 
-            # 2 kez dene (write sırasında yakalarsak)
-            data = None
-            for _ in range(2):
-                try:
-                    with open(self.path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    break
-                except json.JSONDecodeError:
-                    time.sleep(0.05)
-
-            if not isinstance(data, dict):
+    def _set(self, data):
+        self.data = data
+        self.version += 1
+
+
+class MediaFallback:
+    def __init__(self, path=None):
+        self.path = path or _nowplaying_path()
+        self.file = NowPlayingFile(self.path)
+
+    def read(self, now_ms=None):
+        try:
+            data = self.file.read()
+            if not data:
                 return None
 
-            now_ms = int(time.time() * 1000)
+            if now_ms is None:
+                now_ms = int(time.time() * 1000)
             ts = int(data.get("ts") or 0)
 
             # YT kapalıysa dosya yaşlanır -> fallback KAPAT
-            if (now_ms - ts) > 3000:   # 3 saniyeden eskiyse hiç kullanma
+            if (now_ms - ts) > STALE_MS:   # 3 saniyeden eskiyse hiç kullanma
                 return None
 
             title = (data.get("title") or "").strip()
@@ -59,6 +136,8 @@ class MediaFallback:
                 "progress": max(progress, 0),
                 "duration": max(duration, 1),
                 "paused": paused,
+                "source": data.get("source") or "",   # "foobar2000", "mpv"... boşsa eski YT scripti
+                "updated_ms": ts,                     # progress_ms'in ölçüldüğü an
             }
         except Exception:
             return None
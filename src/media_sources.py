@@ -0,0 +1,329 @@
+"""
+Media source providers and the arbitration engine that picks which one the
+player shows.
+
+Every provider (Spotify API, SMTC, browser extension, now-playing file)
+implements `MediaSource.poll(now_ms)` and returns an immutable `MediaInfo`.
+`MediaArbiter.tick()` polls them, applies priorities, hold times and
+stickiness, and publishes one immutable `MediaSnapshot` for the render loop.
+Providers fed by background threads (Spotify, SMTC) only swap a reference
+under a lock, so the render loop never waits on a network or COM call.
+"""
+import logging
+from threading import Lock
+from time import time
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger("OLED Customizer.MediaSources")
+
+
+class MediaInfo(NamedTuple):
+    title: str
+    artist: str
+    progress: int       # ms, -1 = bilinmiyor
+    duration: int       # ms
+    paused: bool
+    source: str         # ikon: "spotify" / "youtube" / "generic"
+    updated_ms: int     # progress'in ölçüldüğü an; değişmediyse yeni veri yok demektir
+    album: str = ""
+    artwork: object = ""   # kapak: URL (Spotify, extension) ya da resim byte'ları (SMTC)
+
+    def as_payload(self):
+        """Dict form expected by DisplayManager._apply_to_player."""
+        return {
+            "title": self.title,
+            "artist": self.artist,
+            "progress": self.progress,
+            "duration": self.duration,
+            "paused": self.paused,
+            "artwork": self.artwork,
+        }
+
+
+class MediaSnapshot(NamedTuple):
+    provider: Optional[str]
+    media: Optional[MediaInfo]
+    playing: bool       # player gösterilmeli mi (aktif çalan kaynak var)
+    seq: int            # seçili kaynağın veri sayacı; değiştiyse player'a uygula
+
+
+EMPTY_SNAPSHOT = MediaSnapshot(None, None, False, 0)
+
+
+class SourcePolicy(NamedTuple):
+    priority: int       # büyük olan kazanır
+    hold_ms: int        # veri gelmese de "hala çalıyor" sayılma süresi
+    sticky_ms: int      # son veriden sonra bu süre boyunca düşük öncelikliler maskelenir
+
+
+DEFAULT_POLICIES = {
+    "spotify": SourcePolicy(priority=30, hold_ms=3000, sticky_ms=0),
+    "extension": SourcePolicy(priority=20, hold_ms=3000, sticky_ms=5000),
+    "smtc": SourcePolicy(priority=10, hold_ms=3000, sticky_ms=0),
+    "file": SourcePolicy(priority=0, hold_ms=3000, sticky_ms=0),
+}
+
+
+def _now_ms():
+    return int(time() * 1000)
+
+
+def _icon_for_app(app_id):
+    app_id = (app_id or "").lower()
+    if "spotify" in app_id:
+        return "spotify"
+    if "chrome" in app_id or "edge" in app_id or "firefox" in app_id or "opera" in app_id:
+        return "youtube"
+    return "generic"
+
+
+def _icon_for_site(site):
+    site = (site or "").lower()
+    if "spotify" in site:
+        return "spotify"
+    if "youtube" in site or not site:
+        return "youtube"  # v1 payload'ı sadece YouTube'dan gelir
+    return "generic"
+
+
+class MediaSource:
+    """Provider interface. `poll` must be cheap and never block."""
+    name = "base"
+
+    def poll(self, now_ms) -> Optional[MediaInfo]:
+        raise NotImplementedError
+
+
+class PushMediaSource(MediaSource):
+    """
+    Base for providers fed from a background thread via `push`. Data older
+    than `ttl_ms` is no longer reported (the feeding thread died or stalled).
+    """
+
+    def __init__(self, ttl_ms=3000):
+        self.ttl_ms = ttl_ms
+        self._lock = Lock()
+        self._info = None
+
+    def _store(self, info):
+        with self._lock:
+            self._info = info
+
+    def poll(self, now_ms):
+        with self._lock:
+            info = self._info
+        if info is not None and now_ms - info.updated_ms > self.ttl_ms:
+            return None
+        return info
+
+
+class SpotifySource(PushMediaSource):
+    name = "spotify"
+
+    def push(self, song_data, now_ms):
+        """Called from the Spotify poll thread with a `fetch_song` result."""
+        if not song_data:
+            # 204 / ağ hatası: mevcut durumu koru, hold süresi bitince düşer
+            return
+        self._store(MediaInfo(
+            title=song_data.get("title", ""),
+            artist=song_data.get("artist", ""),
+            progress=int(song_data.get("progress") or 0),
+            duration=max(int(song_data.get("duration") or 1), 1),
+            paused=bool(song_data.get("paused", False)),
+            source="spotify",
+            updated_ms=now_ms,
+            artwork=song_data.get("artwork") or "",
+        ))
+
+
+class SmtcSource(PushMediaSource):
+    name = "smtc"
+
+    def push(self, data, now_ms):
+        """Called from the SMTC poll loop with a `WindowsMedia.get_media_info` result."""
+        if not data or not (data.get("title") or data.get("artist")):
+            self._store(None)
+            return
+        self._store(MediaInfo(
+            title=data.get("title") or "",
+            artist=data.get("artist") or "",
+            progress=int(data.get("progress", -1)),
+            duration=int(data.get("duration") or 1),
+            paused=bool(data.get("paused", False)),
+            source=_icon_for_app(data.get("source")),
+            updated_ms=now_ms,
+            album=data.get("album") or "",
+            artwork=data.get("thumbnail") or "",
+        ))
+
+
+class ExtensionSource(MediaSource):
+    name = "extension"
+
+    def __init__(self, receiver):
+        self.receiver = receiver
+
+    def poll(self, now_ms):
+        entry = self.receiver.get_latest_entry()
+        if not entry:
+            return None
+        data, received_ms = entry
+        playing = bool(data.get("playing"))
+        progress = data.get("progress")
+        return MediaInfo(
+            title=data.get("title") or "",
+            artist=data.get("artist") or "",
+            # extension saniye gönderir; None = sayfada media element yok
+            progress=int(progress * 1000) if progress is not None else -1,
+            duration=int((data.get("duration") or 0) * 1000),
+            paused=not playing,
+            source=_icon_for_site(data.get("site")),
+            updated_ms=received_ms,
+            album=data.get("album") or "",
+            artwork=data.get("artwork") or "",
+        )
+
+
+class FileSource(MediaSource):
+    """
+    Now-playing JSON file written by an external script (foobar2000, mpv or
+    MPD bridges, the YouTube helper; see MediaFallback). Each poll is a
+    single os.stat(); the file is parsed only when it changed.
+    """
+    name = "file"
+
+    def __init__(self, fallback, min_interval_ms=250):
+        self.fallback = fallback
+        self.min_interval_ms = min_interval_ms
+        self._last_read_ms = 0
+        self._info = None
+
+    def poll(self, now_ms):
+        if now_ms - self._last_read_ms < self.min_interval_ms:
+            return self._info
+        self._last_read_ms = now_ms
+
+        data = self.fallback.read(now_ms)
+        if not data:
+            self._info = None
+            return None
+        if self._info is not None and self._info.updated_ms == data["updated_ms"]:
+            return self._info
+        self._info = MediaInfo(
+            title=data["title"],
+            artist=data["artist"],
+            progress=data["progress"],
+            duration=data["duration"],
+            paused=data["paused"],
+            source=_icon_for_app(data["source"]) if data["source"] else "youtube",
+            updated_ms=data["updated_ms"],
+        )
+        return self._info
+
+
+class _SourceState:
+    __slots__ = ("source", "policy", "info", "last_seen_ms", "last_playing_ms", "seq")
+
+    def __init__(self, source, policy):
+        self.source = source
+        self.policy = policy
+        self.info = None
+        self.last_seen_ms = -1 << 62
+        self.last_playing_ms = -1 << 62
+        self.seq = 0
+
+
+class MediaArbiter:
+    """
+    Picks the media shown on the OLED:
+      1. Sources are visited by priority; one with data inside its `sticky_ms`
+         window masks every lower-priority source (extension over SMTC).
+         Masked sources are not polled at all.
+      2. The highest-priority unmasked source that is playing (or last played
+         within `hold_ms`) wins.
+      3. Otherwise the most recently playing unmasked source is reported as
+         paused so the player can do its pause bookkeeping.
+    A source that stops reporting keeps its last data for `hold_ms`, then
+    drops out.
+    """
+
+    def __init__(self, sources=(), policies=None, clock=None):
+        self.clock = clock or _now_ms
+        self._policies = dict(DEFAULT_POLICIES)
+        if policies:
+            self._policies.update(policies)
+        self._states = []
+        self._snapshot = EMPTY_SNAPSHOT
+        for source in sources:
+            self.add_source(source)
+
+    def add_source(self, source, policy=None):
+        policy = policy or self._policies.get(source.name) or SourcePolicy(0, 3000, 0)
+        self._states.append(_SourceState(source, policy))
+        self._states.sort(key=lambda s: s.policy.priority, reverse=True)
+
+    def configure(self, name, **changes):
+        """Update a provider's policy, e.g. configure("spotify", hold_ms=6000)."""
+        for state in self._states:
+            if state.source.name == name:
+                state.policy = state.policy._replace(**changes)
+        if name in self._policies:
+            self._policies[name] = self._policies[name]._replace(**changes)
+        self._states.sort(key=lambda s: s.policy.priority, reverse=True)
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    def tick(self, now_ms=None):
+        if now_ms is None:
+            now_ms = self.clock()
+
+        active = None
+        fallback = None
+        masked = False
+
+        for state in self._states:
+            if masked:
+                continue
+            info = state.source.poll(now_ms)
+
+            if info is not None:
+                if state.info is None or info.updated_ms != state.info.updated_ms:
+                    state.seq += 1
+                state.info = info
+                # Kaynak veriyi hala sunuyorsa "görülüyor" sayılır (push kanalında
+                # olay yokken veri yenilenmez ama geçerlidir). Veri kesilince son
+                # bilinen durum kalır, hold_ms bitene kadar "çalıyor" sayılır.
+                state.last_seen_ms = now_ms
+                if not info.paused:
+                    state.last_playing_ms = now_ms
+            elif state.info is not None and now_ms - state.last_seen_ms > state.policy.hold_ms:
+                # Kaynak sustu ve hold bitti: son bilinen (pause'daki) veriyi bırak
+                state.info = None
+
+            if state.info is None:
+                if now_ms - state.last_seen_ms < state.policy.sticky_ms:
+                    masked = True
+                continue
+
+            policy = state.policy
+            if active is None and not state.info.paused \
+                    and (now_ms - state.last_playing_ms) <= policy.hold_ms:
+                active = state
+            if fallback is None or state.last_playing_ms > fallback.last_playing_ms:
+                fallback = state
+
+            if now_ms - state.last_seen_ms < policy.sticky_ms:
+                masked = True
+
+        chosen = active or fallback
+        if chosen is None:
+            snapshot = EMPTY_SNAPSHOT
+        else:
+            snapshot = MediaSnapshot(chosen.source.name, chosen.info, active is not None, chosen.seq)
+
+        if snapshot != self._snapshot:
+            self._snapshot = snapshot
+        return self._snapshot
@@ -0,0 +1,176 @@
+"""
+Live microphone input level for the volume overlay.
+
+A `LevelSource` returns the current peak (0..1) on demand:
+  - EndpointPeakSource: IAudioMeterInformation of the default microphone
+    (pycaw, Windows). Capture meters only move while some app (Discord,
+    a call) has the mic open, which is exactly when the bar is useful.
+  - SyntheticLevelSource: speech-like bursts, for Linux and benchmarks
+
+`MicLevelSampler` polls the source at a fixed rate on its own thread into
+a small ring buffer. The renderer reads `latest` only. The thread exists
+only between `start()` and `stop()`; the overlay stops it when hidden, so
+there is no idle cost.
+"""
+import logging
+import math
+import threading
+import time
+
+try:
+    import comtypes
+    from comtypes import CLSCTX_ALL
+    from ctypes import POINTER, cast
+    from pycaw.pycaw import AudioUtilities, IAudioMeterInformation
+except ImportError:  # Windows dışı ya da pycaw yok
+    AudioUtilities = None
+
+logger = logging.getLogger("OLED Customizer.MicMeter")
+
+FLOOR_DB = -60.0
+RETRY_SECONDS = 5.0     # mikrofon açılamadıysa her karede yeniden denemeyelim
+
+
+def peak_to_level(peak):
+    """Linear peak -> 0..1 on a dB scale (-60 dB .. 0 dB), so speech is visible."""
+    if peak <= 0.0:
+        return 0.0
+    db = 20.0 * math.log10(peak)
+    return min(1.0, max(0.0, 1.0 - db / FLOOR_DB))
+
+
+class LevelSource:
+    def open(self):
+        pass
+
+    def read(self) -> float:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class EndpointPeakSource(LevelSource):
+    """Default communications microphone peak meter. Opened on the sampler thread."""
+
+    def __init__(self):
+        self._meter = None
+
+    @staticmethod
+    def available():
+        return AudioUtilities is not None
+
+    def open(self):
+        comtypes.CoInitialize()
+        device = AudioUtilities.GetMicrophone()
+        if not device:
+            raise RuntimeError("no microphone")
+        interface = device.Activate(IAudioMeterInformation._iid_, CLSCTX_ALL, None)
+        self._meter = cast(interface, POINTER(IAudioMeterInformation))
+
+    def read(self):
+        return float(self._meter.GetPeakValue())
+
+    def close(self):
+        self._meter = None
+        try:
+            comtypes.CoUninitialize()
+        except Exception:
+            pass
+
+
+class SyntheticLevelSource(LevelSource):
+    """Syllable-rate (~4 Hz) bursts with pauses between phrases, plus a low noise floor."""
+
+    def __init__(self, seed=0):
+        self._t0 = time.perf_counter()
+        self._phase = seed * 0.37
+
+    def read(self):
+        t = time.perf_counter() - self._t0 + self._phase
+        phrase = 1.0 if (t % 3.0) < 2.0 else 0.0
+        syllable = max(0.0, math.sin(2 * math.pi * 4.0 * t))
+        return 0.002 + phrase * 0.5 * syllable
+
+
+class MicLevelSampler:
+    def __init__(self, source, rate_hz=30, size=32):
+        self.source = source
+        self.interval = 1.0 / rate_hz
+        self.size = size
+        self._ring = [0.0] * size
+        self._index = 0             # bir sonraki yazılacak yer
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._failed_at = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    @property
+    def latest(self):
+        """Most recent level (0..1); 0 when not sampling."""
+        if not self.running:
+            return 0.0
+        return self._ring[(self._index - 1) % self.size]
+
+    def history(self):
+        """Levels oldest -> newest."""
+        return self._ring[self._index:] + self._ring[:self._index]
+
+    def start(self):
+        if self.running:
+            return
+        if self._failed_at is not None and time.monotonic() - self._failed_at < RETRY_SECONDS:
+            return
+        previous = self._thread
+        self._ring = [0.0] * self.size
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop, previous), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, stop, previous):
+        if previous is not None:
+            previous.join()  # eski thread kaynağı kapatmadan yeniden açma
+        try:
+            self.source.open()
+        except Exception as e:
+            logger.debug(f"Mic meter unavailable: {e}")
+            self._failed_at = time.monotonic()
+            self.source.close()
+            return
+        self._failed_at = None
+
+        try:
+            next_at = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    level = peak_to_level(self.source.read())
+                except Exception as e:
+                    logger.debug(f"Mic meter read failed: {e}")
+                    break
+                self._ring[self._index] = level
+                self._index = (self._index + 1) % self.size
+                self.samples += 1
+
+                # Sabit oran: gecikme birikmesin
+                next_at += self.interval
+                delay = next_at - time.perf_counter()
+                if delay < 0:
+                    next_at = time.perf_counter()
+                    delay = 0
+                stop.wait(delay)
+        finally:
+            self.source.close()
+
+
+def create_mic_meter():
+    """Sampler on the default microphone's peak meter, or None without pycaw."""
+    if EndpointPeakSource.available():
+        return MicLevelSampler(EndpointPeakSource())
+    return None
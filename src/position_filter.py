@@ -0,0 +1,149 @@
+"""
+Media position estimator.
+
+Every media source reports its playback position with its own jitter:
+Spotify answers late, SMTC only updates `last_updated_time` on state
+changes (WindowsMedia extrapolates from it) and the extension rounds to
+its polling period. Instead of snapping the player on fixed thresholds we
+run a small alpha-beta filter (a steady-state Kalman filter) per source
+that tracks offset and rate against the local clock, rejects single
+outliers, detects real seeks and never moves backwards while playing.
+`should_snap()` tells the player when to follow the estimate; a player
+running ahead is pulled back once it leads by `backtrack_tolerance_ms`.
+"""
+
+
+class PositionEstimator:
+    def __init__(
+        self,
+        seek_threshold_ms=1500,
+        confirm_tolerance_ms=750,
+        certain_seek_ms=10000,
+        backtrack_tolerance_ms=500,
+        alpha=0.3,
+        beta=0.02,
+        min_rate=0.95,
+        max_rate=1.05,
+        confirm_seeks=True,
+    ):
+        """
+        seek_threshold_ms: tahminden bu kadar sapan ölçüm seek adayıdır.
+        confirm_tolerance_ms: aday, bir sonraki ölçüm onu doğrularsa seek sayılır
+                              (tek seferlik sapmalar outlier olarak atılır).
+        certain_seek_ms: bundan büyük sıçrama outlier olamaz, doğrulama beklemeden
+                         seek sayılır (seek gecikmesi bir poll kısalır).
+        backtrack_tolerance_ms: oynatıcı tahminden bu kadar öndeyse geri çekilir;
+                                altındaki farkta saniye geri gitmesin diye beklenir.
+        alpha / beta: pozisyon ve hız (rate) düzeltme kazançları.
+        confirm_seeks: False ise ilk büyük sapma direkt seek sayılır (seyrek ama
+                       doğru veri veren kaynaklar için, örn. Spotify API).
+        """
+        self.seek_threshold_ms = seek_threshold_ms
+        self.confirm_tolerance_ms = confirm_tolerance_ms
+        self.certain_seek_ms = certain_seek_ms
+        self.backtrack_tolerance_ms = backtrack_tolerance_ms
+        self.alpha = alpha
+        self.beta = beta
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.confirm_seeks = confirm_seeks
+
+        self._position = None   # filtrelenmiş pozisyon (ms), _t anında
+        self._rate = 1.0        # medya ms / saat ms
+        self._t = 0
+        self._playing = False
+        self._output = 0.0      # dışarı verilen son değer (geri gitmez)
+        self._pending = None    # (pozisyon, zaman) - doğrulanmamış seek adayı
+
+    def reset(self, position_ms, now_ms, playing=True):
+        self._position = float(position_ms)
+        self._t = now_ms
+        self._playing = playing
+        self._output = float(position_ms)
+        self._pending = None
+
+    def predict(self, now_ms):
+        if self._position is None:
+            return 0.0
+        if not self._playing:
+            return self._position
+        return self._position + self._rate * (now_ms - self._t)
+
+    def position(self, now_ms):
+        """Smoothed position at `now_ms`; monotonic between seeks while playing."""
+        value = self.predict(now_ms)
+        if self._playing and value < self._output:
+            return self._output
+        self._output = value
+        return value
+
+    def should_snap(self, displayed_ms, position_ms, seeked=False):
+        """
+        Whether a player showing `displayed_ms` should jump to `position_ms`
+        (the value returned by update/position). Forward corrections always
+        apply; backward ones only on a seek, in pause, or past the tolerance.
+        """
+        if seeked or not self._playing:
+            return True
+        if position_ms > displayed_ms:
+            return True
+        return displayed_ms - position_ms > self.backtrack_tolerance_ms
+
+    def update(self, position_ms, now_ms, playing=True):
+        """
+        Feed one sample. Returns (position_ms, seeked) where `seeked` tells the
+        caller the jump is real and the player should snap to it.
+        """
+        if position_ms is None or position_ms < 0:
+            # Kaynak pozisyonu bilmiyor (SMTC -1): sadece tahmine devam et
+            self._advance(now_ms, playing)
+            return self.position(now_ms), False
+
+        if self._position is None:
+            self.reset(position_ms, now_ms, playing)
+            return float(position_ms), True
+
+        if not playing:
+            # Pause'da kaynak pozisyonu doğrudur, yumuşatmaya gerek yok
+            seeked = abs(position_ms - self.predict(now_ms)) > self.seek_threshold_ms
+            self.reset(position_ms, now_ms, playing=False)
+            return float(position_ms), seeked
+
+        if not self._playing:
+            # Play'e geçiş: pause pozisyonundan devam et
+            self.reset(position_ms, now_ms, playing=True)
+            return float(position_ms), False
+
+        predicted = self.predict(now_ms)
+        residual = position_ms - predicted
+
+        if abs(residual) > self.seek_threshold_ms:
+            if not self.confirm_seeks or abs(residual) > self.certain_seek_ms:
+                self.reset(position_ms, now_ms, playing=True)
+                return float(position_ms), True
+
+            pending = self._pending
+            if pending is not None:
+                expected = pending[0] + (now_ms - pending[1])
+                if abs(position_ms - expected) <= self.confirm_tolerance_ms:
+                    self.reset(position_ms, now_ms, playing=True)
+                    return float(position_ms), True
+            # İlk sapma: outlier olabilir, bir ölçüm daha bekle
+            self._pending = (position_ms, now_ms)
+            return self.position(now_ms), False
+
+        self._pending = None
+        dt = now_ms - self._t
+        self._position = predicted + self.alpha * residual
+        if dt > 0:
+            rate = self._rate + self.beta * residual / dt
+            self._rate = min(self.max_rate, max(self.min_rate, rate))
+        self._t = now_ms
+        return self.position(now_ms), False
+
+    def _advance(self, now_ms, playing):
+        if self._position is None:
+            return
+        self._position = self.predict(now_ms)
+        self._t = now_ms
+        self._playing = playing
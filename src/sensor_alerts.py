@@ -0,0 +1,147 @@
+"""
+Threshold alerts on sensor snapshots.
+
+An `AlertRule` fires when a metric stays past its threshold for `hold`
+seconds ("CPU temp above 90 for 5 s"). Hysteresis: once a breach starts,
+the hold timer and the active state last until the value comes back past
+`clear` (e.g. below 85), so a reading that hovers around the threshold
+neither restarts the timer nor re-fires. After firing, a rule stays quiet
+for `cooldown` seconds even if it clears and breaches again.
+
+`AlertEvaluator.evaluate(snapshot)` walks the rules once (O(rules)) on
+per-rule state preallocated at construction, using the snapshot's own
+`taken` time; it never reads a sensor.
+
+Rules come from the "hw_alerts" preference, a list of objects like
+    {"metric": "cpu_temp", "above": 90, "for": 5, "clear": 85, "cooldown": 60}
+    {"metric": "gpu_load", "above": 99, "for": 30}
+"""
+import logging
+from typing import NamedTuple
+
+from src.sensor_sampler import SensorSnapshot
+from src.throughput import format_rate
+
+logger = logging.getLogger("OLED Customizer.SensorAlerts")
+
+# metrik -> (etiket, birim); birim None ise format_rate (byte/s)
+ALERT_METRICS = {
+    "cpu_temp": ("CPU", "°C"),
+    "cpu_usage": ("CPU", "%"),
+    "gpu_temp": ("GPU", "°C"),
+    "gpu_load": ("GPU", "%"),
+    "ram_percent": ("RAM", "%"),
+    "fan_rpm": ("FAN", " RPM"),
+    "net_down": ("NET DOWN", None),
+    "net_up": ("NET UP", None),
+    "disk_read": ("DISK R", None),
+    "disk_write": ("DISK W", None),
+}
+
+DEFAULT_HYSTERESIS = 0.05   # clear verilmezse eşiğin %5'i geri
+DEFAULT_COOLDOWN = 60.0
+
+
+class AlertRule(NamedTuple):
+    metric: str
+    threshold: float
+    clear: float
+    above: bool
+    hold: float         # saniye
+    cooldown: float     # saniye
+    label: str
+
+
+def parse_rule(spec):
+    """One "hw_alerts" entry -> AlertRule. Raises ValueError on a bad entry."""
+    if not isinstance(spec, dict):
+        raise ValueError(f"rule must be an object: {spec!r}")
+    metric = spec.get("metric")
+    if metric not in ALERT_METRICS:
+        raise ValueError(f"unknown metric {metric!r}")
+    if ("above" in spec) == ("below" in spec):
+        raise ValueError(f"{metric}: give exactly one of 'above' / 'below'")
+
+    above = "above" in spec
+    threshold = float(spec["above" if above else "below"])
+    margin = abs(threshold) * DEFAULT_HYSTERESIS
+    clear = float(spec.get("clear", threshold - margin if above else threshold + margin))
+    if (above and clear > threshold) or (not above and clear < threshold):
+        raise ValueError(f"{metric}: 'clear' must be on the safe side of the threshold")
+
+    hold = max(0.0, float(spec.get("for", 0)))
+    cooldown = max(0.0, float(spec.get("cooldown", DEFAULT_COOLDOWN)))
+    label = str(spec.get("label") or ALERT_METRICS[metric][0])
+    return AlertRule(metric, threshold, clear, above, hold, cooldown, label)
+
+
+def parse_rules(specs):
+    """Valid rules from the preference list; bad entries are logged and skipped."""
+    rules = []
+    for spec in specs or ():
+        try:
+            rules.append(parse_rule(spec))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring alert rule: {e}")
+    return rules
+
+
+def format_value(metric, value):
+    """Display text for a metric value ("92°C", "100%", "12.3MB/s")."""
+    if value is None:
+        return "--"
+    unit = ALERT_METRICS[metric][1]
+    if unit is None:
+        return "".join(format_rate(value))
+    return f"{value:.0f}{unit}"
+
+
+class AlertEvaluator:
+    def __init__(self, rules=()):
+        self.rules = tuple(rules)
+        n = len(self.rules)
+        self._fields = [SensorSnapshot._fields.index(rule.metric) for rule in self.rules]
+        self._since = [None] * n            # ihlalin başladığı an (clear'a dönünce None)
+        self._active = [False] * n
+        self._last_fired = [float("-inf")] * n
+        self.fired = 0
+
+    def evaluate(self, snapshot):
+        """
+        Update every rule with one snapshot. Returns the first rule (in
+        list order) that fired on this snapshot, or None.
+        """
+        now = snapshot.taken
+        fired = None
+        for i, rule in enumerate(self.rules):
+            value = snapshot[self._fields[i]]
+            if value is None:
+                continue  # okuma yok: durumu olduğu gibi bırak
+
+            if rule.above:
+                breach, cleared = value > rule.threshold, value <= rule.clear
+            else:
+                breach, cleared = value < rule.threshold, value >= rule.clear
+
+            if cleared:
+                self._since[i] = None
+                self._active[i] = False
+                continue
+            if self._active[i]:
+                continue
+            if self._since[i] is None:
+                if not breach:
+                    continue  # eşikle clear arasında, ihlal başlamadı
+                self._since[i] = now
+            if now - self._since[i] >= rule.hold:
+                self._active[i] = True
+                if now - self._last_fired[i] >= rule.cooldown:
+                    self._last_fired[i] = now
+                    self.fired += 1
+                    if fired is None:
+                        fired = rule
+        return fired
+
+    def active(self):
+        """Rules currently past their threshold (after hold), in list order."""
+        return [rule for rule, on in zip(self.rules, self._active) if on]
@@ -0,0 +1,402 @@
+"""
+Pluggable hardware sensor backends.
+
+Each backend reads some of HARDWARE_METRICS from one source:
+
+    LhmBackend          LibreHardwareMonitor via pythonnet (SensorCatalog)
+    WmiThermalBackend   root/WMI MSAcpi_ThermalZoneTemperature (CPU temp)
+    OhmWmiBackend       root/OpenHardwareMonitor Sensor() (OHM must be running)
+    PsutilBackend       psutil.sensors_temperatures() / sensors_fans()
+    SysfsHwmonBackend   /sys/class/hwmon, descriptors kept open, os.pread
+
+`BackendSelector.probe()` opens every backend once, times a few reads and
+ranks, per metric, the backends that returned a real value (see
+`is_reading`: 0 counts for GPU load and fan RPM). The static `quality` of
+a backend decides first (LHM > OHM > sysfs / psutil > ACPI WMI, which
+reports a motherboard thermal zone rather than the CPU die); latency only
+breaks ties. `read()` then asks each chosen backend once for its metrics
+and walks down the ranking only for metrics that came back empty.
+"""
+import logging
+import os
+import re
+import statistics
+import threading
+import time
+
+import psutil
+
+from src.sensor_catalog import SensorCatalog
+from src.sensor_sampler import HARDWARE_METRICS, first_reading, is_reading
+
+logger = logging.getLogger("OLED Customizer.SensorBackends")
+
+try:
+    import wmi
+except ImportError:
+    wmi = None
+
+
+class BackendUnavailable(Exception):
+    pass
+
+
+class SensorBackend:
+    name = "base"
+    metrics = ()
+    quality = 0         # sıralamada önce bu (büyük olan iyi), sonra okuma süresi
+
+    def open(self):
+        """Acquire the source; raise BackendUnavailable if it is not there."""
+
+    def begin_sample(self):
+        """Called once per sample before any read(); refresh shared state here."""
+
+    def read(self, metrics):
+        """{metric: float | None} for the requested metrics this backend provides."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LhmBackend(SensorBackend):
+    name = "lhm"
+    metrics = ("cpu_temp", "gpu_temp", "gpu_load", "fan_rpm")
+    quality = 40
+
+    def __init__(self):
+        self.computer = None
+        self.catalog = None
+        self._lock = threading.Lock()
+        self._updated = False       # bu örnekte Update() yapıldı mı
+
+    def open(self):
+        try:
+            import ctypes
+            if ctypes.windll.shell32.IsUserAnAdmin() == 0:
+                logger.warning("Not running as Admin - LHM sensors might fail")
+            import HardwareMonitor.Hardware as HW
+        except Exception as e:
+            raise BackendUnavailable(f"LibreHardwareMonitor not available: {e}")
+
+        computer = HW.Computer()
+        computer.IsCpuEnabled = True
+        computer.IsGpuEnabled = True
+        computer.IsMemoryEnabled = True
+        computer.IsMotherboardEnabled = True  # SuperIO fanları
+        computer.Open()
+        catalog = SensorCatalog(computer)
+        catalog.watch()
+        with self._lock:
+            catalog.build()
+        self.computer, self.catalog = computer, catalog
+        logger.info("Hardware monitoring initialized")
+
+    def begin_sample(self):
+        self._updated = False
+
+    def read(self, metrics):
+        # Update() istenen metrikten bağımsız: örnek başına katalogdaki her
+        # düğüm bir kez (selector aynı örnekte bu backend'e tekrar gelebilir)
+        with self._lock:
+            if not self._updated:
+                self.catalog.update()
+                self._updated = True
+            return {metric: self.catalog.read(metric) for metric in metrics}
+
+    def close(self):
+        try:
+            if self.computer is not None:
+                self.computer.Close()
+        except Exception:
+            pass
+        self.computer = self.catalog = None
+
+
+class _WmiBackend(SensorBackend):
+    """One WMI connection, re-made only if a different thread reads (COM apartments)."""
+    namespace = ""
+
+    def __init__(self):
+        self._conn = None
+        self._owner = None
+
+    def _connection(self):
+        if self._conn is None or self._owner != threading.get_ident():
+            import pythoncom
+            pythoncom.CoInitialize()
+            self._conn = wmi.WMI(namespace=self.namespace)
+            self._owner = threading.get_ident()
+        return self._conn
+
+    def open(self):
+        if wmi is None:
+            raise BackendUnavailable("wmi module not installed")
+        try:
+            self._connection()
+        except Exception as e:
+            raise BackendUnavailable(f"WMI {self.namespace}: {e}")
+
+    def close(self):
+        self._conn = None
+
+
+class WmiThermalBackend(_WmiBackend):
+    name = "wmi"
+    metrics = ("cpu_temp",)
+    quality = 10
+    namespace = "root/WMI"
+
+    def read(self, metrics):
+        for t in self._connection().MSAcpi_ThermalZoneTemperature():
+            c = (t.CurrentTemperature / 10.0) - 273.15
+            if c > 0:
+                return {"cpu_temp": c}
+        return {"cpu_temp": None}
+
+
+class OhmWmiBackend(_WmiBackend):
+    name = "ohm"
+    metrics = ("cpu_temp", "gpu_temp", "gpu_load")
+    quality = 30
+    namespace = "root\\OpenHardwareMonitor"
+
+    # metrik -> (SensorType, ad parçası)
+    SENSORS = {
+        "cpu_temp": ("Temperature", "CPU Package"),
+        "gpu_temp": ("Temperature", "GPU Core"),
+        "gpu_load": ("Load", "GPU Core"),
+    }
+
+    def read(self, metrics):
+        values = dict.fromkeys(metrics)
+        # Tek sorgu, tüm metrikler
+        for sensor in self._connection().Sensor():
+            for metric in metrics:
+                sensor_type, name = self.SENSORS[metric]
+                if values[metric] is None and sensor.SensorType == sensor_type and name in sensor.Name:
+                    values[metric] = float(sensor.Value)
+        return values
+
+
+class PsutilBackend(SensorBackend):
+    name = "psutil"
+    metrics = ("cpu_temp", "gpu_temp", "fan_rpm")
+    quality = 20
+
+    # (sürücü, etiket parçası) öncelik sırasıyla; "" = ilk giriş
+    CHIPS = {
+        "cpu_temp": (("k10temp", "tctl"), ("k10temp", "tdie"), ("zenpower", "tdie"),
+                     ("coretemp", "package"), ("cpu_thermal", ""), ("k10temp", "")),
+        "gpu_temp": (("amdgpu", "edge"), ("amdgpu", ""), ("nouveau", ""), ("radeon", "")),
+    }
+
+    def open(self):
+        if not hasattr(psutil, "sensors_temperatures"):
+            raise BackendUnavailable("psutil has no sensor support on this platform")
+
+    def read(self, metrics):
+        values = dict.fromkeys(metrics)
+        temps = psutil.sensors_temperatures() if "cpu_temp" in metrics or "gpu_temp" in metrics else {}
+        for metric in ("cpu_temp", "gpu_temp"):
+            if metric not in metrics:
+                continue
+            for chip, label in self.CHIPS[metric]:
+                entry = next((t for t in temps.get(chip, ()) if label in t.label.lower()), None)
+                if entry is not None and entry.current > 0:
+                    values[metric] = float(entry.current)
+                    break
+        if "fan_rpm" in metrics and hasattr(psutil, "sensors_fans"):
+            values["fan_rpm"] = first_reading("fan_rpm", (f.current for fans in psutil.sensors_fans().values()
+                                                          for f in fans))
+        return values
+
+
+class SysfsHwmonBackend(SensorBackend):
+    """
+    Reads hwmon attribute files directly. The chips are scanned once in
+    open(); every attribute that feeds a metric stays open and a read is
+    one os.pread() per file (sysfs regenerates the value at offset 0).
+    """
+    name = "sysfs"
+    metrics = ("cpu_temp", "gpu_temp", "gpu_load", "fan_rpm")
+    quality = 20
+
+    CPU_CHIPS = ("k10temp", "zenpower", "coretemp", "cpu_thermal")
+    CPU_LABELS = ("tctl", "tdie", "package")
+    GPU_CHIPS = ("amdgpu", "nouveau", "radeon")
+
+    def __init__(self, root="/sys/class/hwmon"):
+        self.root = root
+        self._files = {}    # metric -> ((fd, ölçek), ...) zincir sırasıyla
+        self.paths = {}     # metric -> ((yol, ölçek), ...)
+
+    def open(self):
+        if not os.path.isdir(self.root):
+            raise BackendUnavailable(f"{self.root} not found")
+
+        chips = []
+        for entry in sorted(os.listdir(self.root)):
+            path = os.path.join(self.root, entry)
+            name = self._read_text(os.path.join(path, "name"))
+            if name:
+                chips.append((name, path))
+
+        paths = {metric: [] for metric in self.metrics}
+        # CPU zincirinde önce çip sırası (k10temp > coretemp...), sonra etiket
+        for name, path in sorted(chips, key=lambda chip: self._cpu_rank(chip[0])):
+            if name in self.CPU_CHIPS:
+                paths["cpu_temp"] += [(p, 1000.0) for p in self._temp_inputs(path, self.CPU_LABELS)]
+            elif name in self.GPU_CHIPS:
+                paths["gpu_temp"] += [(p, 1000.0) for p in self._temp_inputs(path, ("edge",))]
+                busy = os.path.join(path, "device", "gpu_busy_percent")
+                if os.path.exists(busy):
+                    paths["gpu_load"].append((busy, 1.0))
+            paths["fan_rpm"] += [(os.path.join(path, f), 1.0) for f in sorted(os.listdir(path))
+                                 if re.fullmatch(r"fan\d+_input", f)]
+
+        self.close()
+        self.paths = {metric: tuple(chain) for metric, chain in paths.items()}
+        for metric, chain in paths.items():
+            files = []
+            for path, scale in chain:
+                try:
+                    files.append((os.open(path, os.O_RDONLY), scale))
+                except OSError:
+                    pass
+            self._files[metric] = tuple(files)
+        if not any(self._files.values()):
+            raise BackendUnavailable("no usable hwmon sensors")
+
+    def _cpu_rank(self, name):
+        return self.CPU_CHIPS.index(name) if name in self.CPU_CHIPS else len(self.CPU_CHIPS)
+
+    def _temp_inputs(self, path, preferred):
+        """temp*_input files, the ones whose label matches `preferred` first."""
+        inputs = sorted(f for f in os.listdir(path) if re.fullmatch(r"temp\d+_input", f))
+        def rank(filename):
+            label = self._read_text(os.path.join(path, filename.replace("_input", "_label"))).lower()
+            return next((i for i, p in enumerate(preferred) if p in label), len(preferred))
+        return [os.path.join(path, f) for f in sorted(inputs, key=rank)]
+
+    @staticmethod
+    def _read_text(path):
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def read(self, metrics):
+        values = dict.fromkeys(metrics)
+        for metric in metrics:
+            values[metric] = first_reading(metric, self._read_files(metric))
+        return values
+
+    def _read_files(self, metric):
+        for fd, scale in self._files.get(metric, ()):
+            try:
+                yield int(os.pread(fd, 32, 0)) / scale
+            except (OSError, ValueError):
+                continue
+
+    def close(self):
+        for files in self._files.values():
+            for fd, _ in files:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._files = {}
+
+
+def default_backends():
+    """Every backend that might work here; probing decides."""
+    return [LhmBackend(), OhmWmiBackend(), WmiThermalBackend(), SysfsHwmonBackend(), PsutilBackend()]
+
+
+class BackendSelector:
+    def __init__(self, backends=None, metrics=HARDWARE_METRICS):
+        self.backends = default_backends() if backends is None else list(backends)
+        self.metrics = tuple(metrics)
+        self.ranking = {}       # metric -> (backend, ...) kaliteye, sonra hıza göre
+        self.costs = {}         # backend adı -> probe okuma süresi (s)
+        self._chosen = ()       # ranking'deki backend'ler (begin_sample için)
+        self.ready = False
+
+    def probe(self, rounds=3):
+        """Open every backend, time `rounds` reads, rank working backends per metric by quality, then speed."""
+        candidates = {metric: [] for metric in self.metrics}
+        for backend in self.backends:
+            metrics = [m for m in backend.metrics if m in self.metrics]
+            if not metrics:
+                continue
+            try:
+                backend.open()
+            except BackendUnavailable as e:
+                logger.debug(f"Sensor backend {backend.name}: {e}")
+                continue
+            except Exception as e:
+                logger.warning(f"Sensor backend {backend.name} failed to open: {e}")
+                continue
+
+            timings = []
+            working = set()
+            for _ in range(rounds):
+                start = time.perf_counter()
+                try:
+                    backend.begin_sample()
+                    values = backend.read(metrics)
+                except Exception as e:
+                    logger.debug(f"Sensor backend {backend.name} read failed: {e}")
+                    break
+                timings.append(time.perf_counter() - start)
+                working.update(m for m, v in values.items() if is_reading(m, v))
+
+            if not working:
+                backend.close()
+                continue
+            cost = statistics.median(timings)
+            self.costs[backend.name] = cost
+            for metric in working:
+                candidates[metric].append((cost, backend))
+
+        self.ranking = {metric: tuple(b for _, b in sorted(found, key=lambda item: (-item[1].quality, item[0])))
+                        for metric, found in candidates.items() if found}
+        self._chosen = tuple({id(b): b for chain in self.ranking.values() for b in chain}.values())
+        self.ready = True
+        logger.info("Sensor backends: " + (", ".join(
+            f"{metric}={chain[0].name} ({self.costs[chain[0].name] * 1e3:.2f}ms)"
+            for metric, chain in self.ranking.items()) or "none"))
+        return self.ranking
+
+    def read(self):
+        """{metric: value}; one read per chosen backend, fallbacks only for gaps."""
+        if not self.ready:
+            return {}
+        for backend in self._chosen:
+            backend.begin_sample()
+        values = {}
+        depth = 0
+        pending = [m for m in self.metrics if m in self.ranking]
+        while pending:
+            groups = {}
+            for metric in pending:
+                chain = self.ranking[metric]
+                if depth < len(chain):
+                    groups.setdefault(chain[depth], []).append(metric)
+            if not groups:
+                break
+            for backend, metrics in groups.items():
+                try:
+                    values.update({m: v for m, v in backend.read(metrics).items() if is_reading(m, v)})
+                except Exception as e:
+                    logger.debug(f"Sensor backend {backend.name} read failed: {e}")
+            pending = [m for m in pending if values.get(m) is None]
+            depth += 1
+        return values
+
+    def close(self):
+        for backend in self.backends:
+            backend.close()
@@ -0,0 +1,122 @@
+"""
+Sensor handle index for LibreHardwareMonitor.
+
+Walking `Computer.Hardware` and string matching every sensor is done once
+in `build()`. Each metric maps to an ordered list of resolved
+(hardware node, sensor) handles following its name fallback chain
+(e.g. CPU temperature: Tctl -> Package -> Core). A read is then a few
+`sensor.Value` attribute accesses, and `update()` refreshes every
+hardware node that owns an indexed sensor exactly once.
+
+The catalog is rebuilt when LHM reports HardwareAdded / HardwareRemoved
+or when a handle stops working.
+"""
+import logging
+from typing import NamedTuple
+
+from src.sensor_sampler import first_reading
+
+logger = logging.getLogger("OLED Customizer.SensorCatalog")
+
+
+class SensorQuery(NamedTuple):
+    hw_type: str            # "Cpu", "Gpu" (str(HardwareType) içinde aranır: GpuNvidia, GpuAmd...)
+    sensor_type: str        # "Temperature", "Load"
+    names: tuple            # ad parçaları, öncelik sırasıyla
+
+
+# HardwareMonitor'un gösterdiği metrikler ve yedek zincirleri
+DEFAULT_QUERIES = {
+    "cpu_temp": SensorQuery("Cpu", "Temperature", ("Tctl", "Package", "Core")),
+    "gpu_temp": SensorQuery("Gpu", "Temperature", ("Core", "GPU")),
+    "gpu_load": SensorQuery("Gpu", "Load", ("Core", "GPU")),
+    "fan_rpm": SensorQuery("Motherboard", "Fan", ("Fan",)),     # SuperIO alt düğümü
+}
+
+
+class SensorCatalog:
+    def __init__(self, computer, queries=None):
+        self.computer = computer
+        self.queries = dict(queries or DEFAULT_QUERIES)
+        self._handles = {}          # metric -> ((node, sensor), ...) zincir sırasıyla
+        self._nodes = ()            # Update() gereken donanım düğümleri
+        self._dirty = True
+        self.builds = 0
+
+    def invalidate(self, *_):
+        """Hardware added / removed (LHM event handler signature: hardware)."""
+        self._dirty = True
+
+    def watch(self):
+        """Subscribe to LHM hardware change events; falls back to rebuild-on-error."""
+        try:
+            self.computer.HardwareAdded += self.invalidate
+            self.computer.HardwareRemoved += self.invalidate
+            return True
+        except Exception as e:
+            logger.debug(f"Hardware change events unavailable: {e}")
+            return False
+
+    def build(self):
+        # Her sensörün metinleri tek sefer küçük harfe çevrilir
+        entries = []    # (hw_type_lower, node, sensor_type_lower, name_lower, sensor)
+        for hw in self.computer.Hardware:
+            hw_type = str(hw.HardwareType).lower()
+            try:
+                hw.Update()  # ilk Update'ten önce bazı sensörler listelenmez
+            except Exception:
+                pass
+            for node in [hw, *hw.SubHardware]:
+                if node is not hw:
+                    try:
+                        node.Update()
+                    except Exception:
+                        pass
+                for sensor in node.Sensors:
+                    entries.append((hw_type, node, str(sensor.SensorType).lower(), str(sensor.Name).lower(), sensor))
+
+        handles = {}
+        nodes = []
+        for metric, query in self.queries.items():
+            hw_type = query.hw_type.lower()
+            sensor_type = query.sensor_type.lower()
+            chain = []
+            for pattern in query.names:
+                pattern = pattern.lower()
+                for entry_hw, node, entry_type, name, sensor in entries:
+                    if hw_type in entry_hw and sensor_type in entry_type and pattern in name:
+                        chain.append((node, sensor))
+                        if not any(node is n for n in nodes):
+                            nodes.append(node)
+            handles[metric] = tuple(chain)
+
+        self._handles = handles
+        self._nodes = tuple(nodes)
+        self._dirty = False
+        self.builds += 1
+        logger.info(f"Sensor catalog: {sum(len(c) for c in handles.values())} handles on {len(nodes)} nodes")
+
+    def ensure(self):
+        if self._dirty:
+            self.build()
+
+    def update(self):
+        """One Update() per hardware node that owns an indexed sensor."""
+        self.ensure()
+        for node in self._nodes:
+            try:
+                node.Update()
+            except Exception:
+                self._dirty = True
+
+    def read(self, metric):
+        """First positive value along the metric's fallback chain (0 for loads / fans), or None."""
+        self.ensure()
+        try:
+            return first_reading(metric, (sensor.Value for _, sensor in self._handles.get(metric, ())))
+        except Exception:
+            self._dirty = True  # handle bozuldu (donanım çıkarıldı): sonraki okumada yeniden kur
+        return None
+
+    def handles(self, metric):
+        return self._handles.get(metric, ())
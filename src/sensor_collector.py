@@ -0,0 +1,427 @@
+"""
+Out-of-process sensor collection.
+
+LHM (pythonnet) and WMI calls can take tens of milliseconds, hold the GIL
+while they do, and a misbehaving driver can hang them outright. With the
+collector enabled those calls run in a child process that owns every
+sensor backend and writes fixed-layout samples into a
+`multiprocessing.shared_memory` block:
+
+    seq Q | heartbeat d | interval d | touch d | stop d | keep history d
+          | taken d | fields d... | core count d | CORE_SLOTS x core percent d
+
+`seq` is a seqlock: the child makes it odd before writing the payload and
+even afterwards, so the parent reads without a lock and retries a torn
+read. `interval`, `touch`, `stop` and `keep history` are written by the
+parent; the child writes `heartbeat` on every loop. Missing values are
+stored as NaN.
+
+`SensorCollector` has the same interface as `SensorSampler` (`snapshot`,
+`touch()`, `interval`, `keep_history`, `start()`, `stop()`). A watchdog thread restarts the
+child when it exits, or when the display wants data and the heartbeat is
+older than `stall_seconds`. A child that dies before its first heartbeat
+or within FAST_FAILURE_SECONDS is restarted with exponential backoff;
+after MAX_FAST_FAILURES such failures in a row the collector gives up
+(`failed`) with one error log.
+
+The child is started as `python -m src.sensor_collector ...` (or
+`OLED-Customizer.exe --sensor-collector ...` when frozen, see main.py),
+not with multiprocessing's spawn, which would re-run main.py's setup.
+"""
+import argparse
+import importlib
+import json
+import logging
+import math
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+
+import psutil
+
+from src.sensor_sampler import EMPTY_SNAPSHOT, HARDWARE_METRICS, SensorSnapshot, read_system
+from src.throughput import ThroughputMeter
+
+logger = logging.getLogger("OLED Customizer.SensorCollector")
+
+COLLECTOR_FLAG = "--sensor-collector"
+
+CORE_SLOTS = 64
+SCALAR_FIELDS = tuple(field for field in SensorSnapshot._fields[2:] if field != "cpu_cores")
+
+HEADER = struct.Struct("<Qddddd")                           # seq, heartbeat, interval, touch, stop, keep history
+PAYLOAD = struct.Struct("<" + "d" * (1 + len(SCALAR_FIELDS) + 1 + CORE_SLOTS))   # taken, alanlar, çekirdekler
+HEARTBEAT_OFFSET = 8
+INTERVAL_OFFSET = 16
+TOUCH_OFFSET = 24
+STOP_OFFSET = 32
+HISTORY_OFFSET = 40
+PAYLOAD_OFFSET = HEADER.size
+BLOCK_SIZE = HEADER.size + PAYLOAD.size
+
+_DOUBLE = struct.Struct("<d")
+_SEQ = struct.Struct("<Q")
+
+POLL_SECONDS = 0.1              # child: stop / touch kontrol aralığı
+WATCHDOG_SECONDS = 0.5
+STARTUP_GRACE_SECONDS = 15.0    # ilk heartbeat'e kadar (import + LHM açılışı)
+FAST_FAILURE_SECONDS = 10.0     # bundan kısa yaşayan child hızlı hata sayılır
+RESTART_BACKOFF_SECONDS = 0.5   # hızlı hatada bekleme; her seferinde ikiye katlanır
+RESTART_BACKOFF_MAX = 30.0
+MAX_FAST_FAILURES = 6           # art arda bu kadar hızlı hatadan sonra vazgeç
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _get(buf, offset):
+    return _DOUBLE.unpack_from(buf, offset)[0]
+
+
+def _put(buf, offset, value):
+    _DOUBLE.pack_into(buf, offset, value)
+
+
+def write_sample(buf, values, taken):
+    """Child side: publish one sample under the seqlock."""
+    seq = _SEQ.unpack_from(buf, 0)[0]
+    _SEQ.pack_into(buf, 0, seq + 1)     # tek: yazılıyor
+    fields = [values.get(field) for field in SCALAR_FIELDS]
+    cores = tuple(values.get("cpu_cores") or ())[:CORE_SLOTS]
+    PAYLOAD.pack_into(buf, PAYLOAD_OFFSET, taken, *(math.nan if v is None else float(v) for v in fields),
+                      float(len(cores)), *cores, *([0.0] * (CORE_SLOTS - len(cores))))
+    _SEQ.pack_into(buf, 0, seq + 2)     # çift: tutarlı
+
+
+def read_sample(buf, retries=100):
+    """Parent side: (seq, payload) from a consistent read, or None if the writer kept us out."""
+    for _ in range(retries):
+        seq = _SEQ.unpack_from(buf, 0)[0]
+        if seq & 1:
+            time.sleep(0)
+            continue
+        payload = PAYLOAD.unpack_from(buf, PAYLOAD_OFFSET)
+        if _SEQ.unpack_from(buf, 0)[0] == seq:
+            return seq, payload
+    return None
+
+
+def decode_sample(seq, payload):
+    """(seq, payload) from read_sample -> SensorSnapshot."""
+    n = len(SCALAR_FIELDS)
+    values = {field: None if v != v else v for field, v in zip(SCALAR_FIELDS, payload[1:1 + n])}
+    count = int(payload[1 + n])
+    values["cpu_cores"] = tuple(payload[2 + n:2 + n + count]) if count else None
+    return SensorSnapshot(seq=seq // 2, taken=payload[0], **values)
+
+
+def load_reader(spec, args=()):
+    """'package.module:Name' -> Name(*args)."""
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)(*args)
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        # Blok parent'a ait; child'ın resource_tracker'ı çıkışta silmesin
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+def run_collector(shm_name, reader_spec, reader_args=(), parent_pid=None, idle_seconds=5.0,
+                  nic=None, disk=None):
+    """Child process main loop."""
+    shm = _attach(shm_name)
+    buf = shm.buf
+    try:
+        reader = load_reader(reader_spec, reader_args)
+        throughput = ThroughputMeter(nic, disk)
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        next_at = 0.0
+        was_idle = True
+        while True:
+            now = time.time()
+            _put(buf, HEARTBEAT_OFFSET, now)
+            if _get(buf, STOP_OFFSET) or (parent_pid and not psutil.pid_exists(parent_pid)):
+                break
+
+            # Ekran veri istemiyorsa sensörlere dokunma; grafik geçmişi
+            # isteniyorsa sadece ucuz (psutil) örnek alınır
+            idle = now - _get(buf, TOUCH_OFFSET) > idle_seconds
+            if idle and not _get(buf, HISTORY_OFFSET):
+                next_at = 0.0
+                time.sleep(POLL_SECONDS)
+                continue
+            if was_idle and not idle:
+                next_at = 0.0   # ekran geri geldi: hemen tam örnek
+            was_idle = idle
+
+            if now >= next_at:
+                values = dict.fromkeys(HARDWARE_METRICS)
+                if not idle:
+                    try:
+                        values.update(reader() or {})
+                    except Exception as e:
+                        logger.debug(f"Sensor read failed: {e}")
+                values.update(read_system())
+                values.update(throughput.sample())
+                write_sample(buf, values, time.time())
+                next_at = max(next_at + _get(buf, INTERVAL_OFFSET), time.time())
+
+            time.sleep(max(0.0, min(next_at - time.time(), POLL_SECONDS)))
+    finally:
+        buf = None
+        shm.close()
+
+
+class SensorCollector:
+    def __init__(self, reader_spec, reader_args=(), interval=1.0, idle_seconds=5.0,
+                 stall_seconds=5.0, on_change=None, history=None):
+        """
+        reader_spec: "module:callable" built inside the child, called once per sample
+        reader_args: JSON-serialisable positional arguments for it
+        on_change: called (from the watchdog thread) when a new sample shows up
+        history: optional SensorHistory; samples are recorded as they are read
+        """
+        self.reader_spec = reader_spec
+        self.reader_args = list(reader_args)
+        self.idle_seconds = idle_seconds
+        self.stall_seconds = stall_seconds
+        self.on_change = on_change
+        self.history = history
+
+        self.restarts = 0
+        self.failed = False             # child sürekli hemen çöktü, yeniden başlatılmıyor
+        self._fast_failures = 0
+        self._devices = (None, None)
+        self._respawn = False
+        self._interval = interval
+        self._keep_history = False
+        self._snapshot = EMPTY_SNAPSHOT
+        self._decode_lock = threading.Lock()
+        self._last_touch = 0.0
+        self._shm = None
+        self._proc = None
+        self._spawned_at = 0.0
+        self._running = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- SensorSampler ile aynı arayüz ---
+
+    @property
+    def interval(self):
+        return self._interval
+
+    @interval.setter
+    def interval(self, value):
+        self._interval = value
+        if self._shm is not None:
+            _put(self._shm.buf, INTERVAL_OFFSET, float(value))
+
+    @property
+    def keep_history(self):
+        return self._keep_history
+
+    @keep_history.setter
+    def keep_history(self, value):
+        self._keep_history = bool(value)
+        if self._shm is not None:
+            _put(self._shm.buf, HISTORY_OFFSET, float(self._keep_history))
+
+    @property
+    def snapshot(self):
+        """Latest sample; lock-free seqlock read, re-decoded only when seq moved."""
+        shm = self._shm
+        if shm is None:
+            return self._snapshot
+        sample = read_sample(shm.buf)
+        if sample is None or sample[0] // 2 == self._snapshot.seq:
+            return self._snapshot
+        seq, payload = sample
+        # Render ve watchdog thread'leri aynı örneği iki kez kaydetmesin
+        with self._decode_lock:
+            if seq // 2 != self._snapshot.seq:
+                snapshot = decode_sample(seq, payload)
+                if self.history is not None:
+                    self.history.push(snapshot)
+                self._snapshot = snapshot
+        return self._snapshot
+
+    @property
+    def samples(self):
+        return self.snapshot.seq
+
+    def touch(self):
+        now = time.time()
+        # Her karede shm'ye yazmaya gerek yok
+        if now - self._last_touch > POLL_SECONDS and self._shm is not None:
+            _put(self._shm.buf, TOUCH_OFFSET, now)
+            self._last_touch = now
+
+    def select_devices(self, nic=None, disk=None):
+        """NIC / disk for the throughput rates; the child is restarted with them."""
+        devices = (nic or None, disk or None)
+        if devices != self._devices:
+            self._devices = devices
+            self._respawn = self._running  # watchdog thread yeniden başlatır
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._stop.clear()
+        self._shm = shared_memory.SharedMemory(create=True, size=BLOCK_SIZE)
+        self._shm.buf[:BLOCK_SIZE] = bytes(BLOCK_SIZE)
+        _put(self._shm.buf, INTERVAL_OFFSET, float(self._interval))
+        _put(self._shm.buf, HISTORY_OFFSET, float(self._keep_history))
+        self._spawn()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self._stop.set()
+        _put(self._shm.buf, STOP_OFFSET, 1.0)
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        self._terminate(timeout=1.0)
+        self._snapshot = self.snapshot
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            pass
+        self._shm = None
+
+    # --- Child süreci ---
+
+    def _command(self):
+        args = ["--shm", self._shm.name, "--reader", self.reader_spec,
+                "--reader-args", json.dumps(self.reader_args),
+                "--parent", str(os.getpid()), "--idle", str(self.idle_seconds)]
+        nic, disk = self._devices
+        if nic:
+            args += ["--nic", nic]
+        if disk:
+            args += ["--disk", disk]
+        if getattr(sys, "frozen", False):
+            return [sys.executable, COLLECTOR_FLAG, *args]
+        return [sys.executable, "-m", "src.sensor_collector", *args]
+
+    def _spawn(self):
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        _put(self._shm.buf, HEARTBEAT_OFFSET, 0.0)
+        self._spawned_at = time.time()
+        self._proc = subprocess.Popen(
+            self._command(),
+            cwd=_PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            creationflags=creationflags,
+        )
+        logger.info(f"Sensor collector started (pid {self._proc.pid})")
+
+    def _terminate(self, timeout=0.0):
+        proc = self._proc
+        if proc is None:
+            return
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                pass
+        self._proc = None
+
+    def _watch(self):
+        last_seq = 0
+        while not self._stop.wait(WATCHDOG_SECONDS):
+            now = time.time()
+            proc = self._proc
+            heartbeat = _get(self._shm.buf, HEARTBEAT_OFFSET)
+
+            if self._respawn:
+                self._respawn = False
+                _put(self._shm.buf, STOP_OFFSET, 1.0)
+                self._terminate(timeout=2)
+                _put(self._shm.buf, STOP_OFFSET, 0.0)
+                if self._stop.is_set():
+                    break
+                self._spawn()
+                continue
+
+            if proc is None or proc.poll() is not None:
+                reason = f"exited ({proc.returncode if proc else None})"
+            elif now - self._last_touch > self.idle_seconds:
+                reason = None   # ekran veri istemiyor; boşta beklemesi normal
+            elif heartbeat:
+                reason = f"stalled for {now - heartbeat:.1f}s" if now - heartbeat > self.stall_seconds else None
+            else:
+                reason = "did not start" if now - self._spawned_at > STARTUP_GRACE_SECONDS else None
+
+            if reason:
+                if proc is not None and proc.poll() is None:
+                    proc.kill()
+                self._terminate(timeout=2)
+                if not heartbeat or now - self._spawned_at < FAST_FAILURE_SECONDS:
+                    self._fast_failures += 1
+                else:
+                    self._fast_failures = 0
+                if self._fast_failures >= MAX_FAST_FAILURES:
+                    logger.error(f"Sensor collector {reason}; it failed {self._fast_failures} times in a row "
+                                 f"right after starting, giving up")
+                    self.failed = True
+                    break
+                delay = 0.0
+                if self._fast_failures:
+                    delay = min(RESTART_BACKOFF_MAX, RESTART_BACKOFF_SECONDS * 2 ** (self._fast_failures - 1))
+                logger.warning(f"Sensor collector {reason}, restarting in {delay:.1f}s")
+                if self._stop.wait(delay):
+                    break
+                self.restarts += 1
+                self._spawn()
+                continue
+
+            # Ekran kapalıyken de geçmişe yazılsın diye her turda okunur
+            seq = self.snapshot.seq
+            if seq != last_seq:
+                last_seq = seq
+                if self.on_change:
+                    self.on_change()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="sensor_collector")
+    parser.add_argument("--shm", required=True)
+    parser.add_argument("--reader", required=True)
+    parser.add_argument("--reader-args", default="[]")
+    parser.add_argument("--parent", type=int, default=None)
+    parser.add_argument("--idle", type=float, default=5.0)
+    parser.add_argument("--nic", default=None)
+    parser.add_argument("--disk", default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="[collector] [%(levelname)s] [%(name)s] %(message)s")
+    run_collector(args.shm, args.reader, json.loads(args.reader_args), args.parent, args.idle,
+                  args.nic, args.disk)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Graph pages for the hardware monitor.
+
+Drawing happens on a boolean (height x width) NumPy frame: a column-height
+array is compared against a row-index column by broadcasting, so an area
+chart or a sparkline is a couple of array operations no matter how many
+columns change. The frame is packed with `np.packbits` and becomes a
+mode "1" image through `Image.frombytes` (the same MSB-first layout the
+OLED uses); only the text labels go through ImageDraw. The per-core page
+with few cores is the exception: a handful of bars is cheaper as one slice
+assignment per bar than as a column lookup (see SLICE_BARS).
+"""
+import math
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+
+class GraphPage(NamedTuple):
+    title: str
+    area: str                   # 0..100 yüzde metriği, dolu alan
+    line: Optional[str]         # sıcaklık, otomatik ölçekli çizgi (alanın üstüne XOR)
+
+
+# Ekran adı -> sayfa
+GRAPH_PAGES = {
+    "graph_cpu": GraphPage("CPU", "cpu_usage", "cpu_temp"),
+    "graph_gpu": GraphPage("GPU", "gpu_load", "gpu_temp"),
+    "graph_ram": GraphPage("RAM", "ram_percent", None),
+}
+
+# Çekirdek sayfası: en fazla bu kadar çubuk, fazlası komşu çekirdeklerin ortalaması
+CORES_PAGE = "cpu_cores"
+MAX_BARS = 32
+# Bu kadar çekirdeğe kadar çubuk başına dilim ataması (fill_bars); NumPy
+# column lookup'ın sabit maliyeti ancak daha fazla çubukta kendini öder
+SLICE_BARS = 8
+
+LABEL_HEIGHT = 12
+
+
+def fit_columns(values, columns):
+    """
+    Resample `values` to `columns` entries: the max of each bucket when
+    there are more samples than columns (spikes survive), nearest sample
+    when there are fewer. NaN (no data) stays NaN.
+    """
+    n = len(values)
+    if n >= columns:
+        starts = (np.arange(columns) * n) // columns
+        return np.fmax.reduceat(values, starts)
+    return values[(np.arange(columns) * n) // columns]
+
+
+def column_heights(values, lo, hi, height):
+    """Filled pixels per column (0..height) for values scaled lo..hi; NaN -> 0."""
+    scaled = np.rint((values - lo) * (height / (hi - lo)))
+    # fmax NaN'ı 0'a çeker; np.clip / nan_to_num bu boyutta çağrı maliyetine boğulur
+    return np.minimum(np.fmax(scaled, 0), height).astype(np.int16)
+
+
+@lru_cache(maxsize=8)
+def _rows(height):
+    rows = np.arange(height, dtype=np.int16)[:, None]
+    rows.setflags(write=False)
+    return rows
+
+
+def area_mask(heights, height):
+    """Columns filled from the bottom: (height x len(heights)) bool."""
+    return _rows(height) >= (height - heights)[None, :]
+
+
+def line_mask(values, lo, hi, height):
+    """
+    Sparkline: one pixel per column, joined to the previous column with a
+    vertical run so steep changes stay connected. NaN columns stay empty.
+    """
+    valid = ~np.isnan(values)
+    y = (height - 1) - np.minimum(column_heights(values, lo, hi, height - 1), height - 1)
+    prev = np.concatenate((y[:1], y[:-1]))
+    prev_valid = np.concatenate((valid[:1], valid[:-1]))
+    prev = np.where(prev_valid, prev, y)
+    top = np.minimum(y, prev)
+    bottom = np.maximum(y, prev)
+    rows = _rows(height)
+    return (rows >= top[None, :]) & (rows <= bottom[None, :]) & valid[None, :]
+
+
+def group_levels(levels, bars=MAX_BARS):
+    """Per-core percentages -> at most `bars` values (neighbours averaged: SMT siblings are adjacent)."""
+    levels = np.asarray(levels, dtype=np.float32)
+    n = len(levels)
+    if n <= bars:
+        return levels
+    starts = (np.arange(bars) * n) // bars
+    return np.add.reduceat(levels, starts) / np.diff(np.append(starts, n))
+
+
+@lru_cache(maxsize=8)
+def bar_layout(bars, width):
+    """
+    Column -> bar index for `bars` equal bars across `width`, or `bars`
+    (one past the last bar, always height 0) for the gap columns.
+    """
+    x = np.arange(width)
+    index = (x * bars) // width
+    end = ((index + 1) * width) // bars
+    gap = 1 if width // bars < 8 else 2
+    layout = np.where(x >= end - gap, bars, index)
+    layout.setflags(write=False)
+    return layout
+
+
+def bar_heights(levels, width, height):
+    """Per-column heights for vertical bars; 1 px floor so idle cores stay visible."""
+    heights = np.maximum(column_heights(levels, 0.0, 100.0, height), 1)
+    return np.append(heights, 0)[bar_layout(len(levels), width)]
+
+
+def fill_bars(area, levels):
+    """
+    Draw vertical bars into a (height x width) bool `area` with one slice
+    assignment per bar; same pixels as area_mask(bar_heights(...)).
+    """
+    height, width = area.shape
+    area[:] = False
+    bars = len(levels)
+    gap = 1 if width // bars < 8 else 2
+    scale = height / 100.0
+    for i, level in enumerate(levels):
+        x0 = -((-i * width) // bars)            # bar_layout ile aynı sütunlar
+        x1 = ((i + 1) * width) // bars - gap
+        top = height - min(max(int(round(level * scale)) if level == level else 0, 1), height)
+        area[top:, x0:x1] = True
+
+
+def autoscale(values, min_span=10.0):
+    """Whole-degree range around the finite values, at least `min_span` wide."""
+    finite = values[~np.isnan(values)]
+    if not finite.size:
+        return 0.0, 100.0
+    lo, hi = math.floor(float(finite.min())) - 1, math.ceil(float(finite.max())) + 1
+    if hi - lo < min_span:
+        mid = (hi + lo) / 2
+        lo, hi = mid - min_span / 2, mid + min_span / 2
+    return lo, hi
+
+
+def frame_to_image(frame, primary):
+    """bool (h x w) frame -> mode "1" image; set pixels get `primary`."""
+    h, w = frame.shape
+    if not primary:  # ters renk: zemin yanık, çizim sönük
+        frame = ~frame
+    return Image.frombytes("1", (w, h), np.packbits(frame, axis=1).tobytes())
+
+
+class SensorGraphs:
+    def __init__(self, config, history, font):
+        self.config = config
+        self.history = history
+        self.font = font
+        self.interval = 1.0     # örnekleme aralığı (s); pencere etiketi için
+        self.renders = 0
+        self._cache_key = None
+        self._cache_image = None
+        self._labels = {}       # (etiket, pencere, genişlik) -> bool şerit
+
+    def get_image(self, page_name, samples, now=None):
+        """
+        Graph page for the last `samples` * `interval` seconds before `now`.
+        Redrawn only when a sample was added, the history fell one more
+        interval behind `now` (sampler paused), or the page / window /
+        colors changed.
+        """
+        page = GRAPH_PAGES[page_name]
+        now = time.time() if now is None else now
+        stale = self.history.stale_columns(self.interval, now)
+        key = (page_name, samples, self.history.count, stale, self.config.primary, self.config.secondary)
+        if key == self._cache_key:
+            return self._cache_image
+
+        w, h = self.config.width, self.config.height
+        frame = np.empty((h, w), dtype=bool)
+        frame[LABEL_HEIGHT:] = self.render_graph(page, samples, h - LABEL_HEIGHT, now)
+
+        label = f"{page.title} {self._format(self.history.latest(page.area), '%')}"
+        if page.line:
+            label += f"  {self._format(self.history.latest(page.line), '°')}"
+        frame[:LABEL_HEIGHT] = self._label_strip(label, self._format_span(samples))
+
+        image = frame_to_image(frame, self.config.primary)
+        self.renders += 1
+        self._cache_key = key
+        self._cache_image = image
+        return image
+
+    def get_cores_image(self, snapshot):
+        """Per-core CPU bars (up to MAX_BARS); redrawn only for a new sample."""
+        key = (CORES_PAGE, snapshot.seq, self.config.primary, self.config.secondary)
+        if key == self._cache_key:
+            return self._cache_image
+
+        w, h = self.config.width, self.config.height
+        cores = snapshot.cpu_cores or ()
+        frame = np.empty((h, w), dtype=bool)
+        if cores and len(cores) <= SLICE_BARS:
+            fill_bars(frame[LABEL_HEIGHT:], cores)
+            right = f"max {int(round(max(cores)))}%"
+        elif cores:
+            levels = group_levels(cores)
+            frame[LABEL_HEIGHT:] = area_mask(bar_heights(levels, w, h - LABEL_HEIGHT), h - LABEL_HEIGHT)
+            right = f"max {int(round(max(cores)))}%"
+        else:
+            frame[LABEL_HEIGHT:] = False
+            right = ""
+        label = f"CPU {self._format(snapshot.cpu_usage, '%')}  {len(cores)}T"
+        frame[:LABEL_HEIGHT] = self._label_strip(label, right)
+
+        image = frame_to_image(frame, self.config.primary)
+        self.renders += 1
+        self._cache_key = key
+        self._cache_image = image
+        return image
+
+    def render_graph(self, page, samples, height, now=None):
+        """(height x width) bool: load area, temperature sparkline XOR'ed on top."""
+        w = self.config.width
+        now = time.time() if now is None else now
+        area = fit_columns(self.history.window(page.area, samples, self.interval, now), w)
+        graph = area_mask(column_heights(area, 0.0, 100.0, height), height)
+        if page.line:
+            line = fit_columns(self.history.window(page.line, samples, self.interval, now), w)
+            lo, hi = autoscale(line)
+            graph ^= line_mask(line, lo, hi, height)
+        return graph
+
+    def _label_strip(self, label, span):
+        """Label row as a bool array; text is rasterized only when it changes."""
+        key = (label, span, self.config.width)
+        strip = self._labels.get(key)
+        if strip is None:
+            w = self.config.width
+            image = Image.new("1", (w, LABEL_HEIGHT), color=0)
+            draw = ImageDraw.Draw(image)
+            draw.text((0, -1), label, font=self.font, fill=1)
+            bbox = draw.textbbox((0, 0), span, font=self.font)
+            draw.text((w - (bbox[2] - bbox[0]) - 1, -1), span, font=self.font, fill=1)
+            strip = np.array(image, dtype=bool)
+            if len(self._labels) >= 32:
+                self._labels.clear()
+            self._labels[key] = strip
+        return strip
+
+    @staticmethod
+    def _format(value, unit):
+        return f"{int(round(value))}{unit}" if value is not None else "--"
+
+    def _format_span(self, samples):
+        seconds = int(round(samples * self.interval))
+        return f"{seconds // 60}m" if seconds >= 60 and seconds % 60 == 0 else f"{seconds}s"
@@ -0,0 +1,109 @@
+"""
+Fixed-size sensor history.
+
+`SensorHistory` keeps the last `capacity` samples of each metric in one
+preallocated float16 NumPy array (metric rows x sample columns) used as a
+ring buffer, plus each column's `taken` time as float64: `push()` writes
+one column in place and never allocates, so 10 minutes at 1 Hz of five
+metrics is 600 * (5 * 2 + 8) bytes = 10.8 KB. Missing values are NaN.
+Readers get an oldest -> newest copy through `window()`.
+
+The sampler sleeps while no screen asks for data, so consecutive columns
+are not always one interval apart. Given the sampling `interval`,
+`window()` places every sample by its timestamp: a pause becomes a NaN
+gap, and a history that stopped growing slides left as time passes
+instead of being shown as the last N seconds.
+An optional `log` (SensorLog) receives every new snapshot as well.
+"""
+import math
+import time
+
+import numpy as np
+
+# Grafiği çizilen metrikler (SensorSnapshot alan adları)
+HISTORY_METRICS = ("cpu_temp", "cpu_usage", "gpu_temp", "gpu_load", "ram_percent")
+HISTORY_SECONDS = 600
+
+
+class SensorHistory:
+    def __init__(self, metrics=HISTORY_METRICS, capacity=HISTORY_SECONDS):
+        self.metrics = tuple(metrics)
+        self.capacity = int(capacity)
+        self.count = 0          # toplam örnek; yazma sütunu count % capacity
+        self.last_seq = 0
+        self.log = None         # SensorLog; her yeni örnek diske de yazılır
+        self._rows = {metric: i for i, metric in enumerate(self.metrics)}
+        self._data = np.full((len(self.metrics), self.capacity), np.nan, dtype=np.float16)
+        self._taken = np.full(self.capacity, np.nan, dtype=np.float64)
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._taken.nbytes
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def push(self, snapshot):
+        """Record one SensorSnapshot (sampler thread). Same seq twice is ignored."""
+        if snapshot.seq == self.last_seq:
+            return
+        index = self.count % self.capacity
+        column = self._data[:, index]
+        for i, metric in enumerate(self.metrics):
+            value = getattr(snapshot, metric)
+            column[i] = np.nan if value is None else value
+        self._taken[index] = snapshot.taken
+        self.last_seq = snapshot.seq
+        self.count += 1  # sütun yazıldıktan sonra: okuyucu yarım sütun görmez
+        log = self.log
+        if log is not None:
+            log.append(snapshot)
+
+    def stale_columns(self, interval, now=None):
+        """
+        How many `interval` slots the newest sample lies behind `now`. A
+        sample up to 1.5 intervals old still counts as current (0), so a
+        slightly late sample does not shift the graph back and forth.
+        """
+        if not self.count:
+            return 0
+        now = time.time() if now is None else now
+        behind = (now - self._taken[(self.count - 1) % self.capacity]) / interval
+        if not math.isfinite(behind) or behind < 1.5:
+            return 0
+        return int(behind)
+
+    def window(self, metric, samples, interval=None, now=None):
+        """
+        The last `samples` slots of `metric`, oldest first, NaN where there
+        is no sample. Without `interval` a slot is a column (count-based);
+        with it a slot is `interval` seconds ending at `now`, and samples
+        are placed by their timestamps (see the module docstring).
+        """
+        samples = max(1, min(int(samples), self.capacity))
+        end = self.count
+        columns = np.arange(end - samples, end) % self.capacity
+        values = self._data[self._rows[metric]].take(columns).astype(np.float32)
+        if end < samples:
+            values[:samples - end] = np.nan  # henüz yazılmamış sütunlar
+        if interval is None or not end:
+            return values
+
+        # Her sütunun yeniden geriye doğru kaç slot uzakta olduğu: ardışık
+        # örnekler arasındaki boşluk slot sayısına yuvarlanır (en az 1)
+        steps = np.rint(np.diff(self._taken.take(columns)) / interval)
+        steps = np.maximum(np.nan_to_num(steps, nan=1.0), 1.0)
+        back = np.zeros(samples)
+        back[:-1] = np.cumsum(steps[::-1])[::-1]
+        slots = (samples - 1 - self.stale_columns(interval, now) - back).astype(np.int64)
+
+        placed = np.full(samples, np.nan, dtype=np.float32)
+        keep = slots >= 0
+        placed[slots[keep]] = values[keep]
+        return placed
+
+    def latest(self, metric):
+        if not self.count:
+            return None
+        value = float(self._data[self._rows[metric], (self.count - 1) % self.capacity])
+        return None if value != value else value
@@ -0,0 +1,191 @@
+"""
+Append-only binary sensor log.
+
+Every new snapshot that reaches `SensorHistory.push()` can also be written
+to a `SensorLog`: one fixed-width little-endian record per sample
+(`taken` as float64, then every scalar SensorSnapshot field as float32,
+NaN when missing; per-core loads are not logged). Records are packed in
+place into a preallocated buffer and written with a single `os.write`
+at most once per `flush_seconds` (or when the buffer fills), so logging
+at 1 Hz costs one syscall per second. A hard exit loses at most that
+last unflushed second.
+
+The file starts with a 256-byte header (magic, version, record size,
+field names) and is rotated by size: sensors.bin -> sensors.bin.1 ->
+... -> sensors.bin.<keep>. `open_log()` maps a file with `numpy.memmap`
+as a structured array without reading it; tools/sensor_log.py turns
+time ranges into CSV or summary stats.
+"""
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from operator import attrgetter
+
+import numpy as np
+
+from src.sensor_sampler import SensorSnapshot
+
+logger = logging.getLogger("OLED Customizer.SensorLog")
+
+MAGIC = b"OLEDSLOG"
+VERSION = 1
+HEADER = struct.Struct("<8sHHH")        # magic, sürüm, kayıt boyu, alan sayısı; ardından alan adları
+HEADER_SIZE = 256
+
+LOG_FIELDS = tuple(field for field in SensorSnapshot._fields[2:] if field != "cpu_cores")
+RECORD = struct.Struct("<d" + "f" * len(LOG_FIELDS))
+
+
+def build_header(fields=LOG_FIELDS, record_size=RECORD.size):
+    names = ",".join(fields).encode("ascii")
+    header = HEADER.pack(MAGIC, VERSION, record_size, len(fields)) + names
+    if len(header) > HEADER_SIZE:
+        raise ValueError("too many fields for the log header")
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def parse_header(data):
+    """Header bytes -> (field names, record size). Raises ValueError if it is not a sensor log."""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("file too short for a sensor log header")
+    magic, version, record_size, count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a sensor log (bad magic or version)")
+    names = data[HEADER.size:HEADER_SIZE].rstrip(b"\0").decode("ascii")
+    fields = tuple(names.split(",")) if names else ()
+    if len(fields) != count or record_size != 8 + 4 * count:
+        raise ValueError("corrupt sensor log header")
+    return fields, record_size
+
+
+class SensorLog:
+    def __init__(self, path, max_bytes=8 * 1024 * 1024, keep=3, flush_seconds=1.0, buffer_records=256):
+        """
+        path: current log file; rotated copies get ".1", ".2", ... appended
+        max_bytes: rotate before a flush would grow the file past this
+        keep: rotated files kept next to the current one
+        """
+        self.path = path
+        self.max_bytes = max(HEADER_SIZE + RECORD.size, int(max_bytes))
+        self.keep = max(0, int(keep))
+        self.flush_seconds = flush_seconds
+        self.writes = 0         # os.write çağrıları
+        self.rotations = 0
+        self.dropped = 0        # yazılamayan kayıtlar
+
+        self._header = build_header()
+        self._values = attrgetter(*LOG_FIELDS)
+        self._buffer = bytearray(RECORD.size * max(1, int(buffer_records)))
+        self._capacity = len(self._buffer) // RECORD.size
+        self._pending = 0
+        self._fd = None
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def append(self, snapshot, now=None):
+        """Buffer one SensorSnapshot; writes to disk at most once per flush_seconds."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            values = self._values(snapshot)
+            RECORD.pack_into(self._buffer, self._pending * RECORD.size, snapshot.taken,
+                             *[math.nan if v is None else v for v in values])
+            self._pending += 1
+            if self._pending == self._capacity or now - self._last_flush >= self.flush_seconds:
+                self._flush(now)
+
+    def flush(self):
+        with self._lock:
+            self._flush(time.monotonic())
+
+    def close(self):
+        with self._lock:
+            self._flush(time.monotonic())
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _flush(self, now):
+        self._last_flush = now
+        if not self._pending:
+            return
+        size = self._pending * RECORD.size
+        try:
+            if self._fd is None:
+                self._open()
+            if self._size + size > self.max_bytes and self._size > HEADER_SIZE:
+                self._rotate()
+            self._write(memoryview(self._buffer)[:size])
+        except OSError as e:
+            logger.warning(f"Sensor log write failed: {e}")
+            self.dropped += self._pending
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None  # sonraki flush yeniden açmayı dener
+        self._pending = 0
+
+    def _write(self, data):
+        while data:
+            written = os.write(self._fd, data)
+            self.writes += 1
+            self._size += written
+            data = data[written:]
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and not self._compatible():
+            self._shift()  # başka sürüm / yarım kayıt: yeni dosyaya başla
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0), 0o644)
+        self._size = os.fstat(self._fd).st_size
+        if self._size == 0:
+            self._write(self._header)
+
+    def _compatible(self):
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(HEADER_SIZE)
+            size = os.path.getsize(self.path)
+        except OSError:
+            return False
+        return size == 0 or (header == self._header and (size - HEADER_SIZE) % RECORD.size == 0)
+
+    def _rotate(self):
+        os.close(self._fd)
+        self._fd = None
+        self._shift()
+        self.rotations += 1
+        self._open()
+
+    def _shift(self):
+        """sensors.bin -> .1 -> .2 ...; the oldest beyond `keep` is dropped."""
+        if self.keep == 0:
+            os.remove(self.path)
+            return
+        for i in range(self.keep - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+def log_dtype(fields=LOG_FIELDS):
+    return np.dtype([("taken", "<f8"), *((field, "<f4") for field in fields)])
+
+
+def open_log(path):
+    """
+    Map a log file read-only as a NumPy structured array (fields "taken"
+    plus the logged metrics). A trailing partial record is ignored.
+    """
+    with open(path, "rb") as file:
+        fields, record_size = parse_header(file.read(HEADER_SIZE))
+    dtype = log_dtype(fields)
+    count = (os.path.getsize(path) - HEADER_SIZE) // record_size
+    if count <= 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
@@ -0,0 +1,250 @@
+"""
+Background sensor sampling for the hardware monitor.
+
+`SensorSampler` runs one thread that, every `interval` seconds, calls the
+hardware reader once (one Update per hardware node, see SensorCatalog)
+and psutil CPU / RAM once, then publishes an immutable `SensorSnapshot`.
+The render thread only reads `snapshot` (a reference swap) and never
+touches a sensor. Hardware sampling pauses when nobody has called
+`touch()` for `idle_seconds` and resumes immediately on the next touch.
+With `keep_history` set (a graph page is reachable) the sampler keeps
+taking cheap samples while idle: psutil CPU / RAM and throughput only,
+hardware metrics None, so the graph history has no holes.
+
+The thread machinery (touch / idle / interval) lives in `SamplerLoop`, so
+other pollers (ProcessSampler) reuse it without SensorSampler's global
+psutil CPU reads or throughput meter.
+"""
+import ctypes
+import logging
+import math
+import sys
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import psutil
+
+from src.throughput import ThroughputMeter
+
+logger = logging.getLogger("OLED Customizer.SensorSampler")
+
+# Donanım okuyucusunun döndürebileceği metrikler
+HARDWARE_METRICS = ("cpu_temp", "gpu_temp", "gpu_load", "fan_rpm")
+
+# 0'ın gerçek bir okuma olduğu metrikler (boştaki GPU, duran fan); sıcaklıkta 0 = sensör yok
+ZERO_VALID_METRICS = frozenset(("gpu_load", "fan_rpm"))
+
+
+def is_reading(metric, value):
+    """True for a real sensor value: finite and > 0, or exactly 0 for ZERO_VALID_METRICS."""
+    if value is None or not math.isfinite(value):
+        return False
+    return value > 0 or (value == 0 and metric in ZERO_VALID_METRICS)
+
+
+def first_reading(metric, values):
+    """First positive value of a fallback chain; 0.0 when only zeros are valid readings; else None."""
+    zero = None
+    for value in values:
+        if value is None or not math.isfinite(value):
+            continue
+        if value > 0:
+            return float(value)
+        if value == 0 and metric in ZERO_VALID_METRICS:
+            zero = 0.0  # başka sensör dönüyorsa o tercih edilir (boş fan soketi 0 okur)
+    return zero
+
+
+class SensorSnapshot(NamedTuple):
+    seq: int
+    taken: float                    # time.time()
+    cpu_temp: Optional[float]
+    cpu_usage: Optional[float]
+    gpu_temp: Optional[float]
+    gpu_load: Optional[float]
+    ram_used: Optional[float]       # byte
+    ram_total: Optional[float]
+    ram_percent: Optional[float]
+    fan_rpm: Optional[float]
+    cpu_cores: Optional[tuple]      # çekirdek (mantıksal işlemci) başına yüzde
+    net_down: Optional[float]       # byte/s, EWMA
+    net_up: Optional[float]
+    disk_read: Optional[float]
+    disk_write: Optional[float]
+
+
+EMPTY_SNAPSHOT = SensorSnapshot(0, 0.0, *([None] * (len(SensorSnapshot._fields) - 2)))
+
+
+def read_system():
+    """psutil part of a sample: CPU usage (total and per core) since the previous call, RAM."""
+    mem = psutil.virtual_memory()
+    return {
+        "cpu_usage": psutil.cpu_percent(interval=None),
+        "cpu_cores": tuple(psutil.cpu_percent(interval=None, percpu=True)),
+        "ram_used": float(mem.used),
+        "ram_total": float(mem.total),
+        "ram_percent": mem.percent,
+    }
+
+
+class SamplerLoop:
+    """
+    One daemon thread calling `_tick(idle)` every `interval` seconds while
+    someone `touch()`es it; sleeps on an Event once idle for `idle_seconds`
+    (unless `keep_history`). Subclasses implement `_tick` and may override
+    `_prime` (runs once on the thread before the first tick).
+    """
+
+    def __init__(self, interval=1.0, idle_seconds=5.0, on_change=None):
+        self.interval = interval
+        self.idle_seconds = idle_seconds
+        self.on_change = on_change
+        self.keep_history = False   # boştayken de ucuz örnek al (grafik geçmişi)
+
+        self.samples = 0
+        self.last_duration = 0.0
+
+        self._last_touch = 0.0
+        self._idle = True
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+    def touch(self):
+        """Called by the renderer while sensor values are on screen."""
+        self._last_touch = time.monotonic()
+        if self._idle:
+            self._wake.set()  # örnekleme sürerken her karede thread'i uyandırma
+
+    def _prime(self):
+        pass
+
+    def _tick(self, idle):
+        raise NotImplementedError
+
+    def _run(self):
+        self._prime()
+        next_at = time.monotonic()
+        while self._running:
+            now = time.monotonic()
+            idle = now - self._last_touch > self.idle_seconds
+            if idle and not self.keep_history:
+                self._idle = True
+                self._wake.clear()
+                if time.monotonic() - self._last_touch > self.idle_seconds:
+                    self._wake.wait()
+                continue
+            if self._idle and not idle:
+                next_at = now   # ekran geri geldi: hemen tam örnek
+            self._idle = idle
+
+            if now >= next_at:
+                self._tick(idle)
+                next_at = max(next_at + self.interval, time.monotonic())
+
+            self._wake.clear()
+            self._wake.wait(max(0.0, next_at - time.monotonic()))
+
+
+class SensorSampler(SamplerLoop):
+    def __init__(self, reader, interval=1.0, idle_seconds=5.0, on_change=None, history=None):
+        """
+        reader: callable -> {metric: float | None} for HARDWARE_METRICS
+        on_change: called (from the sampler thread) after a new snapshot
+        history: optional SensorHistory every snapshot is recorded into
+        """
+        super().__init__(interval, idle_seconds, on_change)
+        self.reader = reader
+        self.history = history
+        self.throughput = ThroughputMeter()
+        self.snapshot = EMPTY_SNAPSHOT
+
+    def select_devices(self, nic=None, disk=None):
+        """NIC / disk for the throughput rates (None: all)."""
+        self.throughput.select(nic, disk)
+
+    def sample(self, hardware=True):
+        """
+        Take one sample and publish it (sampler thread; callable directly in
+        tools). `hardware=False` skips the reader: a cheap history sample.
+        """
+        start = time.perf_counter()
+        values = dict.fromkeys(HARDWARE_METRICS)
+        if hardware:
+            try:
+                values.update(self.reader() or {})
+            except Exception as e:
+                logger.debug(f"Sensor read failed: {e}")
+        values.update(read_system())
+        values.update(self.throughput.sample())
+
+        snapshot = SensorSnapshot(seq=self.snapshot.seq + 1, taken=time.time(),
+                                  **{field: values.get(field) for field in SensorSnapshot._fields[2:]})
+        self.snapshot = snapshot
+        if self.history is not None:
+            self.history.push(snapshot)
+        self.samples += 1
+        self.last_duration = time.perf_counter() - start
+        if self.on_change:
+            self.on_change()
+        return snapshot
+
+    def _prime(self):
+        # cpu_percent(None) ilk çağrıda 0 döner; referans noktası olsun
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+
+    def _tick(self, idle):
+        self.sample(hardware=not idle)
+
+
+class SyntheticSensorReader:
+    """
+    Stand-in for a slow sensor backend (tools, Linux). Each call takes
+    `cost_ms`, blocked in a C call that keeps the GIL when `busy` (like a
+    pythonnet call; a Python spin loop would hand the GIL over every 5 ms)
+    or sleeping otherwise, and hangs forever after `hang_after` calls.
+    Built by name inside the collector process, so arguments stay plain.
+    """
+
+    def __init__(self, cost_ms=30.0, busy=True, hang_after=None):
+        self.cost = cost_ms / 1000
+        self.busy = busy
+        self.hang_after = hang_after
+        self.calls = 0
+        self._block = None
+        if busy:
+            # PyDLL çağrı boyunca GIL'i bırakmaz
+            if sys.platform == "win32":
+                sleep_ms = ctypes.PyDLL("kernel32").Sleep
+                self._block = lambda seconds: sleep_ms(int(seconds * 1000))
+            else:
+                usleep = ctypes.PyDLL(None).usleep
+                self._block = lambda seconds: usleep(int(seconds * 1_000_000))
+
+    def __call__(self):
+        self.calls += 1
+        if self.hang_after is not None and self.calls > self.hang_after:
+            while True:
+                time.sleep(3600)  # takılan sürücü
+
+        if self.busy:
+            self._block(self.cost)
+        else:
+            time.sleep(self.cost)
+        drift = self.calls % 5
+        return {"cpu_temp": 55.0 + drift, "gpu_temp": 48.0 + drift, "gpu_load": 30.0 + drift * 2,
+                "fan_rpm": 900.0 + drift * 10}
@@ -0,0 +1,124 @@
+"""
+Track-boundary aware poll scheduler for the Spotify Web API.
+
+A fixed poll interval shows a new song up to `spotify_fetch_delay` seconds
+late, while most mid-track polls return data we already have. Using the
+`progress` / `duration` of the last `fetch_song` result we predict when the
+current track ends and poll in a short burst around that moment. Mid-track
+we only poll rarely, to pick up seeks and pauses made in the Spotify client;
+a mid-track skip is caught by `hint()`, which pulls the next poll forward
+when another source (SMTC) reports a track change first.
+"""
+import logging
+
+logger = logging.getLogger("OLED Customizer.SpotifyScheduler")
+
+
+class SpotifyPollScheduler:
+    def __init__(
+        self,
+        base_interval_ms=2000,
+        midtrack_interval_ms=15000,
+        burst_interval_ms=500,
+        burst_lead_ms=1500,
+        burst_tail_ms=4000,
+    ):
+        """
+        base_interval_ms: kullanıcının `spotify_fetch_delay` değeri. Çalmıyorken /
+                          veri yokken bu aralıkla sorulur (play her an gelebilir).
+        midtrack_interval_ms: şarkı ortasında seek/pause yakalamak için seyrek poll.
+                              Skip'leri `hint()` yakalar.
+        burst_*: tahmini şarkı sonunun `lead` öncesinden `tail` sonrasına kadar
+                 `burst_interval_ms` ile sık poll.
+        """
+        self.base_interval_ms = base_interval_ms
+        self.midtrack_interval_ms = midtrack_interval_ms
+        self.burst_interval_ms = burst_interval_ms
+        self.burst_lead_ms = burst_lead_ms
+        self.burst_tail_ms = burst_tail_ms
+
+        self._track_key = None
+        self._predicted_end_ms = None
+        self._next_poll_ms = 0
+        self._last_poll_ms = -base_interval_ms
+        self._interval_ms = base_interval_ms
+
+    def configure(self, base_interval_ms=None, midtrack_interval_ms=None):
+        """Called from update_preferences when the fetch delay changes."""
+        if base_interval_ms is not None:
+            self.base_interval_ms = base_interval_ms
+        if midtrack_interval_ms is not None:
+            self.midtrack_interval_ms = midtrack_interval_ms
+
+    @property
+    def predicted_end_ms(self):
+        return self._predicted_end_ms
+
+    @property
+    def interval_ms(self):
+        """Length of the gap currently planned between two polls."""
+        return self._interval_ms
+
+    def is_due(self, now_ms):
+        return now_ms >= self._next_poll_ms
+
+    def mark_polled(self, now_ms):
+        """
+        Reserve the slot as soon as a request goes out so the render loop
+        does not start a second fetch while the first is still in flight.
+        """
+        self._last_poll_ms = now_ms
+        self._next_poll_ms = now_ms + self.base_interval_ms
+
+    def hint(self, now_ms):
+        """
+        Another source saw the track change: poll as soon as possible, but
+        not closer than `burst_interval_ms` to the previous request.
+        """
+        self._next_poll_ms = min(self._next_poll_ms, max(now_ms, self._last_poll_ms + self.burst_interval_ms))
+
+    def observe(self, song_data, now_ms):
+        """
+        Feed a `fetch_song` result (or None) and plan the next poll.
+        Returns True when the track changed since the previous observation.
+        """
+        if not song_data:
+            self._track_key = None
+            self._predicted_end_ms = None
+            self._plan(now_ms, self.base_interval_ms)
+            return False
+
+        key = (song_data.get("title", ""), song_data.get("artist", ""))
+        changed = key != self._track_key
+        self._track_key = key
+
+        duration = int(song_data.get("duration") or 0)
+        progress = int(song_data.get("progress") or 0)
+        paused = bool(song_data.get("paused", False))
+
+        if paused or duration <= 0:
+            # Pause'dayken şarkı sonu tahmin edilemez; play'i kaçırmamak için normal hız.
+            self._predicted_end_ms = None
+            self._plan(now_ms, self.base_interval_ms)
+            return changed
+
+        self._predicted_end_ms = now_ms + max(duration - progress, 0)
+        burst_start = self._predicted_end_ms - self.burst_lead_ms
+        burst_end = self._predicted_end_ms + self.burst_tail_ms
+
+        if burst_start <= now_ms <= burst_end:
+            interval = self.burst_interval_ms
+        else:
+            # Şarkı ortası: seyrek poll, ama burst başlangıcını asla kaçırma.
+            interval = min(self.midtrack_interval_ms, burst_start - now_ms)
+            interval = max(interval, self.burst_interval_ms)
+
+        if changed:
+            logger.debug(f"Track changed, predicted end in {self._predicted_end_ms - now_ms} ms")
+
+        self._plan(now_ms, interval)
+        return changed
+
+    def _plan(self, now_ms, interval_ms):
+        self._interval_ms = interval_ms
+        self._next_poll_ms = now_ms + interval_ms
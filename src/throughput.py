@@ -0,0 +1,145 @@
+"""
+Network and disk throughput from psutil counters.
+
+`ThroughputMeter.sample()` reads `net_io_counters(pernic=True)` and
+`disk_io_counters(perdisk=True)` once, turns the counter deltas of the
+selected NIC / disk (or all of them) into bytes per second and smooths
+them with an EWMA whose weight follows the real sample spacing
+(alpha = 1 - exp(-dt / tau)), so changing the sampling interval does not
+change how fast the numbers settle. Counter resets (driver reload, device
+re-plugged) are skipped instead of producing a negative spike.
+
+`format_rate()` / `format_rate_short()` turn a rate into display
+strings; results are memoized on the value rounded to what is shown, so
+an unchanged reading returns the very same string objects.
+"""
+import math
+import time
+from functools import lru_cache
+
+import psutil
+
+THROUGHPUT_METRICS = ("net_down", "net_up", "disk_read", "disk_write")
+
+# "Tümü" seçiminde sayılmayan arayüzler
+_LOOPBACK_PREFIXES = ("lo", "Loopback")
+
+
+class ThroughputMeter:
+    def __init__(self, nic=None, disk=None, tau=2.0):
+        """nic / disk: device name, or None for every NIC (loopback excluded) / disk."""
+        self.nic = nic or None
+        self.disk = disk or None
+        self.tau = tau
+        self.nics = ()
+        self.disks = ()
+        self._last = None           # (zaman, {metrik: sayaç})
+        self._rates = dict.fromkeys(THROUGHPUT_METRICS)
+
+    def select(self, nic=None, disk=None):
+        nic, disk = nic or None, disk or None
+        if (nic, disk) != (self.nic, self.disk):
+            self.nic, self.disk = nic, disk
+            self._last = None
+            self._rates = dict.fromkeys(THROUGHPUT_METRICS)
+
+    def _counters(self):
+        counters = {}
+        try:
+            nics = psutil.net_io_counters(pernic=True) or {}
+            self.nics = tuple(nics)
+            if self.nic is None:
+                selected = [c for name, c in nics.items() if not name.startswith(_LOOPBACK_PREFIXES)]
+            else:
+                selected = [nics[self.nic]] if self.nic in nics else []
+            if selected:
+                counters["net_down"] = sum(c.bytes_recv for c in selected)
+                counters["net_up"] = sum(c.bytes_sent for c in selected)
+        except Exception:
+            pass
+        try:
+            disks = psutil.disk_io_counters(perdisk=True) or {}
+            self.disks = tuple(disks)
+            if self.disk is None:
+                # perdisk bölümleri de listeler (sda + sda1); toplamı psutil'e bırak
+                total = psutil.disk_io_counters(perdisk=False)
+                selected = [total] if total is not None else []
+            else:
+                selected = [disks[self.disk]] if self.disk in disks else []
+            if selected:
+                counters["disk_read"] = sum(c.read_bytes for c in selected)
+                counters["disk_write"] = sum(c.write_bytes for c in selected)
+        except Exception:
+            pass
+        return counters
+
+    def sample(self, now=None):
+        """{metric: bytes/s | None}; None until two readings exist for a metric."""
+        now = time.monotonic() if now is None else now
+        counters = self._counters()
+        last = self._last
+        self._last = (now, counters)
+        if last is None:
+            return dict(self._rates)
+
+        dt = now - last[0]
+        if dt <= 0:
+            return dict(self._rates)
+        alpha = 1.0 - math.exp(-dt / self.tau)
+        for metric in THROUGHPUT_METRICS:
+            if metric not in counters or metric not in last[1]:
+                self._rates[metric] = None
+                continue
+            delta = counters[metric] - last[1][metric]
+            if delta < 0:
+                continue  # sayaç sıfırlandı; bu aralığı atla
+            rate = delta / dt
+            previous = self._rates[metric]
+            self._rates[metric] = rate if previous is None else previous + alpha * (rate - previous)
+        return dict(self._rates)
+
+
+_UNITS = ("", "K", "M", "G", "T")
+
+
+def _scale(rate):
+    """Bytes/s -> (value * 10 rounded to three digits, unit prefix)."""
+    unit = 0
+    while rate >= 999.5 and unit < len(_UNITS) - 1:
+        rate /= 1024
+        unit += 1
+    scaled = int(round(rate * 10)) if rate < 9.95 else int(round(rate)) * 10
+    return scaled, _UNITS[unit]
+
+
+@lru_cache(maxsize=512)
+def _number(scaled):
+    return f"{scaled / 10:.1f}" if scaled < 100 else f"{scaled // 10}"
+
+
+@lru_cache(maxsize=16)
+def _unit(prefix):
+    return f"{prefix}B/s"
+
+
+@lru_cache(maxsize=512)
+def _short(tag, scaled, prefix):
+    return f"{tag}{_number(scaled)}{prefix or 'B'}"
+
+
+def format_rate(rate):
+    """
+    Bytes/s -> (number, unit) with at most three digits: ("1.2", "MB/s"),
+    ("340", "KB/s"). None -> ("--", "").
+    """
+    if rate is None:
+        return "--", ""
+    scaled, prefix = _scale(rate)
+    return _number(scaled), _unit(prefix)
+
+
+def format_rate_short(rate, tag=""):
+    """One-string form for narrow columns: "R1.2M", "W340K", "W0.0B"."""
+    if rate is None:
+        return f"{tag}--"
+    return _short(tag, *_scale(rate))
@@ -0,0 +1,138 @@
+"""
+Top processes by CPU for the hardware monitor.
+
+`TopProcesses` keeps one `psutil.Process` per PID alive between samples,
+so `cpu_percent(None)` returns the usage since the previous sample without
+a blocking interval. The PID list is rescanned only every
+`rescan_seconds` (new processes appear, dead ones drop out when a read
+fails). Per sample each tracked process costs one CPU-times read; the
+top K are kept in a bounded min-heap and only those K get a name and
+memory read.
+
+`ProcessSampler` runs it on the SamplerLoop thread machinery (touch /
+idle / interval) and publishes an immutable tuple of `ProcessInfo`. It
+only calls the per-process `cpu_percent`: the global
+`psutil.cpu_percent(None)` keeps one reference point per interpreter, and
+resetting it here would skew SensorSampler's cpu_usage and cpu_cores.
+"""
+import heapq
+import logging
+import time
+from typing import NamedTuple
+
+import psutil
+
+from src.sensor_sampler import SamplerLoop
+
+logger = logging.getLogger("OLED Customizer.TopProcesses")
+
+_GONE = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
+
+class ProcessInfo(NamedTuple):
+    pid: int
+    name: str
+    cpu: float          # toplam makinenin yüzdesi (Görev Yöneticisi gibi)
+    rss: float          # byte
+
+
+class TopProcesses:
+    def __init__(self, k=3, rescan_seconds=5.0):
+        self.k = k
+        self.rescan_seconds = rescan_seconds
+        self.scans = 0
+        self._procs = {}            # pid -> psutil.Process
+        self._names = {}            # pid -> ad (ilk ihtiyaçta bir kez)
+        self._skip = set()          # okunamayan pid'ler (korumalı süreçler); ölünce temizlenir
+        self._last_scan = None
+        self._cpus = psutil.cpu_count() or 1
+
+    def rescan(self):
+        pids = set(psutil.pids())
+        pids.discard(0)  # Windows "System Idle Process": boşta kalan CPU'yu raporlar
+        for pid in list(self._procs):
+            if pid not in pids:
+                self._drop(pid)
+        self._skip &= pids
+        for pid in pids - self._procs.keys() - self._skip:
+            try:
+                proc = psutil.Process(pid)
+                proc.cpu_percent(None)  # referans noktası; ilk değer 0
+                self._procs[pid] = proc
+            except _GONE:
+                self._skip.add(pid)
+        self.scans += 1
+
+    def _drop(self, pid, skip=False):
+        self._procs.pop(pid, None)
+        self._names.pop(pid, None)
+        if skip:
+            self._skip.add(pid)
+
+    def sample(self, now=None):
+        """Top K processes by CPU since the previous sample, highest first."""
+        now = time.monotonic() if now is None else now
+        if self._last_scan is None or now - self._last_scan >= self.rescan_seconds:
+            self._last_scan = now
+            self.rescan()
+
+        heap = []   # (cpu, pid) min-heap, en fazla k eleman
+        for pid, proc in list(self._procs.items()):
+            try:
+                cpu = proc.cpu_percent(None)
+            except psutil.AccessDenied:
+                self._drop(pid, skip=True)
+                continue
+            except _GONE:
+                self._drop(pid)
+                continue
+            if len(heap) < self.k:
+                heapq.heappush(heap, (cpu, pid))
+            elif cpu > heap[0][0]:
+                heapq.heappushpop(heap, (cpu, pid))
+
+        top = []
+        for cpu, pid in sorted(heap, reverse=True):
+            proc = self._procs[pid]
+            try:
+                rss = float(proc.memory_info().rss)
+                name = self._names.get(pid)
+                if name is None:
+                    name = self._names[pid] = _display_name(proc.name())
+            except _GONE:
+                continue
+            top.append(ProcessInfo(pid, name, cpu / self._cpus, rss))
+        return tuple(top)
+
+    def __len__(self):
+        return len(self._procs)
+
+
+def _display_name(name):
+    return name[:-4] if name.lower().endswith(".exe") else name
+
+
+class ProcessSampler(SamplerLoop):
+    """SamplerLoop (touch / idle / interval) publishing TopProcesses rows."""
+
+    def __init__(self, k=3, interval=2.0, idle_seconds=3.0, rescan_seconds=5.0, on_change=None):
+        super().__init__(interval, idle_seconds, on_change)
+        self.top = TopProcesses(k, rescan_seconds)
+        self.snapshot = ()
+
+    def sample(self):
+        start = time.perf_counter()
+        try:
+            rows = self.top.sample()
+        except Exception as e:
+            logger.debug(f"Process sample failed: {e}")
+            rows = self.snapshot
+        self.snapshot = rows
+        self.samples += 1
+        self.last_duration = time.perf_counter() - start
+        if self.on_change:
+            self.on_change()
+        return rows
+
+    def _tick(self, idle):
+        self.sample()
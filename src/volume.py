@@ -1,65 +1,74 @@
 import logging
 import os
+import threading
+from queue import Empty, SimpleQueue
 from time import time
 import psutil
 
 from PIL import Image, ImageDraw
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume, IMMDeviceEnumerator, EDataFlow, ERole
-from comtypes import CLSCTX_ALL
-from ctypes import POINTER, cast
 
+from src.audio_backend import AudioEvent, create_audio_backend
 from src.image_utils import fetch_content_path
+from src.mic_meter import create_mic_meter
 
 logger = logging.getLogger("OLED Customizer.VolumeOverlay")
 
+DISCORD_CHECK_SECONDS = 2.0
+
+
 class VolumeOverlay:
-    def __init__(self, config, timeout=1.5):
+    """
+    Event driven: the audio backend (COM callbacks on Windows, a fake one
+    elsewhere) and the Discord watcher thread put `AudioEvent`s on a queue
+    and call `on_change` (the renderer's wake). `update()` only drains the
+    queue, so an idle loop tick makes no COM calls and no process scan.
+    The mic level bar samples only while the overlay is visible.
+    """
+
+    def __init__(self, config, timeout=1.5, backend=None, on_change=None, meter=None):
         self.config = config
         self.timeout = timeout
+        self.on_change = on_change
 
         self._last_vol = None
         self._last_mute = None
         self._last_mic_mute = None
         self._last_change = 0.0
 
-        # Audio Interfaces
-        self._volume = None
-        self._mic_volume = None
-        
-        # Init Speakers
-        try:
-            device = AudioUtilities.GetSpeakers()
-            self._volume = device.EndpointVolume.QueryInterface(IAudioEndpointVolume)
-        except Exception as e:
-            logger.warning("Speaker init failed: %s", e)
-
-        # Init Mic (Communication Default) - using pycaw
-        try:
-            # Get the default communications microphone
-            from pycaw.pycaw import AudioUtilities as AU
-            devices = AU.GetMicrophone()
-            if devices:
-                interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                self._mic_volume = cast(interface, POINTER(IAudioEndpointVolume))
-            else:
-                logger.warning("No microphone found")
-        except Exception as e:
-            logger.warning(f"Microphone init failed: {e}")
-            try:
-                # Fallback
-                device = AudioUtilities.GetMicrophone()
-                interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                self._mic_volume = interface.QueryInterface(IAudioEndpointVolume)
-            except:
-                pass
+        self._events = SimpleQueue()
+        self.events_applied = 0
 
         # Load Icons (V4)
         self.icons = {}
         self._load_icons()
-        
+
         # Discord State
         self._discord_running = False
-        self._last_discord_check = 0
+        self._stop = threading.Event()
+
+        # Audio Interfaces
+        self.backend = backend if backend is not None else create_audio_backend()
+        if self.backend is not None:
+            self.backend.start(self._emit)
+
+        # Mic level meter (peak); None -> sadece mute ikonu
+        self.meter = meter if meter is not None else create_mic_meter()
+
+        self._discord_thread = threading.Thread(target=self._watch_discord, daemon=True)
+        self._discord_thread.start()
+
+    def _emit(self, event):
+        """Called from COM / watcher threads: queue the event and wake the renderer."""
+        self._events.put(event)
+        if self.on_change:
+            self.on_change()
+
+    def close(self):
+        self._stop.set()
+        if self.meter is not None:
+            self.meter.stop()
+        if self.backend is not None:
+            self.backend.close()
 
     def _load_icons(self):
         # V4 Clean Icons
@@ -82,16 +91,14 @@ class VolumeOverlay:
                 
     def toggle_mic_mute(self):
         """Toggle mic mute state - works with Discord (just shows overlay)"""
-        if self._mic_volume:
-            try:
-                current = bool(self._mic_volume.GetMute())
-                self._mic_volume.SetMute(not current, None)
+        if self.backend is not None and self.backend.has_mic:
+            current = self.backend.get_mic_mute()
+            if current is not None and self.backend.set_mic_mute(not current):
+                # Yeni durum callback ile gelir; overlay'i hemen göstermek için zamanı da işaretle
                 self._last_change = time()
                 logger.info(f"Toggled System Mic Mute to {not current}")
                 return
-            except Exception as e:
-                logger.warning(f"System mic control failed: {e}")
-        
+
         # Discord mode: just toggle internal state for overlay display
         if self._last_mic_mute is None:
             self._last_mic_mute = False
@@ -99,56 +106,58 @@ class VolumeOverlay:
         self._last_change = time()
         logger.info(f"Discord mode: Mic mute overlay = {self._last_mic_mute}")
 
-    def _check_discord(self):
-        if time() - self._last_discord_check < 2.0:
-            return
-        
-        self._last_discord_check = time()
-        running = False
+    @staticmethod
+    def _discord_is_running():
         try:
-             for p in psutil.process_iter(['name']):
-                 if p.info['name'] and 'discord' in p.info['name'].lower():
-                     running = True
-                     break
-        except:
+            for p in psutil.process_iter(['name']):
+                if p.info['name'] and 'discord' in p.info['name'].lower():
+                    return True
+        except Exception:
             pass
-        
-        if running != self._discord_running:
-            self._discord_running = running
-            self._last_change = time()
+        return False
+
+    def _watch_discord(self):
+        """Process scan on its own thread; emits only when the state flips."""
+        while not self._stop.is_set():
+            running = self._discord_is_running()
+            if running != self._discord_running:
+                self._discord_running = running
+                self._emit(AudioEvent("discord", None, running))
+            self._stop.wait(DISCORD_CHECK_SECONDS)
 
     def update(self):
-        self._check_discord()
+        """Apply queued events. Returns True when the overlay state changed."""
         changed = False
-        
-        # Check Speaker
-        if self._volume:
+        while True:
             try:
-                vol = int(round(self._volume.GetMasterVolumeLevelScalar() * 100))
-                mute = bool(self._volume.GetMute())
-                
-                if vol != self._last_vol or mute != self._last_mute:
-                    self._last_vol = vol
-                    self._last_mute = mute
+                event = self._events.get_nowait()
+            except Empty:
+                break
+            self.events_applied += 1
+
+            if event.kind == "speaker":
+                if event.volume != self._last_vol or event.muted != self._last_mute:
+                    self._last_vol = event.volume
+                    self._last_mute = event.muted
                     changed = True
-            except:
-                pass
-                
-        # Check Mic - Always monitor if mic exists
-        if self._mic_volume:
-            try:
-                mic_mute = bool(self._mic_volume.GetMute())
-                if mic_mute != self._last_mic_mute:
-                    self._last_mic_mute = mic_mute
+            elif event.kind == "mic":
+                if event.muted != self._last_mic_mute:
+                    self._last_mic_mute = event.muted
                     changed = True
-            except:
-                pass
-        
-        # Removed Discord-only reset logic
+            elif event.kind == "discord":
+                changed = True
 
         if changed:
             self._last_change = time()
 
+        if self.meter is not None:
+            # Overlay görünmüyorken örnekleme thread'i hiç çalışmaz
+            if self.should_display() and self._last_mic_mute is False:
+                self.meter.start()
+            elif self.meter.running:
+                self.meter.stop()
+        return changed
+
     def should_display(self) -> bool:
         if self._last_vol is None: 
             return False
@@ -185,6 +194,16 @@ class VolumeOverlay:
              bar_x2 = w - 18
         else:
              bar_x2 = w - 4 
+
+        # 3. Mic level (ikonun solunda dikey çubuk, alttan dolar)
+        if self.meter is not None and self._last_mic_mute is False and self.meter.running:
+            bar_x2 = w - 22
+            meter_x1, meter_x2 = w - 19, w - 17
+            meter_y1, meter_y2 = 14, 25
+            draw.rectangle((meter_x1, meter_y1, meter_x2, meter_y2), outline=self.config.primary)
+            fill = int(round((meter_y2 - meter_y1 - 1) * self.meter.latest))
+            if fill > 0:
+                draw.rectangle((meter_x1, meter_y2 - fill, meter_x2, meter_y2), fill=self.config.primary)
              
         bar_y1 = 16
         bar_y2 = h - 16
@@ -0,0 +1,114 @@
+"""
+Minimal RFC 6455 WebSocket framing for the local extension channel.
+
+Only what the browser extension needs: text frames, fragmentation,
+ping/pong and close. No extensions (permessage-deflate is never offered
+in our handshake response, so browsers will not use it).
+"""
+import base64
+import hashlib
+import os
+import struct
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class FrameError(Exception):
+    pass
+
+
+def accept_key(client_key):
+    digest = hashlib.sha1((client_key.strip() + WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _read_exact(rfile, n):
+    data = rfile.read(n)
+    if len(data) != n:
+        raise ConnectionError("socket closed mid-frame")
+    return data
+
+
+def _unmask(payload, mask):
+    if not payload:
+        return payload
+    # int XOR: byte byte döngüsünden çok daha hızlı
+    repeated = (mask * (len(payload) // 4 + 1))[:len(payload)]
+    value = int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")
+    return value.to_bytes(len(payload), "big")
+
+
+def read_frame(rfile, max_payload):
+    """Read one frame -> (fin, opcode, payload). Client frames must be masked."""
+    b1, b2 = _read_exact(rfile, 2)
+    fin = bool(b1 & 0x80)
+    opcode = b1 & 0x0F
+    masked = bool(b2 & 0x80)
+    length = b2 & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", _read_exact(rfile, 2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", _read_exact(rfile, 8))[0]
+    if length > max_payload:
+        raise FrameError(f"frame too large ({length} bytes)")
+    mask = _read_exact(rfile, 4) if masked else None
+    payload = _read_exact(rfile, length)
+    if mask:
+        payload = _unmask(payload, mask)
+    return fin, opcode, payload
+
+
+def read_message(rfile, max_payload, on_control):
+    """
+    Read frames until a complete data message arrives -> (opcode, payload).
+    Control frames in between are handed to `on_control(opcode, payload)`;
+    returns (OP_CLOSE, payload) when the peer closes.
+    """
+    parts = []
+    message_opcode = None
+    size = 0
+    while True:
+        fin, opcode, payload = read_frame(rfile, max_payload)
+        if opcode >= OP_CLOSE:
+            if opcode == OP_CLOSE:
+                return OP_CLOSE, payload
+            on_control(opcode, payload)
+            continue
+        if opcode != OP_CONTINUATION:
+            message_opcode = opcode
+            parts = []
+            size = 0
+        elif message_opcode is None:
+            raise FrameError("continuation without start frame")
+        size += len(payload)
+        if size > max_payload:
+            raise FrameError("message too large")
+        parts.append(payload)
+        if fin:
+            return message_opcode, b"".join(parts)
+
+
+def encode_frame(opcode, payload=b"", mask=False):
+    """Server frames are unmasked; `mask=True` is for test clients."""
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if mask:
+        key = os.urandom(4)
+        return bytes(header) + key + _unmask(payload, key)
+    return bytes(header) + payload
@@ -0,0 +1,102 @@
+"""
+AppVolumeOverlay driven by FakeSessionProvider: which session is shown for
+volume events, focus lookups and follow_focus switches.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.app_volume import AppVolumeOverlay
+from src.audio_sessions import FakeSessionProvider
+
+
+@pytest.fixture
+def setup():
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    provider = FakeSessionProvider()
+    overlay = AppVolumeOverlay(config, provider=provider)
+    provider.add("spotify", "Spotify.exe", pid=100, volume=80)
+    provider.add("chrome", "chrome.exe", pid=201, volume=60)
+    provider.add("game", "Game-Win64-Shipping.exe", pid=400, volume=40)
+    overlay.update()
+    return overlay, provider
+
+
+def shown_key(overlay):
+    return overlay._shown_key if overlay.should_display() else None
+
+
+def test_volume_change_is_ignored_while_disabled(setup):
+    overlay, provider = setup
+    provider.set_volume("spotify", 50)
+    assert not overlay.update()
+    assert shown_key(overlay) is None
+
+
+def test_volume_change_shows_that_session(setup):
+    overlay, provider = setup
+    overlay.enabled = True
+    provider.set_volume("chrome", 10)
+    assert overlay.update()
+    assert shown_key(overlay) == "chrome"
+
+    # Aynı değer: COM yine bildirir ama olay üretilmez
+    provider.set_volume("chrome", 10)
+    assert overlay._events.empty()
+
+
+def test_removed_session_hides_overlay(setup):
+    overlay, provider = setup
+    overlay.enabled = True
+    provider.set_volume("game", 20)
+    overlay.update()
+    provider.remove("game")
+    overlay.update()
+    assert not overlay.should_display()
+
+
+def test_focus_session_matches_browser_child_process(setup):
+    overlay, provider = setup
+    provider.set_foreground(200, "chrome.exe")   # pencere ana süreçte, ses alt süreçte
+    assert overlay.focus_session().key == "chrome"
+
+
+def test_focus_session_falls_back_to_latest_audible(setup):
+    overlay, provider = setup
+    provider.set_active("game", True)
+    provider.set_active("spotify", True)
+    assert overlay.focus_session().key == "spotify"
+
+    provider.set_foreground(999, "explorer.exe")
+    assert overlay.focus_session().key == "spotify"
+
+
+def test_follow_focus_shows_app_on_foreground_switch(setup):
+    overlay, provider = setup
+    overlay.follow_focus = True
+    provider.set_foreground(400, "game-win64-shipping.exe")
+    assert overlay.update()
+    assert shown_key(overlay) == "game"
+
+    # Aynı pid: yeniden gösterilmez
+    overlay._focus_checked = 0.0
+    overlay._last_change = 0.0
+    assert not overlay.update()
+    assert shown_key(overlay) is None
+
+    # Ses oturumu olmayan uygulama
+    provider.set_foreground(999, "explorer.exe")
+    overlay._focus_checked = 0.0
+    assert not overlay.update()
+
+
+def test_header_is_rendered_once_per_app(setup):
+    overlay, provider = setup
+    overlay.enabled = True
+    for volume in range(10):
+        provider.set_volume("spotify", volume)
+        overlay.update()
+        image = overlay.get_image()
+    assert image.size == (128, 40)
+    assert overlay.headers_rendered == 1
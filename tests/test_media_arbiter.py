@@ -0,0 +1,112 @@
+"""
+MediaArbiter scenarios on a fake clock: priority, hold, stickiness, expiry
+of silent sources and skipping masked sources.
+"""
+
+from src.media_sources import EMPTY_SNAPSHOT, MediaArbiter, MediaInfo, MediaSource
+
+
+class FakeSource(MediaSource):
+    def __init__(self, name):
+        self.name = name
+        self.info = None
+        self.polls = 0
+
+    def poll(self, now_ms):
+        self.polls += 1
+        return self.info
+
+    def play(self, title, now_ms, paused=False):
+        self.info = MediaInfo(title, "Artist", 0, 200_000, paused, "generic", now_ms)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def make_arbiter():
+    clock = Clock()
+    sources = {name: FakeSource(name) for name in ("spotify", "extension", "smtc", "file")}
+    arbiter = MediaArbiter(list(sources.values()), clock=clock)
+    return arbiter, clock, sources
+
+
+def test_higher_priority_playing_source_wins():
+    arbiter, clock, sources = make_arbiter()
+    sources["smtc"].play("Video", clock.now)
+    assert arbiter.tick().provider == "smtc"
+
+    sources["spotify"].play("Song", clock.now)
+    snapshot = arbiter.tick()
+    assert snapshot.provider == "spotify"
+    assert snapshot.playing
+
+
+def test_silent_source_is_held_then_replaced():
+    arbiter, clock, sources = make_arbiter()
+    sources["spotify"].play("Song", clock.now)
+    sources["smtc"].play("Video", clock.now)
+    arbiter.tick()
+
+    sources["spotify"].info = None
+    clock.now = 2_000   # spotify hold_ms = 3000
+    assert arbiter.tick().provider == "spotify"
+
+    clock.now = 3_500
+    snapshot = arbiter.tick()
+    assert snapshot.provider == "smtc"
+    assert snapshot.playing
+
+
+def test_paused_source_expires_after_hold():
+    arbiter, clock, sources = make_arbiter()
+    sources["smtc"].play("Video", clock.now, paused=True)
+    snapshot = arbiter.tick()
+    assert snapshot.provider == "smtc"
+    assert not snapshot.playing
+
+    sources["smtc"].info = None
+    clock.now = 2_000
+    assert arbiter.tick().provider == "smtc"
+
+    clock.now = 3_500
+    assert arbiter.tick() == EMPTY_SNAPSHOT
+
+
+def test_sticky_source_masks_and_skips_lower_priorities():
+    arbiter, clock, sources = make_arbiter()
+    sources["extension"].play("Tab", clock.now, paused=True)
+    sources["smtc"].play("Video", clock.now)
+    snapshot = arbiter.tick()
+    assert snapshot.provider == "extension"
+    assert not snapshot.playing
+    assert sources["smtc"].polls == 0
+    assert sources["file"].polls == 0
+
+    # extension sticky_ms = 5000: mask outlives its hold_ms
+    sources["extension"].info = None
+    clock.now = 4_000
+    arbiter.tick()
+    assert sources["smtc"].polls == 0
+
+    clock.now = 5_500
+    snapshot = arbiter.tick()
+    assert snapshot.provider == "smtc"
+    assert snapshot.playing
+    assert sources["smtc"].polls == 1
+
+
+def test_seq_changes_only_with_new_data():
+    arbiter, clock, sources = make_arbiter()
+    sources["spotify"].play("Song", clock.now)
+    first = arbiter.tick().seq
+
+    clock.now = 100
+    assert arbiter.tick().seq == first
+
+    sources["spotify"].play("Song", clock.now)
+    assert arbiter.tick().seq == first + 1
@@ -0,0 +1,108 @@
+"""
+NowPlayingFile / MediaFallback: change detection, torn writes, missing and
+stale files. mtimes are set explicitly so no test depends on timing.
+"""
+
+import json
+import os
+
+from src.media_fallback import MAX_FILE_BYTES, MediaFallback, NowPlayingFile
+
+OLD_NS = 1_600_000_000_123_456_789   # racy penceresinin çok dışında
+
+
+def payload(i, ts=0):
+    return json.dumps({
+        "title": f"Track {i}",
+        "artist": "Artist",
+        "progress_ms": i * 500,
+        "duration_ms": 240000,
+        "paused": False,
+        "source": "foobar2000",
+        "ts": ts,
+    }).encode("utf-8")
+
+
+def write(path, body, mtime_ns):
+    with open(path, "wb") as f:
+        f.write(body)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_idle_file_is_opened_once(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    write(path, payload(1), OLD_NS)
+    watcher = NowPlayingFile(path)
+
+    for _ in range(50):
+        assert watcher.read()["title"] == "Track 1"
+    assert watcher.stat_calls == 50
+    assert watcher.reads == 1
+    assert watcher.parses == 1
+
+
+def test_atomic_replace_is_picked_up(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    write(path, payload(1), OLD_NS)
+    watcher = NowPlayingFile(path)
+    watcher.read()
+    version = watcher.version
+
+    tmp = path + ".tmp"
+    write(tmp, payload(2), OLD_NS + 1_000_000)
+    os.replace(tmp, path)
+    assert watcher.read()["title"] == "Track 2"
+    assert watcher.version == version + 1
+
+
+def test_torn_write_keeps_previous_data_and_retries(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    write(path, payload(1), OLD_NS)
+    watcher = NowPlayingFile(path)
+    watcher.read()
+
+    body = payload(2)
+    write(path, body[:len(body) // 2], OLD_NS + 1_000_000)
+    assert watcher.read()["title"] == "Track 1"
+    assert watcher.errors == 1
+
+    # Yarım dosyanın key'i kaydedilmedi: tamamlanınca tekrar okunur
+    write(path, body, OLD_NS + 1_000_000)
+    assert watcher.read()["title"] == "Track 2"
+
+
+def test_same_stat_rewrite_inside_racy_window(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    watcher = NowPlayingFile(path)
+    watcher.RACY_NS = watcher.COARSE_RACY_NS = 1 << 62   # her okuma racy
+    write(path, payload(1), OLD_NS)
+    watcher.read()
+
+    write(path, payload(3), OLD_NS)   # aynı boyut, aynı mtime
+    assert watcher.read()["title"] == "Track 3"
+
+
+def test_missing_and_oversized_files(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    watcher = NowPlayingFile(path)
+    assert watcher.read() is None
+
+    write(path, payload(1), OLD_NS)
+    assert watcher.read() is not None
+    os.remove(path)
+    assert watcher.read() is None
+
+    write(path, b" " * (MAX_FILE_BYTES + 1), OLD_NS)
+    assert watcher.read() is None
+
+
+def test_fallback_drops_stale_files(tmp_path):
+    path = str(tmp_path / "nowplaying.json")
+    write(path, payload(4, ts=10_000), OLD_NS)
+    fallback = MediaFallback(path)
+
+    data = fallback.read(now_ms=11_000)
+    assert data["title"] == "Track 4"
+    assert data["progress"] == 2000
+    assert data["updated_ms"] == 10_000
+    assert fallback.read(now_ms=14_000) is None
@@ -0,0 +1,96 @@
+"""
+BackendSelector ranking (quality first, latency as tie-break), fallbacks
+for empty metrics and one LHM catalog update per sample.
+"""
+
+import time
+
+from src.sensor_backends import BackendSelector, LhmBackend, SensorBackend
+
+
+class FakeBackend(SensorBackend):
+    def __init__(self, name, quality, values, cost=0.0):
+        self.name = name
+        self.quality = quality
+        self.metrics = tuple(values)
+        self.values = dict(values)
+        self.cost = cost
+        self.reads = 0
+
+    def read(self, metrics):
+        self.reads += 1
+        if self.cost:
+            time.sleep(self.cost)
+        return {metric: self.values.get(metric) for metric in metrics}
+
+
+class FakeCatalog:
+    def __init__(self, values):
+        self.values = values
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+    def read(self, metric):
+        return self.values.get(metric)
+
+
+def names(chain):
+    return [backend.name for backend in chain]
+
+
+def test_quality_beats_latency():
+    slow_lhm = FakeBackend("lhm", 40, {"cpu_temp": 61.0, "gpu_load": 0.0}, cost=0.005)
+    fast_wmi = FakeBackend("wmi", 10, {"cpu_temp": 27.8})
+    selector = BackendSelector([fast_wmi, slow_lhm], metrics=("cpu_temp", "gpu_load"))
+    ranking = selector.probe()
+    assert names(ranking["cpu_temp"]) == ["lhm", "wmi"]
+    assert names(ranking["gpu_load"]) == ["lhm"]    # boştaki GPU: 0 da okuma
+    assert selector.read() == {"cpu_temp": 61.0, "gpu_load": 0.0}
+
+
+def test_latency_breaks_quality_ties():
+    slow = FakeBackend("psutil", 20, {"cpu_temp": 60.0}, cost=0.005)
+    fast = FakeBackend("sysfs", 20, {"cpu_temp": 61.0})
+    selector = BackendSelector([slow, fast], metrics=("cpu_temp",))
+    assert names(selector.probe()["cpu_temp"]) == ["sysfs", "psutil"]
+
+
+def test_empty_metric_falls_back_down_the_ranking():
+    lhm = FakeBackend("lhm", 40, {"cpu_temp": 61.0, "fan_rpm": 900.0})
+    sysfs = FakeBackend("sysfs", 20, {"fan_rpm": 850.0})
+    selector = BackendSelector([lhm, sysfs], metrics=("cpu_temp", "fan_rpm"))
+    selector.probe()
+
+    lhm.values["fan_rpm"] = None
+    lhm.reads = sysfs.reads = 0
+    assert selector.read() == {"cpu_temp": 61.0, "fan_rpm": 850.0}
+    assert (lhm.reads, sysfs.reads) == (1, 1)
+
+
+def test_lhm_updates_catalog_once_per_sample():
+    backend = LhmBackend()
+    backend.catalog = FakeCatalog({"cpu_temp": 61.0, "gpu_temp": 54.0})
+
+    backend.begin_sample()
+    backend.read(("cpu_temp",))
+    backend.read(("gpu_temp",))
+    assert backend.catalog.updates == 1
+
+    backend.begin_sample()
+    assert backend.read(("cpu_temp", "gpu_temp")) == {"cpu_temp": 61.0, "gpu_temp": 54.0}
+    assert backend.catalog.updates == 2
+
+
+def test_selector_starts_a_sample_per_read():
+    backend = LhmBackend()
+    backend.catalog = FakeCatalog({"cpu_temp": 61.0})
+    backend.open = lambda: None
+    selector = BackendSelector([backend], metrics=("cpu_temp",))
+    selector.probe(rounds=3)
+    assert backend.catalog.updates == 3
+
+    for _ in range(5):
+        selector.read()
+    assert backend.catalog.updates == 8
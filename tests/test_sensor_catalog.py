@@ -0,0 +1,113 @@
+"""
+SensorCatalog on a fake LibreHardwareMonitor tree: fallback chains, zero
+readings, one Update() per owning node and rebuilds.
+"""
+
+from src.sensor_catalog import SensorCatalog
+
+
+class FakeSensor:
+    def __init__(self, sensor_type, name, value):
+        self.SensorType = sensor_type
+        self.Name = name
+        self.Value = value
+
+
+class BrokenSensor(FakeSensor):
+    @property
+    def Value(self):
+        raise RuntimeError("hardware removed")
+
+    @Value.setter
+    def Value(self, value):
+        pass
+
+
+class FakeHardware:
+    def __init__(self, hardware_type, sensors, sub=()):
+        self.HardwareType = hardware_type
+        self.Sensors = sensors
+        self.SubHardware = list(sub)
+        self.updates = 0
+
+    def Update(self):
+        self.updates += 1
+
+
+class FakeComputer:
+    def __init__(self, hardware):
+        self.Hardware = hardware
+
+
+def build_tree():
+    cpu = FakeHardware("Cpu", [
+        FakeSensor("Load", "CPU Core #1", 12.0),
+        FakeSensor("Temperature", "Core (Tctl/Tdie)", 61.5),
+        FakeSensor("Temperature", "CPU Package", 58.0),
+    ])
+    gpu = FakeHardware("GpuNvidia", [
+        FakeSensor("Temperature", "GPU Core", 54.0),
+        FakeSensor("Load", "GPU Core", 37.0),
+    ])
+    memory = FakeHardware("Memory", [FakeSensor("Load", "Memory", 48.0)])
+    superio = FakeHardware("SuperIO", [FakeSensor("Fan", "Fan #1", 900.0)])
+    board = FakeHardware("Motherboard", [], sub=[superio])
+    return FakeComputer([cpu, gpu, memory, board])
+
+
+def test_reads_follow_the_fallback_chain():
+    computer = build_tree()
+    catalog = SensorCatalog(computer)
+    assert catalog.read("cpu_temp") == 61.5
+    assert catalog.read("gpu_temp") == 54.0
+    assert catalog.read("fan_rpm") == 900.0     # SuperIO alt düğümünden
+
+    computer.Hardware[0].Sensors[1].Value = None  # Tctl okunamıyor -> Package
+    assert catalog.read("cpu_temp") == 58.0
+
+
+def test_zero_is_a_reading_only_for_loads_and_fans():
+    computer = build_tree()
+    catalog = SensorCatalog(computer)
+    computer.Hardware[1].Sensors[1].Value = 0.0
+    computer.Hardware[3].SubHardware[0].Sensors[0].Value = 0.0
+    assert catalog.read("gpu_load") == 0.0
+    assert catalog.read("fan_rpm") == 0.0
+
+    computer.Hardware[1].Sensors[0].Value = 0.0
+    assert catalog.read("gpu_temp") is None
+
+
+def test_update_touches_each_owning_node_once():
+    computer = build_tree()
+    cpu, gpu, memory, board = computer.Hardware
+    superio = board.SubHardware[0]
+    catalog = SensorCatalog(computer)
+    catalog.build()
+    before = [node.updates for node in (cpu, gpu, memory, board, superio)]
+
+    catalog.update()
+    after = [node.updates for node in (cpu, gpu, memory, board, superio)]
+    assert [b - a for a, b in zip(before, after)] == [1, 1, 0, 0, 1]
+
+
+def test_invalidate_and_broken_handles_rebuild():
+    computer = build_tree()
+    catalog = SensorCatalog(computer)
+    catalog.read("cpu_temp")
+    assert catalog.builds == 1
+
+    catalog.read("gpu_temp")
+    assert catalog.builds == 1
+
+    catalog.invalidate()
+    catalog.read("cpu_temp")
+    assert catalog.builds == 2
+
+    computer.Hardware[1].Sensors[0] = BrokenSensor("Temperature", "GPU Core", 0)
+    catalog.invalidate()
+    catalog.build()
+    assert catalog.read("gpu_temp") is None
+    computer.Hardware[1].Sensors[0] = FakeSensor("Temperature", "GPU Core", 50.0)
+    assert catalog.read("gpu_temp") == 50.0
+    assert catalog.builds == 4
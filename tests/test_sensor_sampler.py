@@ -0,0 +1,61 @@
+"""
+SensorSampler idle behaviour: hardware reads stop after `idle_seconds`;
+with keep_history the graph history keeps receiving cheap samples.
+"""
+
+import time
+
+from src.sensor_history import SensorHistory
+from src.sensor_sampler import SensorSampler
+
+
+class CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"cpu_temp": 60.0}
+
+
+def run_idle(keep_history):
+    reader = CountingReader()
+    history = SensorHistory(capacity=100)
+    sampler = SensorSampler(reader, interval=0.05, idle_seconds=0.2, history=history)
+    sampler.keep_history = keep_history
+    sampler.start()
+    sampler.touch()
+    time.sleep(0.4)     # idle_seconds geçti: sampler boşta
+    calls, count = reader.calls, history.count
+    time.sleep(0.4)
+    sampler.stop()
+    return sampler, reader, history, calls, count
+
+
+def test_idle_sampler_stops_without_keep_history():
+    sampler, reader, history, calls, count = run_idle(False)
+    assert calls > 0
+    assert reader.calls == calls
+    assert history.count == count
+
+
+def test_keep_history_samples_cheap_metrics_while_idle():
+    sampler, reader, history, calls, count = run_idle(True)
+    assert reader.calls == calls            # donanıma dokunulmadı
+    assert history.count >= count + 4       # ~8 örnek beklenir
+    assert sampler.snapshot.cpu_temp is None
+    assert sampler.snapshot.cpu_usage is not None
+
+
+def test_touch_after_idle_takes_a_full_sample_at_once():
+    reader = CountingReader()
+    sampler = SensorSampler(reader, interval=10.0, idle_seconds=0.1)
+    sampler.keep_history = True
+    sampler.start()
+    time.sleep(0.2)
+    assert reader.calls == 0
+    sampler.touch()
+    time.sleep(0.1)
+    sampler.stop()
+    assert reader.calls == 1
+    assert sampler.snapshot.cpu_temp == 60.0
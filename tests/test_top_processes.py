@@ -0,0 +1,41 @@
+"""
+ProcessSampler: per-process CPU only; the global psutil.cpu_percent
+reference point belongs to SensorSampler.
+"""
+
+import time
+
+import psutil
+
+from src.top_processes import ProcessSampler
+
+
+def test_process_sampler_leaves_global_cpu_percent_alone(monkeypatch):
+    calls = []
+    real = psutil.cpu_percent
+    monkeypatch.setattr(psutil, "cpu_percent", lambda *a, **kw: calls.append(kw) or real(*a, **kw))
+
+    sampler = ProcessSampler(k=3, interval=0.05, idle_seconds=1.0)
+    sampler.start()
+    sampler.touch()
+    deadline = time.monotonic() + 5.0
+    while sampler.samples < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sampler.stop()
+
+    assert sampler.samples >= 2
+    assert 0 < len(sampler.snapshot) <= 3
+    assert calls == []
+    assert not hasattr(sampler, "throughput")
+
+
+def test_idle_process_sampler_stops():
+    sampler = ProcessSampler(interval=0.05, idle_seconds=0.1)
+    sampler.start()
+    sampler.touch()
+    time.sleep(0.3)
+    samples = sampler.samples
+    time.sleep(0.3)
+    sampler.stop()
+    assert samples > 0
+    assert sampler.samples == samples
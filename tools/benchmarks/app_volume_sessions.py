@@ -0,0 +1,83 @@
+"""
+OLED Customizer - App volume overlay cost
+Drives AppVolumeOverlay with FakeSessionProvider: a few sessions come and
+go, one app changes its volume repeatedly. Reports:
+  - get_image() cost with the cached icon/name header vs re-rendering it
+  - how many headers were rendered and which session the focus logic picks
+  - session events seen by the overlay (no per-frame enumeration)
+  - that follow_focus shows the app the foreground switched to
+
+Usage:
+    python tools/benchmarks/app_volume_sessions.py [frames]
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.app_volume import AppVolumeOverlay
+from src.audio_sessions import FakeSessionProvider
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    provider = FakeSessionProvider()
+    wakes = [0]
+    overlay = AppVolumeOverlay(config, provider=provider, on_change=lambda: wakes.__setitem__(0, wakes[0] + 1))
+    overlay.enabled = True
+
+    provider.add("spotify", "Spotify.exe", pid=100, volume=80)
+    provider.add("chrome", "chrome.exe", pid=201, volume=60)
+    provider.add("discord", "Discord.exe", pid=300, volume=100)
+    provider.add("game", "SomeVeryLongGameExecutableName-Win64-Shipping.exe", pid=400, volume=40)
+    provider.set_active("chrome", True)
+    provider.set_active("spotify", True)
+
+    # Odak: ön plandaki pencere chrome'un ana süreci (ses alt süreçten çalıyor)
+    provider.set_foreground(200, "chrome.exe")
+    focus = overlay.focus_session()
+    print(f"focus (foreground chrome.exe, audio pid differs) -> {focus.name if focus else None}")
+    provider.set_foreground(None)
+    focus = overlay.focus_session()
+    print(f"focus (no foreground match, most recent audible) -> {focus.name if focus else None}")
+
+    start = time.perf_counter()
+    for i in range(frames):
+        provider.set_volume("spotify", i % 101)
+        overlay.update()
+        overlay.get_image()
+    cached = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for i in range(frames):
+        provider.set_volume("spotify", (i + 50) % 101)
+        overlay.update()
+        overlay._headers.clear()  # eski davranış: her karede ikon + ad yeniden çizilir
+        overlay.get_image()
+    uncached = (time.perf_counter() - start) / frames
+
+    provider.remove("discord")
+    overlay.update()
+
+    overlay.enabled = False
+    overlay.follow_focus = True
+    provider.set_foreground(400, "somegame.exe")
+    overlay._focus_checked = 0.0
+    overlay.update()
+    focus_shown = overlay.should_display()
+    focus_name = provider.sessions[overlay._shown_key].name
+
+    print(f"{frames} frames, 4 sessions, wakes={wakes[0]}")
+    print(f"get_image    cached header={cached * 1e6:7.1f}us  re-rendered={uncached * 1e6:7.1f}us")
+    print(f"headers rendered (cached run + uncached run) = {overlay.headers_rendered}")
+    print(f"sessions now: {sorted(info.name for info in provider.sessions.values())}")
+    print(f"follow_focus switch shown={focus_shown} ({focus_name})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+OLED Customizer - Media arbitration benchmark
+Measures the cost of one MediaArbiter.tick() with all four providers
+registered, using in-memory fake providers and an injected clock.
+
+Usage:
+    python tools/benchmarks/arbitration_cost.py [ticks]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.media_sources import MediaArbiter, MediaSource, SpotifySource, SmtcSource
+
+
+class FakeExtensionSource(MediaSource):
+    name = "extension"
+
+    def __init__(self):
+        self.data = None
+
+    def poll(self, now_ms):
+        return self.data
+
+
+class FakeFileSource(MediaSource):
+    name = "file"
+
+    def poll(self, now_ms):
+        return None
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    clock = [0]
+    spotify = SpotifySource()
+    smtc = SmtcSource()
+    arbiter = MediaArbiter([spotify, FakeExtensionSource(), smtc, FakeFileSource()], clock=lambda: clock[0])
+
+    song = {"title": "Song", "artist": "Artist", "progress": 0, "duration": 200_000, "paused": False}
+    smtc_data = {"title": "Video", "artist": "Channel", "progress": 0, "duration": 60_000,
+                 "paused": False, "source": "chrome.exe"}
+
+    start = time.perf_counter()
+    for i in range(ticks):
+        clock[0] = i * 100
+        if i % 2 == 0:
+            smtc.push(smtc_data, clock[0])
+        if i % 50 == 0:
+            spotify.push(song if (i // 5000) % 2 == 0 else None, clock[0])
+        arbiter.tick()
+    elapsed = time.perf_counter() - start
+
+    print(f"{ticks} ticks, {elapsed * 1e6 / ticks:.2f} us/tick "
+          f"({elapsed * 1e6 / ticks / (1e6 / 10) * 100:.4f}% of a 10 fps frame)")
+
+
+if __name__ == "__main__":
+    main()
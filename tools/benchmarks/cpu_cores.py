@@ -0,0 +1,113 @@
+"""
+OLED Customizer - Per-core CPU bar page drawing cost
+Draws the bar area of the per-core page (128x28) for 4..64 logical CPUs:
+  - slices: fill_bars, one slice assignment per bar (used up to SLICE_BARS)
+  - numpy:  group_levels + bar_heights (column -> bar lookup) + area_mask
+  - naive:  one ImageDraw.rectangle per bar on a fresh image
+each packed into a mode "1" image, and a full page through
+SensorGraphs.get_cores_image with a new sample every frame. Levels change
+every frame so nothing is cached. slices and numpy must give the same
+pixels for every core count up to SLICE_BARS.
+With few cores the random "max N%" label changes almost every frame,
+so the 4-core page column is dominated by label rasterisation, not bars.
+
+Usage:
+    python tools/benchmarks/cpu_cores.py [renders]
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from src.image_utils import fetch_content_path
+from src.sensor_graphs import (LABEL_HEIGHT, SLICE_BARS, SensorGraphs, area_mask, bar_heights, fill_bars,
+                               frame_to_image, group_levels)
+from src.sensor_history import SensorHistory
+from src.sensor_sampler import EMPTY_SNAPSHOT
+
+CORE_COUNTS = (4, 8, 16, 32, 64)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def numpy_bars(levels, w, h):
+    mask = area_mask(bar_heights(group_levels(levels), w, h), h)
+    return frame_to_image(mask, 1)
+
+
+def slice_bars(levels, w, h):
+    area = np.empty((h, w), dtype=bool)
+    fill_bars(area, levels)
+    return frame_to_image(area, 1)
+
+
+def naive_bars(levels, w, h):
+    image = Image.new("1", (w, h), color=0)
+    draw = ImageDraw.Draw(image)
+    levels = list(levels)
+    if len(levels) > 32:  # aynı gruplama, saf Python
+        n = len(levels)
+        starts = [(i * n) // 32 for i in range(33)]
+        levels = [sum(levels[a:b]) / (b - a) for a, b in zip(starts, starts[1:])]
+    bars = len(levels)
+    for i, level in enumerate(levels):
+        x0 = (i * w) // bars
+        x1 = ((i + 1) * w) // bars - (1 if w // bars < 8 else 2) - 1
+        top = h - max(1, int(round(level * h / 100)))
+        draw.rectangle((x0, top, x1, h - 1), fill=1)
+    return image
+
+
+def timed(fn, frames):
+    times = []
+    for levels in frames:
+        start = time.perf_counter()
+        fn(levels)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    w, h = 128, 40 - LABEL_HEIGHT
+    rng = np.random.default_rng(1)
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    font = ImageFont.truetype(font=fetch_content_path("fonts/VerdanaBold.ttf"), size=11)
+    graphs = SensorGraphs(config, SensorHistory(), font)
+
+    print(f"{renders} renders, bar area {w}x{h}")
+    for cores in range(1, SLICE_BARS + 1):
+        for levels in (rng.uniform(0, 100, cores), np.zeros(cores), np.full(cores, 100.0)):
+            levels = tuple(float(v) for v in levels)
+            if slice_bars(levels, w, h).tobytes() != numpy_bars(levels, w, h).tobytes():
+                print(f"FAIL slices and numpy differ for {cores} cores: {levels}")
+                sys.exit(1)
+
+    print(f"{'cores':>5}  {'slices p50':>10}  {'numpy p50':>10}  {'naive p50':>10}  {'page p50':>10}")
+    for cores in CORE_COUNTS:
+        frames = [tuple(float(v) for v in rng.uniform(0, 100, cores)) for _ in range(renders)]
+        assert numpy_bars(frames[0], w, h).tobytes() == naive_bars(frames[0], w, h).tobytes()
+        slices = timed(lambda levels: slice_bars(levels, w, h), frames) if cores <= SLICE_BARS else None
+        vec = timed(lambda levels: numpy_bars(levels, w, h), frames)
+        naive = timed(lambda levels: naive_bars(levels, w, h), frames)
+        snaps = [EMPTY_SNAPSHOT._replace(seq=i + 1, cpu_usage=37.0, cpu_cores=levels) for i, levels in enumerate(frames)]
+        graphs._cache_key = None
+        graphs.get_cores_image(snaps[-1])     # etiket fontu ısınsın
+        page = timed(graphs.get_cores_image, snaps)
+        slices = f"{percentile(slices, 0.5) * 1e6:8.1f}us" if slices else f"{'-':>10}"
+        print(f"{cores:5d}  {slices}  {percentile(vec, 0.5) * 1e6:8.1f}us  {percentile(naive, 0.5) * 1e6:8.1f}us  "
+              f"{percentile(page, 0.5) * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
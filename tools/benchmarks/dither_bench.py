@@ -0,0 +1,81 @@
+"""
+OLED Customizer - Album art dithering benchmark
+Compares the wavefront-vectorized NumPy dither in src/album_art.py with a
+plain per-pixel Python loop (same kernel, raster order) and PIL's
+convert("1"), on 24x24 and 40x40 covers. Also reports how many pixels the
+vectorized result differs from the raster-order reference (float32 vs
+float64 rounding only; should be ~0).
+
+Usage:
+    python tools/benchmarks/dither_bench.py [image_file]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+from PIL import Image
+
+from src.album_art import ATKINSON, FLOYD_STEINBERG, dither, render_cover
+
+
+def reference_dither(gray, kernel):
+    height, width = gray.shape
+    buf = [[v / 255.0 for v in row] for row in gray.tolist()]
+    out = [[False] * width for _ in range(height)]
+    for y in range(height):
+        for x in range(width):
+            old = buf[y][x]
+            new = old >= 0.5
+            out[y][x] = new
+            err = old - new
+            for dy, dx, weight in kernel:
+                ty, tx = y + dy, x + dx
+                if ty < height and 0 <= tx < width:
+                    buf[ty][tx] += err * weight
+    return np.array(out)
+
+
+def synthetic_cover(size=640):
+    ys, xs = np.mgrid[0:size, 0:size]
+    r = np.hypot(xs - size / 2, ys - size / 2)
+    gray = (127 + 100 * np.sin(r / 18) * np.cos(xs / 40)).clip(0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(gray).convert("RGB").save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            data = f.read()
+    else:
+        data = synthetic_cover()
+
+    for size in (24, 40):
+        small = Image.open(io.BytesIO(data)).convert("L").resize((size, size), Image.LANCZOS)
+        gray = np.asarray(small)
+        for name, kernel in (("atkinson", ATKINSON), ("floyd", FLOYD_STEINBERG)):
+            vec_ms, vec = timed(lambda: dither(gray, kernel), 200)
+            ref_ms, ref = timed(lambda: reference_dither(gray, kernel), 5)
+            diff = int(np.count_nonzero(vec != ref))
+            print(f"{size}x{size} {name:<8} numpy={vec_ms:6.3f}ms  python={ref_ms:7.2f}ms  "
+                  f"speedup={ref_ms / vec_ms:5.1f}x  differing_pixels={diff}")
+        pil_ms, _ = timed(lambda: small.convert("1"), 200)
+        full_ms, _ = timed(lambda: render_cover(data, size), 20)
+        print(f"{size}x{size} PIL convert('1')={pil_ms:6.3f}ms  full pipeline (decode+fit+dither)={full_ms:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
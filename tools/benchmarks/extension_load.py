@@ -0,0 +1,141 @@
+"""
+OLED Customizer - ExtensionReceiver load test
+Starts a receiver on localhost and hammers it from several simulated tabs,
+each on its own keep-alive connection, while a "render loop" thread keeps
+reading the latest data and counting how often the selected tab flips
+(with one playing tab and the rest paused it should stay on the playing
+one). Also sends a few malformed requests (oversized,
+chunked, slow) to check they cannot stall the other tabs.
+
+Usage:
+    python tools/benchmarks/extension_load.py [tabs] [seconds]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import threading
+import http.client
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.ExtensionReceiver import ExtensionReceiver, MAX_BODY_BYTES
+
+PORT = 18888
+
+
+def tab_worker(tab_id, deadline, latencies, failures):
+    conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=5)
+    progress = 0.0
+    while time.perf_counter() < deadline:
+        body = json.dumps({
+            "title": f"Video {tab_id}",
+            "artist": "Channel",
+            "duration": 300,
+            "progress": progress,
+            "playing": tab_id == 0,
+            "tab": f"tab-{tab_id}",
+        })
+        start = time.perf_counter()
+        try:
+            conn.request("POST", "/extension_data", body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                failures.append(response.status)
+        except (OSError, http.client.HTTPException) as e:
+            failures.append(str(e))
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=5)
+            continue
+        latencies.append(time.perf_counter() - start)
+        progress += 0.5
+    conn.close()
+
+
+def slow_client(deadline):
+    """Opens a request and never finishes the body (slow-loris)."""
+    while time.perf_counter() < deadline:
+        try:
+            s = socket.create_connection(("127.0.0.1", PORT))
+            s.sendall(b"POST /extension_data HTTP/1.1\r\nHost: x\r\nContent-Length: 100\r\n\r\n{")
+            time.sleep(1.0)
+            s.close()
+        except OSError:
+            time.sleep(0.1)
+
+
+def abuse_requests():
+    results = {}
+    conn = http.client.HTTPConnection("127.0.0.1", PORT, timeout=5)
+    conn.request("POST", "/extension_data", b"x" * (MAX_BODY_BYTES + 1))
+    results["oversized"] = conn.getresponse().status
+    conn.close()
+
+    s = socket.create_connection(("127.0.0.1", PORT))
+    body = json.dumps({"title": "Chunked", "playing": True}).encode()
+    s.sendall(
+        b"POST /extension_data HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+        + f"{len(body):x}\r\n".encode() + body + b"\r\n0\r\n\r\n"
+    )
+    results["chunked"] = s.recv(1024).split(b" ", 2)[1].decode()
+    s.close()
+    return results
+
+
+def main():
+    tabs = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    receiver = ExtensionReceiver(port=PORT)
+    receiver.start()
+    time.sleep(0.3)
+
+    print("abuse:", abuse_requests())
+
+    deadline = time.perf_counter() + seconds
+    latencies = []
+    failures = []
+    reads = [0]
+    flips = [0]
+    max_read_gap = [0.0]
+
+    def render_loop():
+        last = time.perf_counter()
+        shown = None
+        while time.perf_counter() < deadline:
+            data = receiver.get_latest_data()
+            title = data.get("title") if data else None
+            if shown is not None and title != shown:
+                flips[0] += 1
+            shown = title
+            reads[0] += 1
+            now = time.perf_counter()
+            max_read_gap[0] = max(max_read_gap[0], now - last)
+            last = now
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=tab_worker, args=(i, deadline, latencies, failures)) for i in range(tabs)]
+    threads.append(threading.Thread(target=slow_client, args=(deadline,), daemon=True))
+    threads.append(threading.Thread(target=render_loop))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(seconds + 10)
+
+    latencies.sort()
+    if latencies:
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f"{tabs} tabs: {len(latencies)} requests in {seconds:.0f}s "
+              f"({len(latencies) / seconds:.0f} req/s), p50={p50:.2f}ms p99={p99:.2f}ms "
+              f"max={latencies[-1] * 1000:.2f}ms, failures={len(failures)}")
+    print(f"render loop: {reads[0]} reads, {flips[0]} tab flips, max gap {max_read_gap[0] * 1000:.1f}ms")
+    print("receiver stats:", receiver.get_stats())
+    receiver.stop()
+
+
+if __name__ == "__main__":
+    main()
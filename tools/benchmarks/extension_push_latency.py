@@ -0,0 +1,132 @@
+"""
+OLED Customizer - Extension push channel latency
+Starts a receiver on localhost, connects a WebSocket client the way the
+extension does, and toggles play/pause N times. Reports:
+  - ack RTT (send -> ack back at the client)
+  - wake latency (send -> render loop woken by the receiver listener)
+and, for comparison, how stale the data is on average with the old 500 ms
+POST polling (uniform arrival inside the interval + render frame).
+
+Usage:
+    python tools/benchmarks/extension_push_latency.py [events]
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import socket
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src import ws_frames
+from src.ExtensionReceiver import ExtensionReceiver, MAX_BODY_BYTES
+
+PORT = 18889
+FPS = 10
+LEGACY_POLL_MS = 500
+
+
+def ws_connect(origin="chrome-extension://oled-customizer-benchmark"):
+    sock = socket.create_connection(("127.0.0.1", PORT), timeout=5)
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    sock.sendall((
+        "GET /ws HTTP/1.1\r\n"
+        "Host: 127.0.0.1\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        f"Origin: {origin}\r\n"
+        "Sec-WebSocket-Version: 13\r\n\r\n"
+    ).encode("ascii"))
+    rfile = sock.makefile("rb")
+    status = rfile.readline()
+    if b"101" not in status:
+        raise RuntimeError(f"handshake failed: {status!r}")
+    while rfile.readline() not in (b"\r\n", b""):
+        pass
+    return sock, rfile
+
+
+def send(sock, message):
+    sock.sendall(ws_frames.encode_frame(ws_frames.OP_TEXT, json.dumps(message).encode("utf-8"), mask=True))
+
+
+def read_text(rfile):
+    """Next text frame; server pings in between are skipped."""
+    while True:
+        _, opcode, payload = ws_frames.read_frame(rfile, MAX_BODY_BYTES)
+        if opcode == ws_frames.OP_TEXT:
+            return payload
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    receiver = ExtensionReceiver(port=PORT)
+    wake = threading.Event()
+    receiver.add_listener(wake.set)
+    receiver.start()
+    time.sleep(0.3)
+
+    # Simüle render döngüsü: DisplayManager gibi wake.wait(1/fps)
+    woken_at = []
+    running = True
+
+    def render_loop():
+        while running:
+            if wake.wait(1 / FPS):
+                woken_at.append(time.perf_counter())
+            wake.clear()
+
+    loop = threading.Thread(target=render_loop, daemon=True)
+    loop.start()
+
+    sock, rfile = ws_connect()
+    state = {"title": "Video", "artist": "Channel", "duration": 300, "progress": 0, "playing": True}
+    send(sock, {"type": "state", "seq": 0, "data": state})
+    read_text(rfile)
+
+    rtts = []
+    wakes = []
+    for seq in range(1, events + 1):
+        time.sleep(0.02 + (seq % 7) * 0.003)  # olaylar kare sınırına hizalı olmasın
+        woken_at.clear()
+        sent = time.perf_counter()
+        send(sock, {"type": "delta", "seq": seq, "data": {"playing": seq % 2 == 0, "progress": seq}})
+        payload = read_text(rfile)
+        rtts.append(time.perf_counter() - sent)
+        ack = json.loads(payload)
+        if ack.get("seq") != seq:
+            print(f"unexpected ack {ack}")
+        deadline = time.perf_counter() + 0.5
+        while not woken_at and time.perf_counter() < deadline:
+            time.sleep(0.0005)
+        if woken_at:
+            wakes.append(woken_at[0] - sent)
+
+    send(sock, {"type": "bye", "seq": events + 1})
+    sock.close()
+    running = False
+    receiver.stop()
+
+    print(f"{events} events over one WebSocket")
+    print(f"ack rtt      p50={percentile(rtts, 0.5) * 1e6:7.0f}us  p99={percentile(rtts, 0.99) * 1e6:7.0f}us")
+    if wakes:
+        print(f"render wake  p50={percentile(wakes, 0.5) * 1e3:7.2f}ms  p99={percentile(wakes, 0.99) * 1e3:7.2f}ms"
+              f"  missed={events - len(wakes)}")
+    # Eski yol: veri POST aralığında uniform gelir, render karesine de yarım kare eklenir
+    legacy_avg = LEGACY_POLL_MS / 2 + 1000 / FPS / 2
+    legacy_max = LEGACY_POLL_MS + 1000 / FPS
+    print(f"legacy poll  avg={legacy_avg:7.2f}ms  max={legacy_max:7.2f}ms  (500 ms POST + {FPS} fps loop)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+OLED Customizer - Now-playing file ingestion benchmark
+Runs NowPlayingFile against a writer in a temp dir and reports how many
+polls actually opened/parsed the file, and the per-poll cost compared with
+the old open + json.load on every read.
+
+Phases:
+  idle     - file is not touched, reader polls every 10 ms
+  atomic   - writer replaces the file (temp + os.replace) every 500 ms
+  inplace  - writer truncates and rewrites in two halves (torn reads)
+
+Each phase is also checked, and the script exits with status 1 if a check
+fails:
+  - the reader never returns None or a torn object once it has data
+  - titles never go backwards
+  - after the writer stops, the reader returns the last written track
+  - idle polls open the file only on the first read
+
+Usage:
+    python tools/benchmarks/file_ingest.py [seconds_per_phase]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import itertools
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.media_fallback import NowPlayingFile
+
+POLL_S = 0.01
+
+# Fazlar arasında da artan parça numarası (okuyucu önceki fazın dosyasıyla başlar)
+TRACKS = itertools.count(1)
+
+
+def payload(i):
+    return json.dumps({
+        "title": f"Track {i}",
+        "artist": "Artist",
+        "progress_ms": i * 500,
+        "duration_ms": 240000,
+        "paused": False,
+        "source": "foobar2000",
+        "ts": int(time.time() * 1000),
+    }).encode("utf-8")
+
+
+def atomic_writer(path, stop, written):
+    while not stop.is_set():
+        i = next(TRACKS)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload(i))
+        os.replace(tmp, path)
+        written.append(i)
+        stop.wait(0.5)
+
+
+def inplace_writer(path, stop, written):
+    while not stop.is_set():
+        i = next(TRACKS)
+        body = payload(i)
+        with open(path, "wb") as f:
+            f.write(body[:len(body) // 2])
+            f.flush()
+            time.sleep(0.02)  # okuyucu yarım dosyayı yakalasın
+            f.write(body[len(body) // 2:])
+        written.append(i)
+        stop.wait(0.5)
+
+
+def track(data):
+    return int(data["title"].split()[-1])
+
+
+def legacy_read(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def run_phase(name, path, writer, seconds):
+    """Returns the list of failed checks."""
+    watcher = NowPlayingFile(path)
+    stop = threading.Event()
+    written = []
+    thread = threading.Thread(target=writer, args=(path, stop, written)) if writer else None
+    if thread:
+        thread.start()
+
+    failures = []
+    last_track = -1
+    polls = 0
+    torn = 0
+    cost_ns = 0
+    legacy_ns = 0
+    legacy_torn = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter_ns()
+        data = watcher.read()
+        cost_ns += time.perf_counter_ns() - start
+        if data is None or "title" not in data:
+            if last_track >= 0:
+                torn += 1  # yeni okuyucu ilk okumada yarım dosyaya denk gelebilir
+        else:
+            if track(data) < last_track:
+                failures.append(f"{name}: track went back from {last_track} to {track(data)}")
+            last_track = track(data)
+
+        start = time.perf_counter_ns()
+        if legacy_read(path) is None:
+            legacy_torn += 1
+        legacy_ns += time.perf_counter_ns() - start
+
+        polls += 1
+        time.sleep(POLL_S)
+
+    stop.set()
+    if thread:
+        thread.join()
+
+    print(f"{name:<8} polls={polls:5d}  opened={watcher.reads:4d}  parsed={watcher.parses:4d}  "
+          f"parse_errors={watcher.errors:3d}  missing_data={torn:3d}  "
+          f"cost={cost_ns / polls / 1000:6.1f}us/poll  "
+          f"legacy={legacy_ns / polls / 1000:6.1f}us/poll legacy_failures={legacy_torn}")
+
+    if torn:
+        failures.append(f"{name}: reader returned no data on {torn} polls")
+    if writer is None and watcher.reads > 1:
+        failures.append(f"{name}: idle reader opened the file {watcher.reads} times (first read only)")
+    if written:
+        # Son yazım racy penceresinde olabilir; bir sonraki okuma yine de görmeli
+        final = watcher.read()
+        if final is None or track(final) != written[-1]:
+            failures.append(f"{name}: last read {final and track(final)}, last written {written[-1]}")
+    return failures
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nowplaying.json")
+        with open(path, "wb") as f:
+            f.write(payload(next(TRACKS)))
+        time.sleep(1.1)  # mtime "racy" penceresinden çık
+        failures = run_phase("idle", path, None, seconds)
+        failures += run_phase("atomic", path, atomic_writer, seconds)
+        failures += run_phase("inplace", path, inplace_writer, seconds)
+
+    for failure in failures:
+        print("FAIL", failure)
+    if failures:
+        sys.exit(1)
+    print("all checks passed")
+
+
+if __name__ == "__main__":
+    main()
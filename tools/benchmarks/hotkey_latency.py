@@ -0,0 +1,135 @@
+"""
+OLED Customizer - Hotkey dispatch latency
+Feeds synthetic key events (plain keys and a ctrl+alt chord) into
+HotkeyDispatcher while a simulated render loop waits on the wake event
+like DisplayManager. The bound action sleeps to stand in for a COM call.
+Reports:
+  - time spent inside the listener callback (old: the whole action)
+  - hotkey -> pixel latency (key event -> first frame after the action)
+  - modifier tracking: a lost key-up (Win+L) and left/right sides
+
+Usage:
+    python tools/benchmarks/hotkey_latency.py [presses] [action_ms]
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.hotkeys import MODIFIER_EXPIRY_SECONDS, HotkeyDispatcher
+
+FPS = 10
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def check_modifiers():
+    """Chord results after a lost ctrl key-up and after releasing one ctrl of two."""
+    physical = set()
+    fired = []
+    dispatcher = HotkeyDispatcher({"mute_mic": lambda: fired.append("mute_mic"),
+                                   "cycle_screen": lambda: fired.append("cycle_screen")},
+                                  key_state=lambda side: side in physical)
+    dispatcher.bind({"mute_mic": "m", "cycle_screen": "ctrl+m"})
+
+    # Win+L: ctrl_l basılıyken kilit, key-up listener'a hiç gelmez
+    physical.add("ctrl_l")
+    dispatcher.handle("down", "Key.ctrl_l", 0.0)
+    physical.discard("ctrl_l")
+    dispatcher.handle("down", "m", 5.0)
+    dispatcher.handle("up", "m", 5.1)
+    lost_up = fired[-1] if fired else None
+
+    # İki ctrl basılı, biri bırakılınca ctrl hâlâ basılı
+    physical.update(("ctrl_l", "ctrl_r"))
+    dispatcher.handle("down", "Key.ctrl_l", 6.0)
+    dispatcher.handle("down", "Key.ctrl_r", 6.1)
+    physical.discard("ctrl_l")
+    dispatcher.handle("up", "Key.ctrl_l", 6.2)
+    dispatcher.handle("down", "m", 6.3)
+    both_sides = fired[-1] if len(fired) > 1 else None
+
+    # key_state yok (Windows dışı): süre dolunca bırakılmış sayılır
+    expiring = HotkeyDispatcher({"mute_mic": lambda: fired.append("expired")})
+    expiring.key_state = None  # Windows'ta da GetAsyncKeyState yerine süre
+    expiring.bind({"mute_mic": "m"})
+    expiring.handle("down", "Key.ctrl_l", 0.0)
+    expiring.handle("down", "m", MODIFIER_EXPIRY_SECONDS + 1)
+    expired = fired[-1] == "expired"
+
+    print(f"lost ctrl key-up, then m -> {lost_up} (want mute_mic)")
+    print(f"ctrl_l up while ctrl_r held, then m -> {both_sides} (want cycle_screen)")
+    print(f"no key state, ctrl older than {MODIFIER_EXPIRY_SECONDS:g}s, then m -> "
+          f"{'mute_mic' if expired else 'nothing'} (want mute_mic)")
+
+
+def main():
+    presses = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    action_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 15.0
+
+    wake = threading.Event()
+    frame_counter = [0]
+
+    def slow_action():
+        time.sleep(action_ms / 1000)   # ör. mikrofon mute için COM çağrısı
+        frame_counter[0] += 1          # ekranda görünecek bir değişiklik
+
+    # Sentetik tuşlar fiziksel olarak basılı değil: GetAsyncKeyState'e sorma
+    dispatcher = HotkeyDispatcher({"mute_mic": slow_action, "cycle_screen": slow_action}, on_dispatch=wake.set,
+                                  key_state=lambda side: True)
+    dispatcher.bind({"mute_mic": "Key.pause", "cycle_screen": "ctrl+alt+m"})
+    dispatcher.start()
+
+    running = True
+
+    def render_loop():
+        last = 0
+        while running:
+            pending = dispatcher.take_pending()
+            if frame_counter[0] != last:      # kare değişti -> gönderildi
+                last = frame_counter[0]
+                if pending is not None:
+                    dispatcher.record_frame(pending)
+            wake.wait(1 / FPS)
+            wake.clear()
+
+    loop = threading.Thread(target=render_loop, daemon=True)
+    loop.start()
+
+    callback_times = []
+    for i in range(presses):
+        time.sleep(0.03 + (i % 7) * 0.007)
+        if i % 2:
+            keys = ["Key.ctrl_l", "Key.alt_l", "<77>"]   # ctrl+alt+m (vk 77)
+        else:
+            keys = ["Key.pause"]
+        for key in keys:
+            start = time.perf_counter()
+            dispatcher.key_down(key)
+            callback_times.append(time.perf_counter() - start)
+        for key in reversed(keys):
+            dispatcher.key_up(key)
+
+    time.sleep(0.3)
+    running = False
+    dispatcher.stop()
+
+    latencies = list(dispatcher.latencies)
+    print(f"{presses} hotkeys ({presses // 2} chords), action={action_ms:.0f}ms, dispatched={dispatcher.dispatched}")
+    print(f"listener callback p50={percentile(callback_times, 0.5) * 1e6:7.1f}us  "
+          f"max={max(callback_times) * 1e6:7.1f}us  (inline: >= {action_ms:.0f}ms)")
+    if latencies:
+        print(f"hotkey->pixel     p50={percentile(latencies, 0.5) * 1e3:7.2f}ms  "
+              f"p99={percentile(latencies, 0.99) * 1e3:7.2f}ms  (samples={len(latencies)})")
+    print(f"legacy frame wait avg={1000 / FPS / 2 + action_ms:7.2f}ms  (action inline + half a {FPS} fps frame)")
+    check_modifiers()
+
+
+if __name__ == "__main__":
+    main()
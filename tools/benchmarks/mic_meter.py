@@ -0,0 +1,99 @@
+"""
+OLED Customizer - Mic level meter sampling
+Runs VolumeOverlay with FakeAudioBackend and a MicLevelSampler on
+SyntheticLevelSource through one show -> hide cycle. Reports:
+  - sampler interval jitter at the configured rate
+  - get_image() cost with and without the level bar
+  - samples taken while the overlay is hidden (should be 0)
+
+Usage:
+    python tools/benchmarks/mic_meter.py [rate_hz]
+"""
+
+import os
+import sys
+import time
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.audio_backend import FakeAudioBackend
+from src.mic_meter import MicLevelSampler, SyntheticLevelSource
+from src.volume import VolumeOverlay
+
+FPS = 10
+
+
+class StampedSource(SyntheticLevelSource):
+    def __init__(self):
+        super().__init__()
+        self.stamps = []
+
+    def read(self):
+        self.stamps.append(time.perf_counter())
+        return super().read()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    source = StampedSource()
+    meter = MicLevelSampler(source, rate_hz=rate)
+    backend = FakeAudioBackend(mic_muted=False)
+    overlay = VolumeOverlay(config, timeout=1.5, backend=backend, meter=meter)
+
+    # Göster: ses değişir, overlay 1.5 s görünür, render döngüsü 10 fps
+    backend.set_volume(70)
+    overlay.update()
+    time.sleep(0.1)
+    start = time.perf_counter()
+    for _ in range(200):
+        overlay.get_image()
+    with_meter = (time.perf_counter() - start) / 200
+
+    frames = 0
+    levels = []
+    end = time.perf_counter() + 2.5
+    while time.perf_counter() < end:
+        overlay.update()
+        if overlay.should_display():
+            overlay.get_image()
+            levels.append(meter.latest)
+            frames += 1
+        time.sleep(1 / FPS)
+
+    hidden_samples_start = meter.samples
+    time.sleep(1.0)
+    hidden_samples = meter.samples - hidden_samples_start
+
+    overlay.close()
+
+    intervals = [b - a for a, b in zip(source.stamps, source.stamps[1:])]
+    print(f"rate {rate} Hz, {len(source.stamps)} samples over {frames} visible frames")
+    if intervals:
+        print(f"interval     p50={percentile(intervals, 0.5) * 1e3:6.2f}ms  p99={percentile(intervals, 0.99) * 1e3:6.2f}ms"
+              f"  target={1000 / rate:6.2f}ms")
+    print(f"get_image    with meter      ={with_meter * 1e6:6.1f}us")
+
+    no_meter = VolumeOverlay(config, backend=FakeAudioBackend(mic_muted=False), meter=None)
+    no_meter.update()
+    start = time.perf_counter()
+    for _ in range(200):
+        no_meter.get_image()
+    print(f"get_image    without meter   ={(time.perf_counter() - start) / 200 * 1e6:6.1f}us")
+    no_meter.close()
+
+    print(f"levels seen  min={min(levels):.2f} max={max(levels):.2f}")
+    print(f"hidden: samples={hidden_samples} thread alive={meter._thread.is_alive()} "
+          f"threads={threading.active_count()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+OLED Customizer - Media position error benchmark
+Replays a position trace through the old 2000/500/200 ms threshold logic and
+through PositionEstimator, simulating the player's own per-frame advance, and
+reports the displayed-position error against the true position.
+
+Trace file (CSV with header): t_ms,reported_ms,truth_ms,playing
+Without a file a synthetic SMTC-like trace is generated (stale timeline
+updates, jitter, outliers, one forward and one backward seek).
+
+Usage:
+    python tools/benchmarks/position_filter_trace.py [trace.csv]
+"""
+
+import os
+import sys
+import csv
+import math
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.position_filter import PositionEstimator
+
+FPS = 10
+POLL_MS = 200
+
+
+SEEKS = ((60_000, 95_000), (120_000, 110_000))  # (saat zamanı, yeni pozisyon)
+
+
+def truth_position(t):
+    origin_t, origin_pos = 0, 0.0
+    for at, to in SEEKS:
+        if t >= at:
+            origin_t, origin_pos = at, float(to)
+    return origin_pos + (t - origin_t)
+
+
+def synthetic_trace(length_ms=180_000, seed=3):
+    rnd = random.Random(seed)
+    rows = []
+    reported_base = 0.0
+    reported_at = 0
+    seeks = list(SEEKS)
+    t = 0
+    while t < length_ms:
+        truth = truth_position(t)
+        if seeks and t >= seeks[0][0]:
+            seeks.pop(0)
+            reported_base, reported_at = truth, t
+
+        # SMTC: timeline sadece arada bir güncellenir, araya extrapolation girer
+        if rnd.random() < 0.08:
+            reported_base = truth + rnd.gauss(0, 250)
+            reported_at = t
+        reported = reported_base + (t - reported_at) * 1.002 + rnd.gauss(0, 60)
+        if rnd.random() < 0.01:
+            reported += rnd.choice([-1, 1]) * rnd.randint(2500, 6000)  # outlier
+
+        rows.append((t, int(reported), truth, True))
+        t += POLL_MS + rnd.randint(-20, 40)
+    return rows
+
+
+def load_trace(path):
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            rows.append((
+                int(float(row["t_ms"])),
+                int(float(row["reported_ms"])),
+                float(row["truth_ms"]),
+                str(row.get("playing", "1")).strip().lower() in ("1", "true", "yes"),
+            ))
+    return rows
+
+
+def legacy_apply(player_pos, progress):
+    diff = progress - player_pos
+    if abs(diff) > 2000:
+        return progress
+    if diff > 500:
+        return progress
+    return player_pos
+
+
+def simulate(trace, mode):
+    estimator = PositionEstimator()
+    player_pos = float(trace[0][1])
+    estimator.reset(player_pos, trace[0][0])
+
+    rnd = random.Random(11)
+    t = trace[0][0]
+    end = trace[-1][0]
+    idx = 0
+    errors = []
+    backward = 0
+    last_second = int(player_pos // 1000)
+    last_truth = _truth_at(trace, t)
+
+    while t < end:
+        while idx < len(trace) and trace[idx][0] <= t:
+            sample_t, reported, _, playing = trace[idx]
+            if mode == "legacy":
+                player_pos = legacy_apply(player_pos, reported)
+            else:
+                position, seeked = estimator.update(reported, sample_t, playing)
+                if estimator.should_snap(player_pos, position, seeked):
+                    player_pos = position
+            idx += 1
+
+        # render: SpotifyPlayer.increase_timer her karede 1000/fps ekler,
+        # ama gerçek kare süresi sleep + çizim yüzünden biraz daha uzundur
+        frame_ms = 1000 / FPS + rnd.uniform(0, 15)
+        t += frame_ms
+        player_pos += 1000 / FPS
+
+        truth = _truth_at(trace, t)
+        err = player_pos - truth
+        errors.append(abs(err))
+
+        # gerçek bir geri seek değilse ekrandaki saniyenin geri gitmesi hatadır
+        second = int(player_pos // 1000)
+        if second < last_second and truth >= last_truth:
+            backward += 1
+        last_second = second
+        last_truth = truth
+
+    return errors, backward
+
+
+def _truth_at(trace, t):
+    lo, hi = 0, len(trace) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if trace[mid][0] <= t:
+            lo = mid
+        else:
+            hi = mid - 1
+    sample_t, _, truth, playing = trace[lo]
+    return truth + ((t - sample_t) if playing else 0)
+
+
+def main():
+    trace = load_trace(sys.argv[1]) if len(sys.argv) > 1 else synthetic_trace()
+    print(f"{len(trace)} samples, {(trace[-1][0] - trace[0][0]) / 1000:.0f} s")
+    for mode in ("legacy", "estimator"):
+        errors, backward = simulate(trace, mode)
+        rms = math.sqrt(sum(e * e for e in errors) / len(errors))
+        errors.sort()
+        p50 = errors[len(errors) // 2]
+        p95 = errors[int(len(errors) * 0.95)]
+        p99 = errors[int(len(errors) * 0.99)]
+        # rms, seek anlarındaki tek tük büyük hatalara çok duyarlı; percentile'lara bakın
+        print(f"{mode:<10} p50={p50:6.0f}ms  p95={p95:6.0f}ms  p99={p99:7.0f}ms  "
+              f"rms={rms:7.0f}ms  backward_steps={backward}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+OLED Customizer - Sensor backend read cost and per-metric selection
+Builds a fake /sys/class/hwmon tree (k10temp, amdgpu, nct6775 SuperIO) in
+a temp directory and compares one full read of the four hardware metrics:
+  - sysfs:  SysfsHwmonBackend (descriptors kept open, os.pread)
+  - reopen: the same files opened and read on every sample
+  - psutil: psutil.sensors_temperatures() + sensors_fans() on this machine
+Then probes a BackendSelector holding a slow fake "lhm" backend (busy
+SyntheticSensorReader) next to sysfs: LHM must win every metric on quality
+although it is slower, and one selector read must cost one LHM read.
+Finally probes sysfs alone with
+the GPU idle (0 % busy) and every fan stopped: load and fan must still get
+a backend and read 0.
+
+Usage:
+    python tools/benchmarks/sensor_backends.py [reads] [lhm_ms]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import psutil
+
+from src.sensor_backends import BackendSelector, LhmBackend, SensorBackend, SysfsHwmonBackend
+from src.sensor_sampler import SyntheticSensorReader
+
+CHIPS = {
+    "hwmon0": {"name": "nvme", "temp1_input": "38850", "temp1_label": "Composite"},
+    "hwmon1": {"name": "k10temp", "temp1_input": "61500", "temp1_label": "Tctl",
+               "temp3_input": "58000", "temp3_label": "Tccd1"},
+    "hwmon2": {"name": "amdgpu", "temp1_input": "54000", "temp1_label": "edge",
+               "temp2_input": "66000", "temp2_label": "junction", "fan1_input": "0",
+               "device/gpu_busy_percent": "37"},
+    "hwmon3": {"name": "nct6775", "fan1_input": "0", "fan2_input": "912", "fan3_input": "1480",
+               "temp1_input": "35000"},
+}
+
+
+class FakeLhmBackend(SensorBackend):
+    name = "lhm"
+    metrics = ("cpu_temp", "gpu_temp", "gpu_load", "fan_rpm")
+    quality = LhmBackend.quality
+
+    def __init__(self, cost_ms):
+        self.reader = SyntheticSensorReader(cost_ms)
+
+    def read(self, metrics):
+        values = self.reader()
+        return {m: values.get(m) for m in metrics}
+
+
+def build_tree(root):
+    for chip, files in CHIPS.items():
+        for name, value in files.items():
+            path = os.path.join(root, chip, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(value + "\n")
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def measure(fn, reads):
+    times = []
+    for _ in range(reads):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def report(label, times, result):
+    print(f"{label:9s} p50={percentile(times, 0.5) * 1e6:8.1f}us  p99={percentile(times, 0.99) * 1e6:8.1f}us  -> {result}")
+
+
+def main():
+    reads = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    lhm_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    metrics = ("cpu_temp", "gpu_temp", "gpu_load", "fan_rpm")
+
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root)
+        sysfs = SysfsHwmonBackend(root)
+        sysfs.open()
+        print(f"{reads} reads of {', '.join(metrics)}")
+        report("sysfs", *measure(lambda: sysfs.read(metrics), reads))
+
+        # Aynı zincir, her okumada open/read/close
+        chains = sysfs.paths
+
+        def reopen():
+            values = dict.fromkeys(metrics)
+            for metric, chain in chains.items():
+                for path, scale in chain:
+                    with open(path) as f:
+                        value = int(f.read()) / scale
+                    if value > 0:
+                        values[metric] = value
+                        break
+            return values
+
+        report("reopen", *measure(reopen, reads))
+
+        def psutil_read():
+            return len(psutil.sensors_temperatures()), len(psutil.sensors_fans())
+
+        report("psutil", *measure(psutil_read, max(1, reads // 10)))
+
+        selector = BackendSelector([FakeLhmBackend(lhm_ms), SysfsHwmonBackend(root)])
+        start = time.perf_counter()
+        ranking = selector.probe()
+        print(f"probe took {(time.perf_counter() - start) * 1e3:.1f}ms: "
+              + ", ".join(f"{m}={'>'.join(b.name for b in chain)}" for m, chain in ranking.items()))
+        lhm = selector.backends[0]
+        lhm.reader.calls = 0
+        selector_reads = max(1, reads // 100)
+        report("selector", *measure(selector.read, selector_reads))
+        print(f"lhm reads per sample: {lhm.reader.calls / selector_reads:.1f}")
+        selector.close()
+        sysfs.close()
+
+        # Boştaki GPU ve duran fanlar: 0 da gerçek okuma, metrik backend'siz kalmamalı
+        for chip, name in (("hwmon2", "device/gpu_busy_percent"), ("hwmon3", "fan2_input"), ("hwmon3", "fan3_input")):
+            with open(os.path.join(root, chip, name), "w") as f:
+                f.write("0\n")
+        idle = BackendSelector([SysfsHwmonBackend(root)])
+        ranking = idle.probe()
+        print(f"idle probe: {', '.join(ranking)} -> {idle.read()}")
+        idle.close()
+
+
+if __name__ == "__main__":
+    main()
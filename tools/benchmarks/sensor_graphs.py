@@ -0,0 +1,130 @@
+"""
+OLED Customizer - Sensor history ring buffer and graph page cost
+Fills a SensorHistory with 10 minutes of synthetic 1 Hz samples and
+reports its size, the cost of push() (and whether it allocates), and the
+cost of drawing the graph part of a page:
+  - numpy:  SensorGraphs.render_graph (broadcast column fills)
+  - naive:  the same area chart + sparkline with ImageDraw.line per column
+and of a whole page with a new sample each frame (label text included,
+cached per string). Finally checks the time-based window: a sampler pause
+must show up as a NaN gap, and a history that stopped growing must slide
+left instead of being labelled as the last N seconds.
+
+Usage:
+    python tools/benchmarks/sensor_graphs.py [renders] [window_seconds]
+"""
+
+import math
+import os
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from src.image_utils import fetch_content_path
+from src.sensor_graphs import GRAPH_PAGES, LABEL_HEIGHT, SensorGraphs, autoscale, column_heights, fit_columns
+from src.sensor_history import SensorHistory
+from src.sensor_sampler import EMPTY_SNAPSHOT
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def synthetic(i):
+    load = 35 + 30 * math.sin(i / 40) + (25 if i % 97 < 6 else 0)
+    return EMPTY_SNAPSHOT._replace(seq=i + 1, taken=float(i), cpu_usage=max(0.0, min(100.0, load)),
+                                   cpu_temp=55 + load / 5, gpu_load=load / 2, gpu_temp=48 + load / 8,
+                                   ram_percent=41.0 + (i % 50) / 10)
+
+
+def naive_graph(config, history, samples):
+    w, h = config.width, config.height - LABEL_HEIGHT
+    image = Image.new("1", (w, h), color=config.secondary)
+    draw = ImageDraw.Draw(image)
+    area = column_heights(fit_columns(history.window("cpu_usage", samples), w), 0.0, 100.0, h)
+    line = fit_columns(history.window("cpu_temp", samples), w)
+    lo, hi = autoscale(line)
+    ys = column_heights(line, lo, hi, h - 1)
+    for x in range(w):
+        if area[x]:
+            draw.line((x, h - 1, x, h - int(area[x])), fill=config.primary)
+        if x:
+            draw.line((x - 1, h - 1 - int(ys[x - 1]), x, h - 1 - int(ys[x])), fill=config.secondary)
+    return image
+
+
+def timed(fn, renders):
+    times = []
+    for i in range(renders):
+        start = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label, times):
+    print(f"{label:11s} p50={percentile(times, 0.5) * 1e6:7.1f}us  p99={percentile(times, 0.99) * 1e6:7.1f}us")
+
+
+def main():
+    renders = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    font = ImageFont.truetype(font=fetch_content_path("fonts/VerdanaBold.ttf"), size=11)
+    history = SensorHistory()
+    snapshots = [synthetic(i) for i in range(history.capacity * 4)]
+
+    for snap in snapshots[:history.capacity]:
+        history.push(snap)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for snap in snapshots[history.capacity:]:
+        history.push(snap)
+    push_cost = (time.perf_counter() - start) / (len(snapshots) - history.capacity)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"history: {len(history.metrics)} metrics x {history.capacity} samples = {history.nbytes} bytes")
+    print(f"push: {push_cost * 1e6:.2f} us/sample, traced growth after {len(snapshots) - history.capacity} pushes: {current} bytes")
+
+    graphs = SensorGraphs(config, history, font)
+    page = GRAPH_PAGES["graph_cpu"]
+    graph_h = config.height - LABEL_HEIGHT
+    print(f"{renders} renders of a {window}-sample window into {config.width}x{config.height}")
+    now = snapshots[-1].taken  # sahte saat: son örneğin zamanı
+    report("graph numpy", timed(lambda i: graphs.render_graph(page, window, graph_h, now), renders))
+    report("graph naive", timed(lambda i: naive_graph(config, history, window), renders))
+
+    def page_with_new_sample(i):
+        snap = snapshots[-1]._replace(seq=len(snapshots) + i + 1, taken=snapshots[-1].taken + i + 1)
+        history.push(snap)
+        graphs.get_image("graph_cpu", window, now=snap.taken)
+
+    report("full page", timed(page_with_new_sample, renders))
+    check_gaps()
+
+
+def check_gaps():
+    """30 s of samples, a 30 s pause, 30 s more; then the sampler stops for 60 s."""
+    history = SensorHistory(capacity=120)
+    taken = [float(t) for t in (*range(30), *range(60, 90))]
+    for i, t in enumerate(taken):
+        history.push(synthetic(i)._replace(taken=t))
+    values = history.window("cpu_usage", 90, interval=1.0, now=89.2)
+    gap = np.isnan(values[30:60]).all() and not np.isnan(values[:30]).any() and not np.isnan(values[60:]).any()
+    stale = history.window("cpu_usage", 90, interval=1.0, now=149.2)
+    slid = np.isnan(stale[30:]).all() and not np.isnan(stale[:30]).any()
+    counted = history.window("cpu_usage", 90)
+    print(f"pause -> NaN gap at the right place: {gap}; stopped 60 s -> slid left: {slid} "
+          f"(count-based window: {int(np.isnan(counted).sum())} NaN of 90)")
+
+
+if __name__ == "__main__":
+    main()
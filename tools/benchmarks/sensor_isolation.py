@@ -0,0 +1,116 @@
+"""
+OLED Customizer - Render-loop jitter with in-process vs isolated sensors
+Runs a 30 fps render loop (HardwareMonitor.get_image() forced to redraw
+every frame) while a deliberately slow, GIL-holding fake backend
+(SyntheticSensorReader) is sampled either on the in-process sampler thread
+or in the collector subprocess. Reports how late frames start relative to
+their schedule. A second run makes the backend hang after a few reads and
+counts watchdog restarts while the display keeps getting frames. A third
+run uses a reader that does not exist, so the child exits right away, and
+reports the restart backoff until the collector gives up and HardwareMonitor
+falls back to the in-process sampler.
+
+Usage:
+    python tools/benchmarks/sensor_isolation.py [seconds] [reader_ms] [interval]
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.HardwareMonitor import HardwareMonitor
+from src.sensor_collector import SensorCollector
+from src.sensor_sampler import SensorSampler, SyntheticSensorReader
+
+FPS = 30
+READER_SPEC = "src.sensor_sampler:SyntheticSensorReader"
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def render_loop(monitor, seconds):
+    """Frame start lateness (s) for every frame, plus the seqs seen."""
+    period = 1 / FPS
+    lateness = []
+    seqs = set()
+    next_at = time.perf_counter()
+    end = next_at + seconds
+    while next_at < end:
+        now = time.perf_counter()
+        if now < next_at:
+            time.sleep(next_at - now)
+        start = time.perf_counter()
+        lateness.append(start - next_at)
+        monitor._last_values = None
+        monitor.get_image()
+        seqs.add(monitor.sampler.snapshot.seq)
+        next_at += period
+    return lateness, seqs
+
+
+def report(label, lateness, seqs, extra=""):
+    print(f"{label:10s} lateness p50={percentile(lateness, 0.5) * 1e3:6.2f}ms  "
+          f"p99={percentile(lateness, 0.99) * 1e3:6.2f}ms  max={max(lateness) * 1e3:6.2f}ms  "
+          f"samples={len(seqs) - 1}{extra}")
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    reader_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    interval = float(sys.argv[3]) if len(sys.argv) > 3 else 0.25
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    monitor = HardwareMonitor(config)
+    monitor.sampler.stop()
+    print(f"{FPS} fps for {seconds:.0f}s, busy reader {reader_ms:.0f} ms every {interval}s")
+
+    monitor.sampler = SensorSampler(SyntheticSensorReader(reader_ms), interval=interval)
+    monitor.sampler.start()
+    lateness, seqs = render_loop(monitor, seconds)
+    monitor.sampler.stop()
+    report("in-process", lateness, seqs)
+
+    monitor.sampler = SensorCollector(READER_SPEC, [reader_ms], interval=interval)
+    monitor.sampler.start()
+    render_loop(monitor, 1.0)  # child açılışı ölçüme girmesin
+    lateness, seqs = render_loop(monitor, seconds)
+    monitor.sampler.stop()
+    report("isolated", lateness, seqs)
+
+    # Takılan sürücü: 3 okumadan sonra backend sonsuza dek bekler
+    collector = SensorCollector(READER_SPEC, [reader_ms, True, 3], interval=interval, stall_seconds=1.0)
+    monitor.sampler = collector
+    collector.start()
+    lateness, seqs = render_loop(monitor, seconds)
+    collector.stop()
+    report("hang", lateness, seqs, f"  watchdog restarts={collector.restarts}")
+
+    # Hemen çıkan child: geri çekilerek yeniden başlatılır, sonra vazgeçilir
+    # ve monitor in-process sampler'a döner
+    collector = SensorCollector("src.sensor_collector:MissingReader", interval=interval)
+    monitor.sampler = collector
+    monitor.isolated = True
+    collector.start()
+    start = time.perf_counter()
+    while monitor.sampler is collector and time.perf_counter() - start < 60:
+        monitor._touch()
+        time.sleep(0.1)
+    gave_up = time.perf_counter() - start
+    fallback = monitor.sampler
+    render_loop(monitor, 1.0)
+    fallback.stop()
+    print(f"crash      restarts={collector.restarts}  gave up={collector.failed} after {gave_up:.1f}s, "
+          f"fallback={type(fallback).__name__} samples={fallback.snapshot.seq}")
+    if not collector.failed or not isinstance(fallback, SensorSampler) or not fallback.snapshot.seq:
+        print("FAIL collector did not fall back to the in-process sampler")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+OLED Customizer - Binary sensor log write / read cost
+Simulates a day of samples (fake clock, 1 Hz by default) into a
+temporary directory:
+  - binary:  SensorLog.append (fixed-width records, one os.write per
+             second, size rotation)
+  - naive:   one CSV line per sample through a text file, flushed every
+             sample
+and reports append cost, write syscalls, bytes on disk and rotations,
+then the cost of mapping the log and computing stats over a 1 hour range.
+
+Usage:
+    python tools/benchmarks/sensor_log.py [samples] [max_mb] [hz]
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+
+from src.sensor_log import LOG_FIELDS, RECORD, SensorLog, open_log
+from src.sensor_sampler import EMPTY_SNAPSHOT
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def synthetic(i, t0):
+    load = 35 + 30 * math.sin(i / 40)
+    return EMPTY_SNAPSHOT._replace(seq=i + 1, taken=t0 + i, cpu_usage=load, cpu_temp=55 + load / 5,
+                                   gpu_load=load / 2, gpu_temp=48 + load / 8, ram_used=8.2e9, ram_total=3.2e10,
+                                   ram_percent=25.6, net_down=1.5e5 + i, net_up=2e4, disk_read=0.0, disk_write=4e5)
+
+
+def naive_append(file, snapshot):
+    file.write(",".join("" if v is None else f"{v:.6g}" for v in (snapshot.taken, *(getattr(snapshot, f) for f in LOG_FIELDS))) + "\n")
+    file.flush()
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 86400
+    max_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 8
+    hz = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+    t0 = time.time() - samples
+    snapshots = [synthetic(i, t0) for i in range(samples)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sensors.bin")
+        log = SensorLog(path, max_bytes=int(max_mb * 1024 * 1024))
+        clock = time.monotonic()
+        times = []
+        for i, snap in enumerate(snapshots):
+            start = time.perf_counter()
+            log.append(snap, now=clock + i / hz)  # sahte saat
+            times.append(time.perf_counter() - start)
+        log.close()
+        files = sorted(os.listdir(tmp))
+        on_disk = sum(os.path.getsize(os.path.join(tmp, name)) for name in files)
+        print(f"{samples} samples at {hz:g} Hz, record {RECORD.size} bytes ({len(LOG_FIELDS)} fields + time), max {max_mb} MB/file")
+        print(f"binary  append p50={percentile(times, 0.5) * 1e6:5.1f}us  p99={percentile(times, 0.99) * 1e6:5.1f}us  "
+              f"writes={log.writes} ({log.writes * hz / samples:.2f}/s)  rotations={log.rotations}  "
+              f"files={len(files)}  on disk={on_disk / 1e6:.2f} MB")
+
+        csv_path = os.path.join(tmp, "sensors.csv")
+        times = []
+        with open(csv_path, "w") as file:
+            for snap in snapshots:
+                start = time.perf_counter()
+                naive_append(file, snap)
+                times.append(time.perf_counter() - start)
+        print(f"csv     append p50={percentile(times, 0.5) * 1e6:5.1f}us  p99={percentile(times, 0.99) * 1e6:5.1f}us  "
+              f"writes={samples} ({hz:.2f}/s)  size={os.path.getsize(csv_path) / 1e6:.2f} MB (no rotation)")
+
+        start = time.perf_counter()
+        records = open_log(path)
+        taken = records["taken"]
+        lo, hi = np.searchsorted(taken, [taken[-1] - 3600, taken[-1]])
+        window = records[lo:hi]
+        stats = {field: (float(np.nanmin(window[field])), float(np.nanmax(window[field]))) for field in ("cpu_temp", "gpu_load")}
+        elapsed = time.perf_counter() - start
+        print(f"read    map {len(records)} records + 1 h range stats: {elapsed * 1e3:.2f} ms  {stats}")
+        del records, taken, window  # memmap Windows'ta dosyayı kilitler
+
+
+if __name__ == "__main__":
+    main()
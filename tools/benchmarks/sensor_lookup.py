@@ -0,0 +1,153 @@
+"""
+OLED Customizer - Per-frame sensor lookup cost
+Builds a fake LibreHardwareMonitor tree shaped like a desktop (Ryzen CPU,
+NVIDIA GPU, memory, motherboard with a SuperIO sub-hardware) and compares
+one HW-monitor frame:
+  - legacy: up to seven _get_lhm_sensor walks (string matching + Update()
+    of every matching node on each call)
+  - catalog: SensorCatalog.update() + indexed reads
+Update() burns a configurable time to stand in for the pythonnet call.
+
+Usage:
+    python tools/benchmarks/sensor_lookup.py [frames] [update_us]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.sensor_catalog import SensorCatalog
+
+
+class FakeSensor:
+    def __init__(self, sensor_type, name, value):
+        self.SensorType = sensor_type
+        self.Name = name
+        self.Value = value
+
+
+class FakeHardware:
+    updates = 0
+    update_cost = 0.0
+
+    def __init__(self, hardware_type, sensors, sub=()):
+        self.HardwareType = hardware_type
+        self.Sensors = sensors
+        self.SubHardware = list(sub)
+
+    def Update(self):
+        FakeHardware.updates += 1
+        end = time.perf_counter() + FakeHardware.update_cost
+        while time.perf_counter() < end:
+            pass
+
+
+class FakeComputer:
+    def __init__(self, hardware):
+        self.Hardware = hardware
+
+
+def build_tree():
+    cpu = [FakeSensor("Load", f"CPU Core #{i}", 10.0 + i) for i in range(1, 17)]
+    cpu += [FakeSensor("Clock", f"Core #{i}", 4200.0) for i in range(1, 17)]
+    cpu += [FakeSensor("Temperature", "Core (Tctl/Tdie)", 61.5), FakeSensor("Temperature", "CCD1 (Tdie)", 58.0),
+            FakeSensor("Power", "Package", 65.0), FakeSensor("Voltage", "Core (SVI2 TFN)", 1.2)]
+    gpu = [FakeSensor("Temperature", "GPU Core", 54.0), FakeSensor("Temperature", "GPU Hot Spot", 66.0),
+           FakeSensor("Load", "GPU Core", 37.0), FakeSensor("Load", "GPU Memory Controller", 12.0)]
+    gpu += [FakeSensor("Clock", f"GPU Clock {i}", 1800.0) for i in range(8)]
+    gpu += [FakeSensor("SmallData", f"GPU Memory {i}", 4096.0) for i in range(8)]
+    memory = [FakeSensor("Load", "Memory", 48.0), FakeSensor("Data", "Memory Used", 15.2),
+              FakeSensor("Data", "Memory Available", 16.8)]
+    superio = [FakeSensor("Temperature", f"Temperature #{i}", 35.0 + i) for i in range(6)]
+    superio += [FakeSensor("Fan", f"Fan #{i}", 900.0) for i in range(7)]
+    superio += [FakeSensor("Voltage", f"Voltage #{i}", 1.0) for i in range(15)]
+    board = FakeHardware("Motherboard", [], sub=[FakeHardware("SuperIO", superio)])
+    return FakeComputer([
+        FakeHardware("Cpu", cpu),
+        FakeHardware("GpuNvidia", gpu),
+        FakeHardware("Memory", memory),
+        board,
+    ])
+
+
+def legacy_get(computer, hw_type, sensor_type, name_contains=None):
+    """Old HardwareMonitor._get_lhm_sensor (without the lock)."""
+    for hw in computer.Hardware:
+        if hw_type.lower() not in str(hw.HardwareType).lower():
+            continue
+        hw.Update()
+        for sensor in hw.Sensors:
+            if sensor_type.lower() not in str(sensor.SensorType).lower():
+                continue
+            if name_contains and name_contains.lower() not in str(sensor.Name).lower():
+                continue
+            if sensor.Value is not None and sensor.Value > 0:
+                return float(sensor.Value)
+        for sub in hw.SubHardware:
+            sub.Update()
+            for sensor in sub.Sensors:
+                if sensor_type.lower() not in str(sensor.SensorType).lower():
+                    continue
+                if name_contains and name_contains.lower() not in str(sensor.Name).lower():
+                    continue
+                if sensor.Value is not None and sensor.Value > 0:
+                    return float(sensor.Value)
+    return None
+
+
+def legacy_frame(computer):
+    cpu_temp = legacy_get(computer, "Cpu", "Temperature", "Tctl")
+    if not cpu_temp:
+        cpu_temp = legacy_get(computer, "Cpu", "Temperature", "Package")
+    if not cpu_temp:
+        cpu_temp = legacy_get(computer, "Cpu", "Temperature", "Core")
+    gpu_temp = legacy_get(computer, "Gpu", "Temperature", "Core")
+    if not gpu_temp:
+        gpu_temp = legacy_get(computer, "Gpu", "Temperature", "GPU")
+    gpu_load = legacy_get(computer, "Gpu", "Load", "Core")
+    if not gpu_load:
+        gpu_load = legacy_get(computer, "Gpu", "Load", "GPU")
+    return cpu_temp, gpu_temp, gpu_load
+
+
+def catalog_frame(catalog):
+    catalog.update()
+    return catalog.read("cpu_temp"), catalog.read("gpu_temp"), catalog.read("gpu_load")
+
+
+def run(label, frames, fn, arg):
+    FakeHardware.updates = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        result = fn(arg)
+    elapsed = (time.perf_counter() - start) / frames
+    print(f"{label:8s} {elapsed * 1e6:8.1f} us/frame  updates/frame={FakeHardware.updates / frames:.1f}  -> {result}")
+    return elapsed
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    FakeHardware.update_cost = (float(sys.argv[2]) if len(sys.argv) > 2 else 0.0) / 1e6
+
+    computer = build_tree()
+    catalog = SensorCatalog(computer)
+    catalog.build()
+
+    print(f"{frames} frames, Update() cost {FakeHardware.update_cost * 1e6:.0f} us")
+    legacy = run("legacy", frames, legacy_frame, computer)
+
+    # Tctl olmayan bir CPU (Intel): zincirin sonuna kadar inilir
+    for sensor in computer.Hardware[0].Sensors:
+        if sensor.Name == "Core (Tctl/Tdie)":
+            sensor.Name = "CPU Package"
+    catalog.invalidate()
+    catalog.build()
+    indexed = run("catalog", frames, catalog_frame, catalog)
+    legacy_intel = run("legacy*", frames, legacy_frame, computer)
+    print(f"speedup {legacy / indexed:.1f}x (Ryzen), {legacy_intel / indexed:.1f}x (no Tctl: Package fallback)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+OLED Customizer - Hardware monitor sampling cost on the render thread
+Runs HardwareMonitor.get_image() at 10 fps for a few seconds with a fake
+hardware reader that takes a fixed time (standing in for LHM Update()
+calls), and compares against the legacy path that read sensors and
+redrew on every frame. Reports per frame render-thread time, reader calls
+per second and how many frames were actually redrawn.
+
+Usage:
+    python tools/benchmarks/sensor_sampler.py [seconds] [reader_ms]
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.HardwareMonitor import HardwareMonitor
+from src.sensor_sampler import SensorSampler, read_system
+
+FPS = 10
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    reader_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 8.0
+
+    calls = [0]
+
+    def fake_reader():
+        calls[0] += 1
+        time.sleep(reader_ms / 1000)
+        return {"cpu_temp": 61.0, "gpu_temp": 54.0, "gpu_load": 37.0}
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    monitor = HardwareMonitor(config)
+    monitor.sampler.stop()
+
+    # Eski yol: her karede sensör okuma + yeniden çizim
+    legacy_times = []
+    calls[0] = 0
+    frames = int(seconds * FPS)
+    for _ in range(frames):
+        start = time.perf_counter()
+        fake_reader()
+        read_system()
+        monitor._last_values = None
+        monitor.get_image()
+        legacy_times.append(time.perf_counter() - start)
+        time.sleep(max(0.0, 1 / FPS - legacy_times[-1]))
+    legacy_calls = calls[0]
+
+    monitor.sampler = SensorSampler(fake_reader, interval=1.0)
+    monitor.sampler.start()
+    monitor._last_values = None
+    calls[0] = 0
+    times = []
+    redraws = 0
+    last = None
+    for _ in range(frames):
+        start = time.perf_counter()
+        image = monitor.get_image()
+        times.append(time.perf_counter() - start)
+        if image is not last:
+            redraws += 1
+            last = image
+        time.sleep(1 / FPS)
+    monitor.sampler.stop()
+
+    print(f"{frames} frames at {FPS} fps, reader {reader_ms:.0f} ms")
+    print(f"legacy   render thread p50={percentile(legacy_times, 0.5) * 1e3:6.2f}ms  "
+          f"max={max(legacy_times) * 1e3:6.2f}ms  reader calls/s={legacy_calls / seconds:.1f}  redraws={frames}")
+    print(f"sampler  render thread p50={percentile(times, 0.5) * 1e3:6.2f}ms  "
+          f"max={max(times) * 1e3:6.2f}ms  reader calls/s={calls[0] / seconds:.1f}  redraws={redraws}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+OLED Customizer - Spectrum analyzer cost
+Measures the per-hop cost of SpectrumAnalyzer (ring buffer push + Hann
+window + rfft + log binning + peak decay) for a few FFT sizes and bar
+counts, and what the render loop pays per frame (reading the snapshot and
+drawing the bars). Then runs the analyzer thread on a generated signal for
+a few seconds and prints the hop rate and a level trace.
+
+Usage:
+    python tools/benchmarks/spectrum_cost.py [wav_file]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.audio_spectrum import SpectrumAnalyzer, SignalSource, WavFileSource
+
+FPS = 10
+
+
+def hop_cost(fft_size, bars, hop, repeat=2000):
+    source = SignalSource()
+    analyzer = SpectrumAnalyzer(source, bars=bars, fft_size=fft_size, hop=hop)
+    source.open()
+    source._pace = lambda frames: None
+    blocks = [source.read(hop) for _ in range(64)]
+    start = time.perf_counter()
+    for i in range(repeat):
+        analyzer.push(blocks[i % 64])
+        analyzer.analyze()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def render_cost(analyzer, repeat=5000):
+    image = Image.new("1", (128, 40))
+    draw = ImageDraw.Draw(image)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        levels = analyzer.levels
+        for i, level in enumerate(levels[:4]):
+            h = 1 + int(level * 17)
+            x = 100 + i * 6
+            draw.rectangle((x, 18 - h, x + 4, 18), fill=1)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    for fft_size, bars, hop in ((512, 4, 256), (1024, 4, 512), (2048, 4, 1024), (1024, 8, 512), (2048, 16, 512)):
+        us = hop_cost(fft_size, bars, hop)
+        hops_per_s = 48000 / hop
+        print(f"fft={fft_size:5d} bars={bars:2d} hop={hop:4d}: {us:6.1f}us/hop, "
+              f"{hops_per_s:5.1f} hops/s -> {us * hops_per_s / 1e4:5.2f}% of one core")
+
+    source = WavFileSource(sys.argv[1]) if len(sys.argv) > 1 else SignalSource()
+    analyzer = SpectrumAnalyzer(source)
+    print(f"render loop: {render_cost(analyzer):5.1f}us/frame to read levels and draw 4 bars")
+
+    analyzer.start()
+    deadline = time.perf_counter() + 3
+    trace = []
+    while time.perf_counter() < deadline:
+        analyzer.touch()
+        trace.append((analyzer.seq, analyzer.levels))
+        time.sleep(1 / FPS)
+    analyzer.stop()
+    seconds = 3
+    print(f"live: {trace[-1][0]} hops in {seconds}s ({trace[-1][0] / seconds:.1f}/s)")
+    for seq, levels in trace[::5]:
+        bars = " ".join("#" * int(level * 10) + "." * (10 - int(level * 10)) for level in levels)
+        print(f"  seq={seq:4d} {bars}")
+
+
+if __name__ == "__main__":
+    main()
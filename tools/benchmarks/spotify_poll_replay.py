@@ -0,0 +1,195 @@
+"""
+OLED Customizer - Spotify poll replay benchmark
+Replays a playback session against the fixed-interval poller and the
+track-boundary scheduler (alone, and with an SMTC track-change hint arriving
+`--hint-delay` ms after each change), and reports title-change latency and
+request count.
+
+Session file (JSON list, one entry per track):
+    [{"title": "...", "artist": "...", "duration_ms": 215000,
+      "played_ms": 215000,            # optional, < duration_ms for a skip
+      "seeks": [[60000, 120000]],     # optional, [at_played_ms, to_position_ms]
+      "pauses": [[30000, 8000]]}]     # optional, [at_played_ms, pause_length_ms]
+
+Usage:
+    python tools/benchmarks/spotify_poll_replay.py [session.json] [--delay 2]
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.spotify_scheduler import SpotifyPollScheduler
+
+
+def synthetic_session(tracks=40, seed=7):
+    rnd = random.Random(seed)
+    session = []
+    for i in range(tracks):
+        duration = rnd.randint(140_000, 300_000)
+        entry = {"title": f"Track {i}", "artist": "Artist", "duration_ms": duration}
+        roll = rnd.random()
+        if roll < 0.15:
+            entry["played_ms"] = rnd.randint(5_000, duration - 5_000)  # skip
+        elif roll < 0.25:
+            at = rnd.randint(10, duration // 2000) * 1000
+            entry["seeks"] = [[at, min(duration - 5000, at + rnd.randint(20, 60) * 1000)]]
+        elif roll < 0.30:
+            entry["pauses"] = [[rnd.randint(10, 60) * 1000, rnd.randint(3, 30) * 1000]]
+        session.append(entry)
+    return session
+
+
+def build_timeline(session):
+    """Expand a session into (start_ms, end_ms, title, artist, start_pos, duration, paused) segments."""
+    segments = []
+    t = 0
+    for track in session:
+        duration = int(track["duration_ms"])
+        played = int(track.get("played_ms", duration))
+        events = [(at, "seek", to) for at, to in track.get("seeks", [])]
+        events += [(at, "pause", length) for at, length in track.get("pauses", [])]
+        events.sort()
+
+        position = 0
+        elapsed = 0
+        for at, kind, value in events + [(played, "end", 0)]:
+            run = max(0, min(at, played) - elapsed)
+            if position + run > duration:
+                run = duration - position
+            if run > 0:
+                segments.append((t, t + run, track["title"], track.get("artist", ""), position, duration, False))
+                t += run
+                position += run
+                elapsed += run
+            if kind == "seek":
+                position = max(0, min(int(value), duration))
+            elif kind == "pause":
+                segments.append((t, t + int(value), track["title"], track.get("artist", ""), position, duration, True))
+                t += int(value)
+            elif kind == "end":
+                break
+    return segments
+
+
+def truth_at(segments, now_ms, cursor):
+    while cursor < len(segments) and segments[cursor][1] <= now_ms:
+        cursor += 1
+    if cursor >= len(segments):
+        return None, cursor
+    start, _, title, artist, pos, duration, paused = segments[cursor]
+    progress = pos if paused else pos + (now_ms - start)
+    return {
+        "title": title,
+        "artist": artist,
+        "progress": progress,
+        "duration": duration,
+        "paused": paused,
+    }, cursor
+
+
+def change_points(segments):
+    points = []
+    last = None
+    for start, _, title, artist, *_ in segments:
+        if (title, artist) != last:
+            points.append((start, (title, artist)))
+            last = (title, artist)
+    return points[1:]
+
+
+def replay(segments, policy, tick_ms=10, hint_delay_ms=None):
+    end_ms = segments[-1][1]
+    changes = change_points(segments)
+    hints = [at + hint_delay_ms for at, _ in changes] if hint_delay_ms is not None else []
+    hint_index = 0
+    seen_at = {}
+    requests = 0
+    cursor = 0
+    shown = None
+
+    now = 0
+    while now < end_ms:
+        while hint_index < len(hints) and hints[hint_index] <= now:
+            policy.hint(now)
+            hint_index += 1
+        if policy.is_due(now):
+            policy.mark_polled(now)
+            requests += 1
+            data, cursor = truth_at(segments, now, cursor)
+            policy.observe(data, now)
+            if data:
+                key = (data["title"], data["artist"])
+                if key != shown:
+                    shown = key
+                    seen_at.setdefault(key, now)
+        now += tick_ms
+
+    latencies = [seen_at[key] - at for at, key in changes if key in seen_at]
+    return requests, latencies
+
+
+class FixedPoller:
+    def __init__(self, interval_ms):
+        self.interval_ms = interval_ms
+        self._next = 0
+
+    def is_due(self, now_ms):
+        return now_ms >= self._next
+
+    def mark_polled(self, now_ms):
+        self._next = now_ms + self.interval_ms
+
+    def observe(self, song_data, now_ms):
+        pass
+
+
+def report(name, requests, latencies, hours):
+    latencies = sorted(latencies)
+    if not latencies:
+        print(f"{name:<12} requests={requests}")
+        return
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{name:<12} requests={requests:<6} req/h={requests / hours:<8.0f} "
+        f"latency avg={sum(latencies) / len(latencies):.0f}ms p50={p50}ms p95={p95}ms max={latencies[-1]}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("session", nargs="?", help="recorded session JSON (default: synthetic)")
+    parser.add_argument("--delay", type=float, default=2, help="spotify_fetch_delay in seconds")
+    parser.add_argument("--midtrack", type=float, default=15, help="spotify_midtrack_delay in seconds")
+    parser.add_argument("--hint-delay", type=int, default=200, help="SMTC track-change hint delay in ms")
+    args = parser.parse_args()
+
+    if args.session:
+        with open(args.session, "r", encoding="utf-8") as f:
+            session = json.load(f)
+    else:
+        session = synthetic_session()
+
+    segments = build_timeline(session)
+    hours = segments[-1][1] / 3_600_000
+    base_ms = max(250, int(args.delay * 1000))
+
+    print(f"{len(session)} tracks, {hours * 60:.1f} min of playback")
+    report("fixed", *replay(segments, FixedPoller(base_ms)), hours)
+
+    scheduler = SpotifyPollScheduler()
+    scheduler.configure(base_interval_ms=base_ms, midtrack_interval_ms=int(args.midtrack * 1000))
+    report("predictive", *replay(segments, scheduler), hours)
+
+    scheduler = SpotifyPollScheduler()
+    scheduler.configure(base_interval_ms=base_ms, midtrack_interval_ms=int(args.midtrack * 1000))
+    report("pred+hint", *replay(segments, scheduler, hint_delay_ms=args.hint_delay), hours)
+
+
+if __name__ == "__main__":
+    main()
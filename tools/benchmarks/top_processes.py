@@ -0,0 +1,85 @@
+"""
+OLED Customizer - Top-processes sampling cost
+Spawns a few hundred idle child processes (plus one busy loop) and times
+one "top 3 by CPU" sample:
+  - naive:        psutil.process_iter(['name', 'cpu_percent', 'memory_info'])
+                  + heapq.nlargest, as a fresh scan every sample
+  - incremental:  TopProcesses.sample() (Process objects kept between
+                  samples, PID rescan every few seconds, name / memory
+                  read only for the top K)
+Both must agree on the busiest process.
+
+Usage:
+    python tools/benchmarks/top_processes.py [samples] [children]
+"""
+
+import heapq
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import psutil
+
+from src.top_processes import TopProcesses
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def naive_top(k=3):
+    rows = []
+    for proc in psutil.process_iter(["name", "cpu_percent", "memory_info"]):
+        info = proc.info
+        if info["cpu_percent"] is None or info["memory_info"] is None:
+            continue
+        rows.append((info["cpu_percent"], proc.pid, info["name"], info["memory_info"].rss))
+    return heapq.nlargest(k, rows)
+
+
+def timed(fn, samples, spacing):
+    times = []
+    for _ in range(samples):
+        time.sleep(spacing)
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    children = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    spacing = 0.05
+
+    sleepers = [subprocess.Popen(["sleep", "600"]) for _ in range(children)]
+    busy = subprocess.Popen([sys.executable, "-c", "while True: pass"])
+    try:
+        time.sleep(0.5)
+        naive_top()  # cpu_percent referansı (process_iter önbelleği)
+        top = TopProcesses(k=3, rescan_seconds=5.0)
+        top.sample()
+
+        print(f"{len(psutil.pids())} processes, {samples} samples {spacing * 1e3:.0f} ms apart")
+        naive, naive_rows = timed(naive_top, samples, spacing)
+        incremental, rows = timed(top.sample, samples, spacing)
+        assert naive_rows[0][1] == busy.pid and rows[0].pid == busy.pid, (naive_rows, rows)
+
+        for label, times in (("naive", naive), ("incremental", incremental)):
+            print(f"{label:12s} p50={percentile(times, 0.5) * 1e3:6.2f}ms  p99={percentile(times, 0.99) * 1e3:6.2f}ms")
+        print(f"tracked {len(top)} processes, {top.scans} PID scans")
+        print("top:", ", ".join(f"{r.name} {r.cpu:.0f}%" for r in rows))
+    finally:
+        busy.kill()
+        for proc in sleepers:
+            proc.kill()
+        for proc in (busy, *sleepers):
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
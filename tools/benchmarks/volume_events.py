@@ -0,0 +1,99 @@
+"""
+OLED Customizer - Volume overlay event latency
+Drives a VolumeOverlay through FakeAudioBackend (changes are emitted from a
+separate thread, like the COM callback worker) while a simulated render
+loop waits on the wake event the way DisplayManager does. Reports:
+  - change -> overlay state applied (render woken + update() drained)
+  - endpoint calls per second on an idle loop (polling vs events)
+
+Usage:
+    python tools/benchmarks/volume_events.py [changes]
+"""
+
+import os
+import sys
+import time
+import threading
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.audio_backend import FakeAudioBackend
+from src.volume import VolumeOverlay
+
+FPS = 10
+LEGACY_CALLS_PER_TICK = 3   # GetMasterVolumeLevelScalar + GetMute + mic GetMute
+
+
+class CountingBackend(FakeAudioBackend):
+    """Counts getter calls, so the idle cost of the event path is measured, not assumed."""
+    calls = 0
+
+    def get_mic_mute(self):
+        CountingBackend.calls += 1
+        return super().get_mic_mute()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    changes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    config = SimpleNamespace(width=128, height=40, primary=255, secondary=0)
+    wake = threading.Event()
+    backend = CountingBackend(threaded=True)
+    overlay = VolumeOverlay(config, backend=backend, on_change=wake.set)
+
+    applied_at = []
+    ticks = [0]
+    running = True
+
+    def render_loop():
+        while running:
+            ticks[0] += 1
+            if overlay.update():
+                applied_at.append(time.perf_counter())
+            wake.wait(1 / FPS)
+            wake.clear()
+
+    loop = threading.Thread(target=render_loop, daemon=True)
+    loop.start()
+    time.sleep(0.3)
+
+    latencies = []
+    for i in range(1, changes + 1):
+        time.sleep(0.02 + (i % 7) * 0.003)  # değişiklikler kare sınırına hizalı olmasın
+        applied_at.clear()
+        sent = time.perf_counter()
+        backend.set_volume((backend.volume + 7) % 101)
+        deadline = sent + 0.5
+        while not applied_at and time.perf_counter() < deadline:
+            time.sleep(0.0005)
+        if applied_at:
+            latencies.append(applied_at[0] - sent)
+
+    # Boşta: hiçbir değişiklik yokken backend'e kaç çağrı gidiyor?
+    CountingBackend.calls = 0
+    idle_start_ticks = ticks[0]
+    idle_seconds = 2.0
+    time.sleep(idle_seconds)
+    idle_ticks = ticks[0] - idle_start_ticks
+
+    running = False
+    overlay.close()
+
+    print(f"{changes} volume changes, events applied={overlay.events_applied}")
+    if latencies:
+        print(f"event path   p50={percentile(latencies, 0.5) * 1e3:7.2f}ms  p99={percentile(latencies, 0.99) * 1e3:7.2f}ms"
+              f"  missed={changes - len(latencies)}")
+    legacy_avg = 1000 / FPS / 2
+    print(f"legacy poll  avg={legacy_avg:7.2f}ms  max={1000 / FPS:7.2f}ms  ({FPS} fps loop)")
+    print(f"idle calls/s event={CountingBackend.calls / idle_seconds:.1f}  "
+          f"legacy={LEGACY_CALLS_PER_TICK * FPS:.1f}  (loop ticks/s={idle_ticks / idle_seconds:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+OLED Customizer - Sensor log reader
+Reads the binary sensor log (Settings > Advanced > Sensor Log) without
+loading it: each file is memory-mapped and the time range is found with a
+binary search on the record timestamps. Prints summary stats per metric,
+or writes the range as CSV.
+
+Usage:
+    python tools/sensor_log.py [files...] [--from T] [--to T] [--fields a,b] [--csv [-o out.csv]]
+
+    files   default: %APPDATA%/OLED Customizer/sensor_logs/sensors.bin and
+            its rotated copies, oldest first
+    T       "2026-10-19 14:05", epoch seconds, or relative to the last
+            record: --from=-30m, --from=-2h, --to=-90s
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from src.sensor_log import open_log
+
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def default_files():
+    base = os.path.join(os.environ.get("APPDATA", ""), "OLED Customizer", "sensor_logs", "sensors.bin")
+    rotated = [p for p in glob.glob(base + ".*") if p.rsplit(".", 1)[1].isdigit()]
+    rotated.sort(key=lambda p: int(p.rsplit(".", 1)[1]), reverse=True)  # .3 en eski
+    return [p for p in (*rotated, base) if os.path.exists(p)]
+
+
+def parse_time(text, last):
+    if text is None:
+        return None
+    if text[0] == "-" and text[-1] in UNITS:
+        return last - float(text[1:-1]) * UNITS[text[-1]]
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text).timestamp()
+
+
+def select(records, start, end):
+    """Records with start <= taken < end (None: open), by binary search."""
+    taken = records["taken"]
+    lo = 0 if start is None else int(np.searchsorted(taken, start, side="left"))
+    hi = len(records) if end is None else int(np.searchsorted(taken, end, side="left"))
+    return records[lo:hi]
+
+
+def print_stats(parts, fields):
+    count = sum(len(part) for part in parts)
+    if not count:
+        print("no records in range")
+        return
+    first = next(part for part in parts if len(part))["taken"][0]
+    last = next(part for part in reversed(parts) if len(part))["taken"][-1]
+    print(f"{count} records  {datetime.fromtimestamp(first):%Y-%m-%d %H:%M:%S} -> "
+          f"{datetime.fromtimestamp(last):%Y-%m-%d %H:%M:%S}  ({(last - first) / 60:.1f} min)")
+    print(f"{'metric':12s} {'samples':>8s} {'min':>10s} {'mean':>10s} {'p95':>10s} {'max':>10s}")
+    for field in fields:
+        values = np.concatenate([part[field] for part in parts]).astype(np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            print(f"{field:12s} {0:8d} {'--':>10s} {'--':>10s} {'--':>10s} {'--':>10s}")
+            continue
+        stats = (values.min(), values.mean(), np.percentile(values, 95), values.max())
+        print(f"{field:12s} {len(values):8d} " + " ".join(f"{v:10.1f}" if abs(v) < 1e6 else f"{v:10.3g}" for v in stats))
+
+
+def write_csv(parts, fields, out):
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["time", *fields])
+    for part in parts:
+        columns = [part[field] for field in fields]
+        for i, taken in enumerate(part["taken"]):
+            row = [datetime.fromtimestamp(taken).isoformat(timespec="seconds")]
+            for column in columns:
+                value = float(column[i])
+                row.append("" if value != value else f"{value:.6g}")
+            writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read the OLED Customizer sensor log")
+    parser.add_argument("files", nargs="*", help="log files, oldest first")
+    parser.add_argument("--from", dest="start")
+    parser.add_argument("--to", dest="end")
+    parser.add_argument("--fields", help="comma separated metrics (default: all)")
+    parser.add_argument("--csv", action="store_true", help="write records as CSV instead of stats")
+    parser.add_argument("-o", "--output", help="CSV file (default: stdout)")
+    args = parser.parse_args()
+
+    files = args.files or default_files()
+    if not files:
+        parser.error("no sensor log found; pass the file path")
+    logs = [open_log(path) for path in files]
+    available = logs[0].dtype.names[1:]
+    fields = args.fields.split(",") if args.fields else list(available)
+    unknown = [field for field in fields if any(field not in log.dtype.names for log in logs)]
+    if unknown:
+        parser.error(f"unknown metric(s): {', '.join(unknown)}; available: {', '.join(available)}")
+
+    last = max((float(log["taken"][-1]) for log in logs if len(log)), default=0.0)
+    start, end = parse_time(args.start, last), parse_time(args.end, last)
+    parts = [select(log, start, end) for log in logs]
+
+    if args.csv:
+        if args.output:
+            with open(args.output, "w", newline="", encoding="utf-8") as out:
+                write_csv(parts, fields, out)
+        else:
+            write_csv(parts, fields, sys.stdout)
+    else:
+        print_stats(parts, fields)
+
+
+if __name__ == "__main__":
+    main()